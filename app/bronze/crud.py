@@ -4,9 +4,10 @@ from .models import HRDemographics, HRTenure, HRSafetyWorkdata, HRTraining, HRPa
 from app.crud.base import get_one, get_many, get_many_filtered, get_all
 from app.utils.formatting_id import generate_single_pkey_id, generate_bulk_pkey_ids
 from app.utils.gen_help_id import generate_pkey_id, generate_bulk_id
+from app.utils.pg_copy import COPY_THRESHOLD, copy_rows
 from sqlalchemy import text, desc
 from sqlalchemy.sql import text
-from sqlalchemy import func
+from sqlalchemy import func, insert
 from datetime import datetime, timedelta
 from app.public.models import RecordStatus
 from pandas import isna
@@ -237,36 +238,37 @@ def bulk_upload_csr_activity(db: Session, rows: list[dict]) -> int:
         for (original_index, _), generated_id in zip(row_list, ids):
             id_mapping[original_index] = generated_id
 
-    # Build CSR records and CheckerStatus logs
+    # Build CSR rows and CheckerStatus logs as plain dicts for a single executemany
     base_timestamp = datetime.now()
     for i, row in enumerate(rows):
         csr_id = id_mapping[i]
 
         # Create CSR record
-        record = CSRActivity(
-            csr_id=csr_id,
-            company_id=row["company_id"],
-            project_id=row["project_id"],
-            project_year=row["project_year"],
-            csr_report=row["csr_report"],
-            project_expenses=row["project_expenses"],
-            project_remarks=row["project_remarks"],
-        )
-        records.append(record)
+        records.append({
+            "csr_id": csr_id,
+            "company_id": row["company_id"],
+            "project_id": row["project_id"],
+            "project_year": row["project_year"],
+            "csr_report": row["csr_report"],
+            "project_expenses": row["project_expenses"],
+            "project_remarks": row["project_remarks"],
+        })
 
-        # Create checker_status_log model instance
+        # Create checker_status_log row
         status_time = base_timestamp + timedelta(hours=i + 1)
-        checker_log = RecordStatus(
-            cs_id=f"CS-{csr_id}",
-            record_id=csr_id,
-            status_id="URS",
-            status_timestamp=status_time,
-            remarks="real-data inserted"
-        )
-        checker_log_objects.append(checker_log)
+        checker_log_objects.append({
+            "cs_id": f"CS-{csr_id}",
+            "record_id": csr_id,
+            "status_id": "URS",
+            "status_timestamp": status_time,
+            "remarks": "real-data inserted",
+        })
 
-    # Insert records into EnviWaterAbstraction
-    db.bulk_save_objects(records)
+    # Insert all CSR records in one round-trip; very large batches go through COPY
+    if len(records) > COPY_THRESHOLD:
+        copy_rows(db, CSRActivity.__table__, records)
+    else:
+        db.execute(insert(CSRActivity.__table__), records)
     db.commit()
 
     """
@@ -282,9 +284,9 @@ def bulk_upload_csr_activity(db: Session, rows: list[dict]) -> int:
         print(f"Error executing stored procedure: {e}")
         db.rollback()
 
-    # Insert checker_status_log using ORM model
+    # Insert checker_status_log rows in one round-trip
     try:
-        db.bulk_save_objects(checker_log_objects)
+        db.execute(insert(RecordStatus.__table__), checker_log_objects)
         db.commit()
         print("Checker status logs inserted.")
     except Exception as e:
@@ -886,30 +888,31 @@ def bulk_create_water_abstractions(db: Session, rows: list[dict]) -> int:
         wa_id = id_mapping[i]
 
         # Create abstraction record
-        record = EnviWaterAbstraction(
-            wa_id=wa_id,
-            company_id=row["company_id"],
-            year=row["year"],
-            month=row["month"],
-            quarter=row["quarter"],
-            volume=row["volume"],
-            unit_of_measurement=row["unit_of_measurement"],
-        )
-        records.append(record)
+        records.append({
+            "wa_id": wa_id,
+            "company_id": row["company_id"],
+            "year": row["year"],
+            "month": row["month"],
+            "quarter": row["quarter"],
+            "volume": row["volume"],
+            "unit_of_measurement": row["unit_of_measurement"],
+        })
 
-        # Create checker_status_log model instance
+        # Create checker_status_log row
         status_time = base_timestamp + timedelta(hours=i + 1)
-        checker_log = RecordStatus(
-            cs_id=f"CS-{wa_id}",
-            record_id=wa_id,
-            status_id="URS",
-            status_timestamp=status_time,
-            remarks="real-data inserted"
-        )
-        checker_log_objects.append(checker_log)
+        checker_log_objects.append({
+            "cs_id": f"CS-{wa_id}",
+            "record_id": wa_id,
+            "status_id": "URS",
+            "status_timestamp": status_time,
+            "remarks": "real-data inserted",
+        })
 
-    # Insert records into EnviWaterAbstraction
-    db.bulk_save_objects(records)
+    # Insert all records in one round-trip; very large batches go through COPY
+    if len(records) > COPY_THRESHOLD:
+        copy_rows(db, EnviWaterAbstraction.__table__, records)
+    else:
+        db.execute(insert(EnviWaterAbstraction.__table__), records)
     db.commit()
 
     """
@@ -937,9 +940,9 @@ def bulk_create_water_abstractions(db: Session, rows: list[dict]) -> int:
         print(f"Error executing stored procedure: {e}")
         db.rollback()
 
-    # Insert checker_status_log using ORM model
+    # Insert checker_status_log rows in one round-trip
     try:
-        db.bulk_save_objects(checker_log_objects)
+        db.execute(insert(RecordStatus.__table__), checker_log_objects)
         db.commit()
         print("Checker status logs inserted.")
     except Exception as e:
@@ -985,29 +988,30 @@ def bulk_create_water_discharge(db: Session, rows: list[dict]) -> int:
         wd_id = id_mapping[i]
         
         # Create discharge record
-        record = EnviWaterDischarge(
-            wd_id=wd_id,
-            company_id=row["company_id"],
-            year=row["year"],
-            quarter=row["quarter"],
-            volume=row["volume"],
-            unit_of_measurement=row["unit_of_measurement"],
-        )
-        records.append(record)
+        records.append({
+            "wd_id": wd_id,
+            "company_id": row["company_id"],
+            "year": row["year"],
+            "quarter": row["quarter"],
+            "volume": row["volume"],
+            "unit_of_measurement": row["unit_of_measurement"],
+        })
         
         # Create CheckerStatus record
         status_time = base_timestamp + timedelta(hours=i + 1)
-        checker_log = RecordStatus(
-            cs_id=f"CS-{wd_id}",
-            record_id=wd_id,
-            status_id="URS",
-            status_timestamp=status_time,
-            remarks="real-data inserted"
-        )
-        checker_logs.append(checker_log)
+        checker_logs.append({
+            "cs_id": f"CS-{wd_id}",
+            "record_id": wd_id,
+            "status_id": "URS",
+            "status_timestamp": status_time,
+            "remarks": "real-data inserted",
+        })
     
-    # Insert records
-    db.bulk_save_objects(records)
+    # Insert all records in one round-trip; very large batches go through COPY
+    if len(records) > COPY_THRESHOLD:
+        copy_rows(db, EnviWaterDischarge.__table__, records)
+    else:
+        db.execute(insert(EnviWaterDischarge.__table__), records)
     db.commit()
 
     """
@@ -1037,9 +1041,9 @@ def bulk_create_water_discharge(db: Session, rows: list[dict]) -> int:
         print(f"Error executing stored procedure: {e}")
         db.rollback()
     
-    # Insert checker_status_log entries using CheckerStatus model
+    # Insert checker_status_log rows in one round-trip
     try:
-        db.bulk_save_objects(checker_logs)
+        db.execute(insert(RecordStatus.__table__), checker_logs)
         db.commit()
         print("Checker status logs inserted.")
     except Exception as e:
@@ -1085,29 +1089,30 @@ def bulk_create_water_consumption(db: Session, rows: list[dict]) -> int:
         wc_id = id_mapping[i]
         
         # Create consumption record
-        record = EnviWaterConsumption(
-            wc_id=wc_id,
-            company_id=row["company_id"],
-            year=row["year"],
-            quarter=row["quarter"],
-            volume=row["volume"],
-            unit_of_measurement=row["unit_of_measurement"],
-        )
-        records.append(record)
+        records.append({
+            "wc_id": wc_id,
+            "company_id": row["company_id"],
+            "year": row["year"],
+            "quarter": row["quarter"],
+            "volume": row["volume"],
+            "unit_of_measurement": row["unit_of_measurement"],
+        })
         
         # Create CheckerStatus record
         status_time = base_timestamp + timedelta(hours=i + 1)
-        checker_log = RecordStatus(
-            cs_id=f"CS-{wc_id}",
-            record_id=wc_id,
-            status_id="URS",
-            status_timestamp=status_time,
-            remarks="real-data inserted"
-        )
-        checker_logs.append(checker_log)
+        checker_logs.append({
+            "cs_id": f"CS-{wc_id}",
+            "record_id": wc_id,
+            "status_id": "URS",
+            "status_timestamp": status_time,
+            "remarks": "real-data inserted",
+        })
     
-    # Insert records
-    db.bulk_save_objects(records)
+    # Insert all records in one round-trip; very large batches go through COPY
+    if len(records) > COPY_THRESHOLD:
+        copy_rows(db, EnviWaterConsumption.__table__, records)
+    else:
+        db.execute(insert(EnviWaterConsumption.__table__), records)
     db.commit()
 
     """
@@ -1137,9 +1142,9 @@ def bulk_create_water_consumption(db: Session, rows: list[dict]) -> int:
         print(f"Error executing stored procedure: {e}")
         db.rollback()
         
-    # Insert checker_status_log entries using CheckerStatus model
+    # Insert checker_status_log rows in one round-trip
     try:
-        db.bulk_save_objects(checker_logs)
+        db.execute(insert(RecordStatus.__table__), checker_logs)
         db.commit()
         print("Checker status logs inserted.")
     except Exception as e:
@@ -1185,30 +1190,31 @@ def bulk_create_electric_consumption(db: Session, rows: list[dict]) -> int:
         ec_id = id_mapping[i]
         
         # Create electric consumption record
-        record = EnviElectricConsumption(
-            ec_id=ec_id,
-            company_id=row["company_id"],
-            source=row["source"],
-            unit_of_measurement=row["unit_of_measurement"],
-            consumption=row["consumption"],
-            quarter=row["quarter"],
-            year=row["year"]            
-        )
-        records.append(record)
+        records.append({
+            "ec_id": ec_id,
+            "company_id": row["company_id"],
+            "source": row["source"],
+            "unit_of_measurement": row["unit_of_measurement"],
+            "consumption": row["consumption"],
+            "quarter": row["quarter"],
+            "year": row["year"],
+        })
         
         # Create CheckerStatus record
         status_time = base_timestamp + timedelta(hours=i + 1)
-        checker_log = RecordStatus(
-            cs_id=f"CS-{ec_id}",
-            record_id=ec_id,
-            status_id="URS",
-            status_timestamp=status_time,
-            remarks="real-data inserted"
-        )
-        checker_logs.append(checker_log)
+        checker_logs.append({
+            "cs_id": f"CS-{ec_id}",
+            "record_id": ec_id,
+            "status_id": "URS",
+            "status_timestamp": status_time,
+            "remarks": "real-data inserted",
+        })
     
-    # Insert records
-    db.bulk_save_objects(records)
+    # Insert all records in one round-trip; very large batches go through COPY
+    if len(records) > COPY_THRESHOLD:
+        copy_rows(db, EnviElectricConsumption.__table__, records)
+    else:
+        db.execute(insert(EnviElectricConsumption.__table__), records)
     db.commit()
 
     """
@@ -1238,9 +1244,9 @@ def bulk_create_electric_consumption(db: Session, rows: list[dict]) -> int:
         print(f"Error executing stored procedure: {e}")
         db.rollback()
         
-    # Insert checker_status_log entries using CheckerStatus model
+    # Insert checker_status_log rows in one round-trip
     try:
-        db.bulk_save_objects(checker_logs)
+        db.execute(insert(RecordStatus.__table__), checker_logs)
         db.commit()
         print("Checker status logs inserted.")
     except Exception as e:
@@ -1286,31 +1292,32 @@ def bulk_create_non_hazard_waste(db: Session, rows: list[dict]) -> int:
         nhw_id = id_mapping[i]
         
         # Create non-hazard waste record
-        record = EnviNonHazardWaste(
-            nhw_id=nhw_id,
-            company_id=row["company_id"],
-            metrics=row["metrics"],
-            unit_of_measurement=row["unit_of_measurement"],
-            waste=row["waste"],
-            month=row["month"],
-            quarter=row["quarter"],
-            year=row["year"]            
-        )
-        records.append(record)
+        records.append({
+            "nhw_id": nhw_id,
+            "company_id": row["company_id"],
+            "metrics": row["metrics"],
+            "unit_of_measurement": row["unit_of_measurement"],
+            "waste": row["waste"],
+            "month": row["month"],
+            "quarter": row["quarter"],
+            "year": row["year"],
+        })
         
         # Create CheckerStatus record
         status_time = base_timestamp + timedelta(hours=i + 1)
-        checker_log = RecordStatus(
-            cs_id=f"CS-{nhw_id}",
-            record_id=nhw_id,
-            status_id="URS",
-            status_timestamp=status_time,
-            remarks="real-data inserted"
-        )
-        checker_logs.append(checker_log)
+        checker_logs.append({
+            "cs_id": f"CS-{nhw_id}",
+            "record_id": nhw_id,
+            "status_id": "URS",
+            "status_timestamp": status_time,
+            "remarks": "real-data inserted",
+        })
     
-    # Insert records
-    db.bulk_save_objects(records)
+    # Insert all records in one round-trip; very large batches go through COPY
+    if len(records) > COPY_THRESHOLD:
+        copy_rows(db, EnviNonHazardWaste.__table__, records)
+    else:
+        db.execute(insert(EnviNonHazardWaste.__table__), records)
     db.commit()
 
     """
@@ -1340,9 +1347,9 @@ def bulk_create_non_hazard_waste(db: Session, rows: list[dict]) -> int:
         print(f"Error executing stored procedure: {e}")
         db.rollback()
         
-    # Insert checker_status_log entries using CheckerStatus model
+    # Insert checker_status_log rows in one round-trip
     try:
-        db.bulk_save_objects(checker_logs)
+        db.execute(insert(RecordStatus.__table__), checker_logs)
         db.commit()
         print("Checker status logs inserted.")
     except Exception as e:
@@ -1388,30 +1395,31 @@ def bulk_create_hazard_waste_generated(db: Session, rows: list[dict]) -> int:
         hwg_id = id_mapping[i]
         
         # Create hazard waste generated record
-        record = EnviHazardWasteGenerated(
-            hwg_id=hwg_id,
-            company_id=row["company_id"],
-            metrics=row["metrics"],
-            unit_of_measurement=row["unit_of_measurement"],
-            waste_generated=row["waste_generated"],
-            quarter=row["quarter"],
-            year=row["year"]            
-        )
-        records.append(record)
+        records.append({
+            "hwg_id": hwg_id,
+            "company_id": row["company_id"],
+            "metrics": row["metrics"],
+            "unit_of_measurement": row["unit_of_measurement"],
+            "waste_generated": row["waste_generated"],
+            "quarter": row["quarter"],
+            "year": row["year"],
+        })
         
         # Create CheckerStatus record
         status_time = base_timestamp + timedelta(hours=i + 1)
-        checker_log = RecordStatus(
-            cs_id=f"CS-{hwg_id}",
-            record_id=hwg_id,
-            status_id="URS",
-            status_timestamp=status_time,
-            remarks="real-data inserted"
-        )
-        checker_logs.append(checker_log)
+        checker_logs.append({
+            "cs_id": f"CS-{hwg_id}",
+            "record_id": hwg_id,
+            "status_id": "URS",
+            "status_timestamp": status_time,
+            "remarks": "real-data inserted",
+        })
     
-    # Insert records
-    db.bulk_save_objects(records)
+    # Insert all records in one round-trip; very large batches go through COPY
+    if len(records) > COPY_THRESHOLD:
+        copy_rows(db, EnviHazardWasteGenerated.__table__, records)
+    else:
+        db.execute(insert(EnviHazardWasteGenerated.__table__), records)
     db.commit()
 
     """
@@ -1441,9 +1449,9 @@ def bulk_create_hazard_waste_generated(db: Session, rows: list[dict]) -> int:
         print(f"Error executing stored procedure: {e}")
         db.rollback()
         
-    # Insert checker_status_log entries using CheckerStatus model
+    # Insert checker_status_log rows in one round-trip
     try:
-        db.bulk_save_objects(checker_logs)
+        db.execute(insert(RecordStatus.__table__), checker_logs)
         db.commit()
         print("Checker status logs inserted.")
     except Exception as e:
@@ -1489,29 +1497,30 @@ def bulk_create_hazard_waste_disposed(db: Session, rows: list[dict]) -> int:
         hwd_id = id_mapping[i]
         
         # Create hazard waste disposed record
-        record = EnviHazardWasteDisposed(
-            hwd_id=hwd_id,
-            company_id=row["company_id"],
-            metrics=row["metrics"],
-            unit_of_measurement=row["unit_of_measurement"],
-            waste_disposed=row["waste_disposed"],
-            year=row["year"]            
-        )
-        records.append(record)
+        records.append({
+            "hwd_id": hwd_id,
+            "company_id": row["company_id"],
+            "metrics": row["metrics"],
+            "unit_of_measurement": row["unit_of_measurement"],
+            "waste_disposed": row["waste_disposed"],
+            "year": row["year"],
+        })
         
         # Create CheckerStatus record
         status_time = base_timestamp + timedelta(hours=i + 1)
-        checker_log = RecordStatus(
-            cs_id=f"CS-{hwd_id}",
-            record_id=hwd_id,
-            status_id="URS",
-            status_timestamp=status_time,
-            remarks="real-data inserted"
-        )
-        checker_logs.append(checker_log)
+        checker_logs.append({
+            "cs_id": f"CS-{hwd_id}",
+            "record_id": hwd_id,
+            "status_id": "URS",
+            "status_timestamp": status_time,
+            "remarks": "real-data inserted",
+        })
     
-    # Insert records
-    db.bulk_save_objects(records)
+    # Insert all records in one round-trip; very large batches go through COPY
+    if len(records) > COPY_THRESHOLD:
+        copy_rows(db, EnviHazardWasteDisposed.__table__, records)
+    else:
+        db.execute(insert(EnviHazardWasteDisposed.__table__), records)
     db.commit()
 
     """
@@ -1541,9 +1550,9 @@ def bulk_create_hazard_waste_disposed(db: Session, rows: list[dict]) -> int:
         print(f"Error executing stored procedure: {e}")
         db.rollback()
         
-    # Insert checker_status_log entries using CheckerStatus model
+    # Insert checker_status_log rows in one round-trip
     try:
-        db.bulk_save_objects(checker_logs)
+        db.execute(insert(RecordStatus.__table__), checker_logs)
         db.commit()
         print("Checker status logs inserted.")
     except Exception as e:
@@ -1589,29 +1598,30 @@ def bulk_create_diesel_consumption(db: Session, rows: list[dict]) -> int:
         dc_id = id_mapping[i]
         
         # Create diesel consumption record
-        record = EnviDieselConsumption(
-            dc_id=dc_id,
-            company_id=row["company_id"],
-            cp_id=row["cp_id"],
-            unit_of_measurement=row["unit_of_measurement"],
-            consumption=row["consumption"],
-            date=row["date"]        
-        )
-        records.append(record)
+        records.append({
+            "dc_id": dc_id,
+            "company_id": row["company_id"],
+            "cp_id": row["cp_id"],
+            "unit_of_measurement": row["unit_of_measurement"],
+            "consumption": row["consumption"],
+            "date": row["date"],
+        })
         
         # Create CheckerStatus record
         status_time = base_timestamp + timedelta(hours=i + 1)
-        checker_log = RecordStatus(
-            cs_id=f"CS-{dc_id}",
-            record_id=dc_id,
-            status_id="URS",
-            status_timestamp=status_time,
-            remarks="real-data inserted"
-        )
-        checker_logs.append(checker_log)
+        checker_logs.append({
+            "cs_id": f"CS-{dc_id}",
+            "record_id": dc_id,
+            "status_id": "URS",
+            "status_timestamp": status_time,
+            "remarks": "real-data inserted",
+        })
     
-    # Insert records
-    db.bulk_save_objects(records)
+    # Insert all records in one round-trip; very large batches go through COPY
+    if len(records) > COPY_THRESHOLD:
+        copy_rows(db, EnviDieselConsumption.__table__, records)
+    else:
+        db.execute(insert(EnviDieselConsumption.__table__), records)
     db.commit()
 
     """
@@ -1641,9 +1651,9 @@ def bulk_create_diesel_consumption(db: Session, rows: list[dict]) -> int:
         print(f"Error executing stored procedure: {e}")
         db.rollback()
         
-    # Insert checker_status_log entries using CheckerStatus model
+    # Insert checker_status_log rows in one round-trip
     try:
-        db.bulk_save_objects(checker_logs)
+        db.execute(insert(RecordStatus.__table__), checker_logs)
         db.commit()
         print("Checker status logs inserted.")
     except Exception as e:
@@ -1,6 +1,16 @@
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field, StrictFloat, StrictInt, StrictStr, StringConstraints, field_validator
 from datetime import datetime as dt, date
-from typing import Optional, List, Dict, Any
+from typing import Annotated, Optional, List, Dict, Any
+
+# Shared config for read-only *Out response models: no assignment validation,
+# unknown attributes dropped, and frozen instances since they are never mutated
+_OUT_CONFIG = ConfigDict(
+    from_attributes=True,
+    extra="ignore",
+    validate_assignment=False,
+    frozen=True,
+    arbitrary_types_allowed=False,
+)
 #====================POWER PLANT ENERGY=================================
 class EnergyRecordOut(BaseModel):
     energy_id: str
@@ -11,7 +21,7 @@ class EnergyRecordOut(BaseModel):
     create_at: Optional[dt]  
     updated_at: Optional[dt]
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = _OUT_CONFIG
 
 class AddEnergyRecord(BaseModel):
     power_plant_id: Optional[str]
@@ -33,6 +43,26 @@ class CSRActivity(BaseModel):
 
     model_config = ConfigDict(from_attributes=True)
 
+# Body of the single CSR activity insert/update endpoints. Fields are declared in
+# the order the endpoints report them, so the first error is the first bad field.
+class CSRActivityIn(BaseModel):
+    csr_id: Optional[str] = None
+    company_id: Annotated[StrictStr, StringConstraints(strip_whitespace=True, min_length=1)]
+    project_id: Annotated[StrictStr, StringConstraints(strip_whitespace=True, min_length=1)]
+    project_year: Annotated[StrictInt, Field(ge=2000)]
+    csr_report: Annotated[StrictInt, Field(gt=0)]
+    project_expenses: Annotated[StrictFloat, Field(ge=0, allow_inf_nan=False)]
+    project_remarks: Optional[str] = None
+
+    @field_validator("project_year")
+    @classmethod
+    def project_year_not_future(cls, value: int) -> int:
+        # Checked at request time so the upper bound follows the calendar;
+        # the lower bound is a plain constraint handled by pydantic-core
+        if value > dt.now().year:
+            raise ValueError("project_year must not be after the current year")
+        return value
+
 class CSRProject(BaseModel):
     project_id: str
     program_id: Optional[str]
@@ -58,6 +88,8 @@ class EnviCompanyPropertyOut(BaseModel):
     cp_name: Optional[str]
     cp_type: Optional[str]
 
+    model_config = _OUT_CONFIG
+
 class EnviWaterAbstractionOut(BaseModel):
     wa_id: str
     company_id: Optional[str]
@@ -67,6 +99,8 @@ class EnviWaterAbstractionOut(BaseModel):
     volume: Optional[float]
     unit_of_measurement: Optional[str]
 
+    model_config = _OUT_CONFIG
+
 class EnviWaterDischargeOut(BaseModel):
     wd_id: str
     company_id: Optional[str]
@@ -75,7 +109,7 @@ class EnviWaterDischargeOut(BaseModel):
     volume: Optional[float]
     unit_of_measurement: Optional[str]
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = _OUT_CONFIG
 
 class EnviWaterConsumptionOut(BaseModel):
     wc_id: str
@@ -85,7 +119,7 @@ class EnviWaterConsumptionOut(BaseModel):
     volume: Optional[float]
     unit_of_measurement: Optional[str]
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = _OUT_CONFIG
 
 class EnviDieselConsumptionOut(BaseModel):
     dc_id: str
@@ -95,7 +129,7 @@ class EnviDieselConsumptionOut(BaseModel):
     consumption: Optional[float]
     date: Optional[dt]
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = _OUT_CONFIG
 
 class EnviElectricConsumptionOut(BaseModel):
     ec_id: str
@@ -106,7 +140,7 @@ class EnviElectricConsumptionOut(BaseModel):
     quarter: Optional[str]
     year: Optional[int]
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = _OUT_CONFIG
 
 class EnviNonHazardWasteOut(BaseModel):
     nhw_id: str
@@ -118,7 +152,7 @@ class EnviNonHazardWasteOut(BaseModel):
     quarter: Optional[str]
     year: Optional[int]
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = _OUT_CONFIG
 
 class EnviHazardWasteGeneratedOut(BaseModel):
     hwg_id: str
@@ -129,7 +163,7 @@ class EnviHazardWasteGeneratedOut(BaseModel):
     quarter: Optional[str]
     year: Optional[int]
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = _OUT_CONFIG
 
 class EnviHazardWasteDisposedOut(BaseModel):
     hwd_id: str
@@ -139,7 +173,7 @@ class EnviHazardWasteDisposedOut(BaseModel):
     waste_disposed: Optional[float]
     year: Optional[int]
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = _OUT_CONFIG
     
 #====================Human Resources=================================
 
@@ -152,14 +186,14 @@ class HRDemographicsOut(BaseModel):
     company_id: Optional[str]
     employment_status: Optional[str]
     
-    model_config = ConfigDict(from_attributes=True)
+    model_config = _OUT_CONFIG
 
 class HRTenureOut(BaseModel):
     employee_id: str
     start_date: dt
     end_date: Optional[dt]
     
-    model_config = ConfigDict(from_attributes=True)
+    model_config = _OUT_CONFIG
     
 class HRSafetyWorkdataOut(BaseModel):
     company_id: str
@@ -168,7 +202,7 @@ class HRSafetyWorkdataOut(BaseModel):
     manpower: int
     manhours: int
     
-    model_config = ConfigDict(from_attributes=True)
+    model_config = _OUT_CONFIG
     
 class HRParentalLeaveOut(BaseModel):
     employee_id: str
@@ -176,7 +210,7 @@ class HRParentalLeaveOut(BaseModel):
     date: dt
     days: int
     
-    model_config = ConfigDict(from_attributes=True)
+    model_config = _OUT_CONFIG
     
 class HROshOut(BaseModel):
     company_id: str
@@ -187,7 +221,7 @@ class HROshOut(BaseModel):
     incident_title: str
     incident_count: int
     
-    model_config = ConfigDict(from_attributes=True)
+    model_config = _OUT_CONFIG
 
 class HRTrainingOut(BaseModel):
     company_id: str
@@ -196,12 +230,14 @@ class HRTrainingOut(BaseModel):
     training_hours: dt
     number_of_participants: int
     
-    model_config = ConfigDict(from_attributes=True)
+    model_config = _OUT_CONFIG
     
 class EmployabilityCombinedOut(BaseModel):
     demographics: HRDemographicsOut
     tenure: HRTenureOut
 
+    model_config = _OUT_CONFIG
+
 # Define the full request model
 class FilteredDataRequest(BaseModel):
     filteredData: List[EnviElectricConsumptionOut]
\ No newline at end of file
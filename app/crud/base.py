@@ -1,35 +1,48 @@
-from typing import Type, List, Optional, Dict, Any
+from typing import Type, List, Optional, Any, Mapping
+from sqlalchemy import select, any_, bindparam
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import Session
 from sqlalchemy.ext.declarative import DeclarativeMeta
 
 
+def _where_clause(column, value):
+    if isinstance(value, (list, tuple, set, frozenset)):
+        # Bind the whole list as one array parameter (column = ANY(:values)) so the
+        # statement keeps a single shape no matter how many values are passed
+        return column == any_(bindparam(None, list(value), type_=ARRAY(column.type)))
+    return column == value
+
+
+def _where_clauses(model: Type[DeclarativeMeta], filters: Optional[Mapping[str, Any]]) -> list:
+    if not filters:
+        return []
+    return [_where_clause(getattr(model, field), value) for field, value in filters.items()]
+
+
 def get_one(db: Session, model: Type[DeclarativeMeta], id_field: str, id_value: Any):
-    return db.query(model).filter(getattr(model, id_field) == id_value).first()
+    stmt = select(model).where(getattr(model, id_field) == id_value)
+    return db.execute(stmt).scalars().first()
 
-def get_one_filtered(db: Session, model: Type[DeclarativeMeta], filters: dict):
-    query = db.query(model)
-    for field, value in filters.items():
-        query = query.filter(getattr(model, field) == value)
-    return query.first()
+def get_one_filtered(db: Session, model: Type[DeclarativeMeta], filters: Mapping[str, Any]):
+    stmt = select(model).where(*_where_clauses(model, filters))
+    return db.execute(stmt).scalars().first()
 
 
 def get_many(db: Session, model: Type[DeclarativeMeta], skip: int = 0, limit: int = 100):
-    return db.query(model).offset(skip).limit(limit).all()
+    stmt = select(model).offset(skip).limit(limit)
+    return db.execute(stmt).scalars().all()
 
 
 def get_many_filtered(
     db: Session,
     model: Type[DeclarativeMeta],
-    filters: Optional[Dict[str, Any]] = None,
+    filters: Optional[Mapping[str, Any]] = None,
     skip: int = 0,
     limit: int = 100
 ):
-    query = db.query(model)
-    if filters:
-        for field, value in filters.items():
-            query = query.filter(getattr(model, field) == value)
-    return query.offset(skip).limit(limit).all()
+    stmt = select(model).where(*_where_clauses(model, filters)).offset(skip).limit(limit)
+    return db.execute(stmt).scalars().all()
 
 
 def get_all(db: Session, model: Type[DeclarativeMeta]):
-    return db.query(model).all()
+    return db.execute(select(model)).scalars().all()
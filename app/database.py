@@ -3,11 +3,33 @@ from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 import os
 from dotenv import load_dotenv
+from app.utils import query_counter
 
 load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASE_URL")
 
-engine = create_engine(DATABASE_URL)
+# Pool sized for concurrent requests; pre-ping drops stale connections before use
+# and LIFO reuse lets idle connections beyond the hot set time out.
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "40"))
+
+engine = create_engine(
+    DATABASE_URL,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_recycle=int(os.getenv("DB_POOL_RECYCLE", "1800")),
+    # Fail fast with an error instead of queueing indefinitely when the pool is exhausted
+    pool_timeout=int(os.getenv("DB_POOL_TIMEOUT", "30")),
+    pool_pre_ping=True,
+    pool_use_lifo=True,
+    # Batch executemany() INSERTs (bulk uploads) into multi-row VALUES statements
+    executemany_mode="values_plus_batch",
+)
+
+# Development only: record executed statements so count_queries() can catch N+1 patterns
+if os.getenv("SQL_DEBUG_QUERY_COUNT", "").lower() in ("1", "true", "yes"):
+    query_counter.install(engine)
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
@@ -3,6 +3,9 @@ from sqlalchemy.orm import Session
 from .database import SessionLocal
 
 def get_db():
+    # One plain Session per request. A thread-local scoped_session is not safe here:
+    # FastAPI may run this generator's setup, the route and its teardown on different
+    # threadpool threads, so scoped_session.remove() would clear the wrong thread's session.
     db = SessionLocal()
     try:
         yield db
@@ -1,7 +1,14 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from app.routers import api_router
+from app.utils.orjson_response import ORJSONResponse
+from app.database import DB_POOL_SIZE, DB_MAX_OVERFLOW
+import anyio.to_thread
+import logging
+import logging.handlers
 import os
+import queue
 from datetime import timezone, timedelta
 
 from .routers import economic  # Import just the economic router for now
@@ -14,7 +21,8 @@ if hasattr(os, 'tzset'):
 app = FastAPI(
     title="PetroDash API",
     description="REST API for PetroEnergy's data warehouse analytics",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -26,6 +34,53 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# List responses repeat the same camelCase keys on every row and compress well;
+# small bodies are sent as-is. Streamed responses are compressed chunk by chunk.
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+@app.on_event("startup")
+async def size_threadpool():
+    # Database-bound handlers are sync and run in AnyIO's threadpool, which defaults
+    # to 40 threads; let it run as many requests as the connection pool can serve
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = int(os.getenv("THREADPOOL_SIZE", DB_POOL_SIZE + DB_MAX_OVERFLOW))
+
+# Loggers whose handlers write from the request path: the root logger used by the
+# routers' logging.* calls, and uvicorn's error and access loggers
+QUEUED_LOGGERS = ("", "uvicorn", "uvicorn.access")
+log_listeners = []
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    # Queue records as they are; the listener's handlers format them. The default
+    # prepare() formats on the calling thread and drops args, which uvicorn's
+    # access formatter reads.
+    def prepare(self, record):
+        return record
+
+@app.on_event("startup")
+def start_log_queue():
+    # Hand records to a queue and let a background thread do the stream writes,
+    # so request threads don't contend on the handlers' locks and stderr
+    for name in QUEUED_LOGGERS:
+        logger = logging.getLogger(name)
+        if not logger.handlers:
+            continue
+        log_queue = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(
+            log_queue, *logger.handlers, respect_handler_level=True
+        )
+        logger.handlers = [DeferredQueueHandler(log_queue)]
+        listener.start()
+        log_listeners.append((logger, listener))
+
+@app.on_event("shutdown")
+def stop_log_queue():
+    # Flush what is queued and give each logger its own handlers back
+    while log_listeners:
+        logger, listener = log_listeners.pop()
+        listener.stop()
+        logger.handlers = list(listener.handlers)
+
 # Include routers
 
 
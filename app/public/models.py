@@ -1,5 +1,6 @@
-from sqlalchemy import Text,Column, String, Numeric, TIMESTAMP, func, Double, SmallInteger, Date, TEXT, BOOLEAN, Integer
+from sqlalchemy import Text,Column, String, Numeric, TIMESTAMP, func, Double, SmallInteger, Date, TEXT, BOOLEAN, Integer, Index
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import relationship
 from sqlalchemy.schema import MetaData
 from enum import Enum
 
@@ -17,6 +18,17 @@ class RecordStatus(Base):
     status_timestamp = Column(TIMESTAMP, server_default=func.current_timestamp())
     remarks = Column(String)
 
+    __table_args__ = (
+        # Serves the CSR listings' latest-status lookup per record_id; status_id and
+        # remarks are included so the lookup can be answered from the index alone
+        Index(
+            "ix_record_status_record_id_latest",
+            record_id,
+            status_timestamp.desc(),
+            postgresql_include=["status_id", "remarks"],
+        ),
+    )
+
 class AuditTrail(Base):
     __tablename__ = "audit_trail"
 
@@ -44,6 +56,24 @@ class Account(Base):
     date_created = Column(TIMESTAMP, nullable=False, server_default=func.current_timestamp())
     date_updated = Column(TIMESTAMP, nullable=False, server_default=func.current_timestamp(), onupdate=func.current_timestamp())
 
+    # 1:1 profile; there is no FK in the schema, so the join is spelled out.
+    # Loaded with one SELECT ... WHERE account_id IN (...) per batch of accounts.
+    profile = relationship(
+        "UserProfile",
+        uselist=False,
+        primaryjoin="Account.account_id == foreign(UserProfile.account_id)",
+        lazy="selectin",
+        viewonly=True,
+    )
+
+    __table_args__ = (
+        # One account per email regardless of case; also serves the bulk upload's
+        # lower(email) IN (...) check
+        Index("ix_account_email", func.lower(email), unique=True),
+        # Serves the account listing's ORDER BY date_updated DESC, date_created DESC
+        Index("ix_account_updated_created_desc", date_updated.desc(), date_created.desc()),
+    )
+
 class UserProfile(Base):
     __tablename__ = "user_profile"
 
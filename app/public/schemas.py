@@ -2,6 +2,15 @@ from pydantic import BaseModel, ConfigDict,EmailStr
 from datetime import datetime as dt, date
 from typing import Optional, List, Dict, Any
 
+# Read-only response models skip assignment validation and are frozen
+_OUT_CONFIG = ConfigDict(
+    from_attributes=True,
+    extra="ignore",
+    validate_assignment=False,
+    frozen=True,
+    arbitrary_types_allowed=False,
+)
+
 # Pydantic Schemas
 class UserProfileCreate(BaseModel):
     emp_id: Optional[str] = None
@@ -40,5 +49,4 @@ class AccountProfileOut(BaseModel):
     birthdate: Optional[date] = None
     gender: Optional[str] = None
 
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    model_config = _OUT_CONFIG
\ No newline at end of file
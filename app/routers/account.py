@@ -1,10 +1,11 @@
 from fastapi.responses import StreamingResponse
 # Bulk add accounts from file (CSV)
 import csv
-from io import StringIO, BytesIO
 
-from fastapi import APIRouter, HTTPException, Depends, status, UploadFile, File, Form, Response
+from fastapi import APIRouter, HTTPException, Depends, status, UploadFile, File, Form, Response, Query
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
+from sqlalchemy import text
 from typing import List, Optional
 from ..public import models
 from app.dependencies import get_db
@@ -12,19 +13,153 @@ from ..public.schemas import AccountCreate, AccountProfileOut
 import uuid
 # Bulk add accounts from file (CSV)
 import csv
-from io import StringIO
-from datetime import datetime  
-import ulid 
-from passlib.hash import bcrypt
+import pandas as pd
+from datetime import date
+from functools import lru_cache
+from operator import attrgetter
+from app.utils.gen_ulid import generate_ulid, generate_ulids
+from app.utils.pg_copy import COPY_THRESHOLD, copy_rows
+from app.services.auth import AuthService, pwd_context
 
 
 router = APIRouter()
 
 
 
-# Helper to generate ULID (or UUID)
-def generate_ulid():
-    return str(ulid.new())
+# Default passwords assigned to new accounts. bcrypt is deliberately slow, so the
+# hash of each constant is computed once per process instead of once per account.
+# Accounts created this way share the same placeholder hash; it is only a temporary
+# credential and is replaced when the user sets their own password.
+DEFAULT_PASSWORD = "petroenergy"
+BULK_DEFAULT_PASSWORD = "changeme"
+
+@lru_cache(maxsize=None)
+def default_password_hash(password: str) -> str:
+    return pwd_context.hash(password)
+
+def parse_birthdate(value: str) -> date:
+    """
+    Parse an MM/DD/YYYY birthdate with a plain split, raising ValueError on bad
+    input like strptime. Months and days may be one or two digits.
+    """
+    parts = value.split("/")
+    if (
+        len(parts) != 3
+        or not all(part.isascii() and part.isdigit() for part in parts)
+        or len(parts[0]) > 2 or len(parts[1]) > 2 or len(parts[2]) != 4
+    ):
+        raise ValueError(f"time data {value!r} does not match format '%m/%d/%Y'")
+    month, day, year = parts
+    return date(int(year), int(month), int(day))
+
+# pyarrow is optional; when installed, pandas hands CSV tokenizing to its
+# multithreaded reader, otherwise the default C parser is used
+try:
+    import pyarrow  # noqa: F401
+    _CSV_ENGINE = "pyarrow"
+except ImportError:
+    _CSV_ENGINE = "c"
+
+def read_upload_csv(file: UploadFile) -> pd.DataFrame:
+    """
+    Read an uploaded CSV into a DataFrame of strings. Empty cells are '' rather
+    than NaN, like csv.DictReader, so the validation rules see the same values.
+    """
+    try:
+        df = pd.read_csv(file.file, dtype=str, keep_default_na=False, engine=_CSV_ENGINE)
+    except pd.errors.EmptyDataError:
+        raise HTTPException(status_code=400, detail="Uploaded CSV file is empty.")
+    except (pd.errors.ParserError, UnicodeDecodeError) as e:
+        raise HTTPException(status_code=400, detail=f"Invalid CSV file: {e}")
+    return df.fillna("")
+
+# Sample values written by /bulk/template; a row matching any of them is treated
+# as the template's example row rather than real data
+_TEMPLATE_SENTINELS = {
+    "email": "user@example.com",
+    "emp_id": "EMP001",
+    "first_name": "John",
+    "last_name": "Doe",
+    "middle_name": "A.",
+    "suffix": "Jr.",
+    "contact_number": "09123456789",
+    "address": "123 Main St",
+    "birthdate": "MM/DD/YYYY",
+    "gender": "Male, Female, Other",
+}
+
+def _stripped_column(df: pd.DataFrame, name: str) -> pd.Series:
+    if name not in df.columns:
+        return pd.Series("", index=df.index)
+    return df[name].str.strip()
+
+def classify_upload_rows(df: pd.DataFrame) -> tuple:
+    """
+    Strip the upload's columns once and return:
+    - the 2-based row numbers (matching the CSV line numbers) of rows that still
+      hold the sample values from the downloadable template,
+    - the row numbers whose email was already used by an earlier valid row,
+    - one dict per row with the stripped email (lowercased), birthdate and
+      contact_number, for the row loop to reuse.
+    """
+    stripped = {name: _stripped_column(df, name) for name in _TEMPLATE_SENTINELS}
+    emails = stripped["email"].str.lower()
+    is_template = pd.Series(False, index=df.index)
+    for name, sentinel in _TEMPLATE_SENTINELS.items():
+        is_template |= (emails if name == "email" else stripped[name]) == sentinel
+    # Only rows that pass the required-field check claim an email, as in the row loop
+    has_required = (emails != "") & (df["first_name"] != "") & (df["last_name"] != "")
+    eligible = ~is_template & has_required
+    is_duplicate = emails[eligible].duplicated().reindex(df.index, fill_value=False)
+
+    template_row_indices = set((is_template.to_numpy().nonzero()[0] + 2).tolist())
+    duplicate_row_indices = set((is_duplicate.to_numpy().nonzero()[0] + 2).tolist())
+    cleaned_rows = pd.DataFrame({
+        "email": emails,
+        "birthdate": stripped["birthdate"],
+        "contact_number": stripped["contact_number"],
+    }).to_dict("records")
+    return template_row_indices, duplicate_row_indices, cleaned_rows
+
+# Fields of AccountProfileOut, split by the model they are read from
+_ACCOUNT_FIELDS = ("account_id", "email", "account_role", "power_plant_id", "company_id", "account_status")
+_PROFILE_FIELDS = ("first_name", "last_name", "middle_name", "suffix", "contact_number", "address", "birthdate", "gender")
+_get_account_fields = attrgetter(*_ACCOUNT_FIELDS)
+_get_profile_fields = attrgetter(*_PROFILE_FIELDS)
+# Values reported for an account that has no profile row
+_EMPTY_PROFILE = ("", "", "", "", "", "", None, "")
+
+def serialize_account(account: models.Account, profile: Optional[models.UserProfile]) -> dict:
+    """Flatten an Account and its UserProfile into an AccountProfileOut-shaped dict."""
+    result = dict(zip(_ACCOUNT_FIELDS, _get_account_fields(account)))
+    result.update(zip(_PROFILE_FIELDS, _get_profile_fields(profile) if profile is not None else _EMPTY_PROFILE))
+    return result
+
+_ACCOUNT_LIST_ADAPTER = TypeAdapter(List[AccountProfileOut])
+
+def render_account_list(items: list) -> bytes:
+    """Validate and serialize a list of account rows to JSON bytes."""
+    return _ACCOUNT_LIST_ADAPTER.dump_json(_ACCOUNT_LIST_ADAPTER.validate_python(items))
+
+# Rows rendered per chunk when streaming a bulk upload's response
+RESPONSE_CHUNK_SIZE = 5000
+
+def iter_account_list_json(account_rows: list, profile_rows: list):
+    """
+    Yield a JSON array of AccountProfileOut objects built from the staged insert
+    rows, rendering RESPONSE_CHUNK_SIZE items at a time so only one chunk of
+    validated models and bytes is alive at once.
+    """
+    yield b"["
+    for start in range(0, len(account_rows), RESPONSE_CHUNK_SIZE):
+        stop = start + RESPONSE_CHUNK_SIZE
+        # AccountProfileOut ignores extra keys, so the merged insert rows validate as-is
+        chunk = render_account_list([
+            {**account_row, **profile_row}
+            for account_row, profile_row in zip(account_rows[start:stop], profile_rows[start:stop])
+        ])
+        yield (b"," if start else b"") + chunk[1:-1]
+    yield b"]"
 
 # Create single account with profile
 @router.post("/add", response_model=AccountProfileOut, status_code=status.HTTP_201_CREATED)
@@ -34,14 +169,11 @@ def create_account(account: AccountCreate, db: Session = Depends(get_db)):
         db_account = models.Account(
             account_id=account_id,
             email=account.email,
-            password=bcrypt.hash("petroenergy"),  # Default password, should be changed later
+            password=default_password_hash(DEFAULT_PASSWORD),  # Default password, should be changed later
             account_role=account.account_role,
             power_plant_id=account.power_plant_id,
             company_id=account.company_id,
-            account_status=account.account_status,
-            date_created=datetime.now(),
-            date_updated=datetime.now()
-
+            account_status=account.account_status
         )
         db_profile = models.UserProfile(
             account_id=account_id,
@@ -53,31 +185,14 @@ def create_account(account: AccountCreate, db: Session = Depends(get_db)):
             contact_number=account.profile.contact_number,
             address=account.profile.address,
             birthdate=account.profile.birthdate,
-            gender=account.profile.gender,
-            profile_created=datetime.now(),
-            profile_updated=datetime.now()
+            gender=account.profile.gender
         )
         db.add(db_account)
         db.add(db_profile)
         db.commit()
         db.refresh(db_account)
         db.refresh(db_profile)
-        return {
-            "account_id": db_account.account_id,
-            "email": db_account.email,
-            "account_role": db_account.account_role,
-            "power_plant_id": db_account.power_plant_id,
-            "company_id": db_account.company_id,
-            "account_status": db_account.account_status,
-            "first_name": db_profile.first_name,
-            "last_name": db_profile.last_name,
-            "middle_name": db_profile.middle_name,
-            "suffix": db_profile.suffix,
-            "contact_number": db_profile.contact_number,
-            "address": db_profile.address,
-            "birthdate": db_profile.birthdate,
-            "gender": db_profile.gender
-        }
+        return serialize_account(db_account, db_profile)
     except Exception as e:
         print(f"Error creating account: {e}")
         import traceback
@@ -85,100 +200,121 @@ def create_account(account: AccountCreate, db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=f"Failed to create account: {e}")
 
 # Get all accounts with profiles
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import joinedload, load_only, raiseload
 from sqlalchemy.sql import func
 from sqlalchemy import outerjoin
 from sqlalchemy.future import select
 
 @router.get("/", response_model=List[AccountProfileOut])
-def get_all_accounts(db: Session = Depends(get_db)):
-    # Perform a LEFT JOIN between Account and UserProfile
+def get_all_accounts(
+    skip: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    db: Session = Depends(get_db)
+):
+    # Accounts and profiles come back from one LEFT OUTER JOIN; the password
+    # hash is never returned, so it is not selected
     query = (
-        db.query(models.Account, models.UserProfile)
-        .outerjoin(models.UserProfile, models.Account.account_id == models.UserProfile.account_id)
+        db.query(models.Account)
+        .options(
+            load_only(
+                models.Account.account_id,
+                models.Account.email,
+                models.Account.account_role,
+                models.Account.power_plant_id,
+                models.Account.company_id,
+                models.Account.account_status,
+                models.Account.date_created,
+                models.Account.date_updated,
+            ),
+            joinedload(models.Account.profile),
+            # Any other relationship access would be a hidden per-row query
+            raiseload("*"),
+        )
         .order_by(
             models.Account.date_updated.desc(),
             models.Account.date_created.desc()
         )
     )
-
-    result = []
-    for acc, prof in query.all():
-        result.append({
-            "account_id": acc.account_id,
-            "email": acc.email,
-            "account_role": acc.account_role,
-            "power_plant_id": acc.power_plant_id,
-            "company_id": acc.company_id,
-            "account_status": acc.account_status,
-            "first_name": prof.first_name if prof else "",
-            "last_name": prof.last_name if prof else "",
-            "middle_name": prof.middle_name if prof else "",
-            "suffix": prof.suffix if prof else "",
-            "contact_number": prof.contact_number if prof else "",
-            "address": prof.address if prof else "",
-            "birthdate": prof.birthdate.strftime("%Y-%m-%d") if prof and prof.birthdate else None,
-            "gender": prof.gender if prof else ""
-        })
-
-    return result
-
+    # Pagination is opt-in so existing clients still receive the full list
+    if skip:
+        query = query.offset(skip)
+    if limit is not None:
+        query = query.limit(limit)
+
+    result = [serialize_account(acc, acc.profile) for acc in query.all()]
+
+    # Sync handlers run in the threadpool, so serializing here keeps it off the event loop
+    return Response(render_account_list(result), media_type="application/json")
+
+
+# Update the status and read back the account with its profile in one round-trip
+_SET_ACCOUNT_STATUS_SQL = text("""
+    WITH upd AS (
+        UPDATE public.account
+        SET account_status = :account_status,
+            date_updated = CURRENT_TIMESTAMP
+        WHERE account_id = :account_id
+        RETURNING account_id, email, account_role, power_plant_id, company_id, account_status
+    )
+    SELECT
+        upd.*,
+        COALESCE(up.first_name, '') AS first_name,
+        COALESCE(up.last_name, '') AS last_name,
+        up.middle_name,
+        up.suffix,
+        up.contact_number,
+        up.address,
+        up.birthdate,
+        up.gender
+    FROM upd
+    LEFT JOIN public.user_profile up ON up.account_id = upd.account_id
+""")
+
+def set_account_status(db: Session, account_id: str, account_status: str) -> dict:
+    row = db.execute(
+        _SET_ACCOUNT_STATUS_SQL,
+        {"account_id": account_id, "account_status": account_status}
+    ).mappings().first()
+    if not row:
+        db.rollback()
+        raise HTTPException(status_code=404, detail="Account not found")
+    db.commit()
+    # Authenticated requests resolve the user from a short-lived cache; drop this
+    # account's entry so a deactivation takes effect on its next request
+    AuthService.invalidate_cached_user(row["email"])
+    return dict(row)
 
 # Activate account
 @router.patch("/{account_id}/activate", response_model=AccountProfileOut)
 def activate_account(account_id: str, db: Session = Depends(get_db)):
-    acc = db.query(models.Account).filter(models.Account.account_id == account_id).first()
-    if not acc:
-        raise HTTPException(status_code=404, detail="Account not found")
-    acc.account_status = "active"
-    db.commit()
-    prof = db.query(models.UserProfile).filter(models.UserProfile.account_id == account_id).first()
-    return {
-        "account_id": acc.account_id,
-        "email": acc.email,
-        "account_role": acc.account_role,
-        "power_plant_id": acc.power_plant_id,
-        "company_id": acc.company_id,
-        "account_status": acc.account_status,
-        "first_name": prof.first_name,
-        "last_name": prof.last_name,
-        "middle_name": prof.middle_name,
-        "suffix": prof.suffix,
-        "contact_number": prof.contact_number,
-        "address": prof.address,
-        "birthdate": prof.birthdate,
-        "gender": prof.gender
-    }
+    return set_account_status(db, account_id, "active")
 
 # Deactivate account
 @router.patch("/{account_id}/deactivate", response_model=AccountProfileOut)
 def deactivate_account(account_id: str, db: Session = Depends(get_db)):
-    acc = db.query(models.Account).filter(models.Account.account_id == account_id).first()
-    if not acc:
-        raise HTTPException(status_code=404, detail="Account not found")
-    acc.account_status = "deactivated"
-    db.commit()
-    prof = db.query(models.UserProfile).filter(models.UserProfile.account_id == account_id).first()
-    return {
-        "account_id": acc.account_id,
-        "email": acc.email,
-        "account_role": acc.account_role,
-        "power_plant_id": acc.power_plant_id,
-        "company_id": acc.company_id,
-        "account_status": acc.account_status,
-        "first_name": prof.first_name,
-        "last_name": prof.last_name,
-        "middle_name": prof.middle_name,
-        "suffix": prof.suffix,
-        "contact_number": prof.contact_number,
-        "address": prof.address,
-        "birthdate": prof.birthdate,
-        "gender": prof.gender
-    }
+    return set_account_status(db, account_id, "deactivated")
+
+def registered_email_errors(db: Session, row_by_email: dict) -> list:
+    """
+    Report uploaded emails that already belong to an account, checked with a
+    single IN query instead of failing on the unique index at commit time.
+    Uploaded emails are lowercased, so stored emails are compared lowercased too.
+    """
+    if not row_by_email:
+        return []
+    stored_email = func.lower(models.Account.email)
+    existing = set(db.execute(
+        select(stored_email).where(stored_email.in_(list(row_by_email)))
+    ).scalars())
+    return [
+        f"Row {i}: Email '{email}' is already registered."
+        for email, i in row_by_email.items() if email in existing
+    ]
 
 # API to preview CSV data and validate all rows (no DB insert)
+# Plain def: the registered-email lookup is a blocking query, so this runs in the threadpool
 @router.post("/bulk/preview", status_code=200)
-async def preview_bulk_accounts(
+def preview_bulk_accounts(
     file: UploadFile = File(...),
     power_plant_id: Optional[str] = Form(None),
     company_id: Optional[str] = Form(None),
@@ -187,49 +323,31 @@ async def preview_bulk_accounts(
 ):
     if not file.filename.endswith('.csv'):
         raise HTTPException(status_code=400, detail="Only CSV files are supported.")
-    content = await file.read()
-    if not content:
-        raise HTTPException(status_code=400, detail="Uploaded CSV file is empty.")
-    s = StringIO(content.decode('utf-8'))
-    reader = csv.DictReader(s)
+    # Parse straight off the spooled upload instead of buffering it into memory
+    df = read_upload_csv(file)
+    fieldnames = list(df.columns)
     required_headers = {"email", "first_name", "last_name"}
-    if not required_headers.issubset(set(reader.fieldnames or [])):
-        raise HTTPException(status_code=400, detail=f"Missing required headers: {required_headers - set(reader.fieldnames or [])}")
+    if not required_headers.issubset(set(fieldnames)):
+        raise HTTPException(status_code=400, detail=f"Missing required headers: {required_headers - set(fieldnames)}")
 
-    all_rows = list(reader)
-    template_row_indices = []
+    all_rows = df.to_dict("records")
     errors = []
-    seen_emails = set()
+    row_by_email = {}
     valid_rows = []
 
-    # Identify template/sample rows
-    for i, row in enumerate(all_rows, start=2):
-        email = row.get('email', '').strip().lower()
-        birthdate_raw = row.get('birthdate', '').strip()
-        if (
-            email == "user@example.com" or
-            row.get('emp_id', '').strip() == "EMP001" or
-            row.get('first_name', '').strip() == "John" or
-            row.get('last_name', '').strip() == "Doe" or
-            row.get('middle_name', '').strip() == "A." or
-            row.get('suffix', '').strip() == "Jr." or
-            row.get('contact_number', '').strip() == "09123456789" or
-            row.get('address', '').strip() == "123 Main St" or
-            birthdate_raw == "MM/DD/YYYY" or
-            row.get('gender', '').strip() == "Male, Female, Other"
-        ):
-            template_row_indices.append(i)
+    # Template rows and in-file duplicate emails are flagged column-wise up front
+    template_row_indices, duplicate_row_indices, cleaned_rows = classify_upload_rows(df)
 
     # If all rows are template/sample rows, treat as empty
     if len(template_row_indices) == len(all_rows):
         raise HTTPException(status_code=400, detail="Uploaded CSV file is empty.")
 
     # Validate all non-template rows
-    for i, row in enumerate(all_rows, start=2):
+    for i, (row, cleaned) in enumerate(zip(all_rows, cleaned_rows), start=2):
         if i in template_row_indices:
             continue
-        email = row.get('email', '').strip().lower()
-        birthdate_raw = row.get('birthdate', '').strip()
+        email = cleaned['email']
+        birthdate_raw = cleaned['birthdate']
 
         # Validate required fields
         if not email or not row.get('first_name') or not row.get('last_name'):
@@ -237,39 +355,41 @@ async def preview_bulk_accounts(
             continue
 
         # Check for duplicate emails within the file
-        if email in seen_emails:
+        if i in duplicate_row_indices:
             errors.append(f"Row {i}: Duplicate email '{email}' found in the uploaded file.")
             continue
-        seen_emails.add(email)
 
         # Validate birthdate format if present
         birthdate = None
         if birthdate_raw:
             try:
-                birthdate = datetime.strptime(birthdate_raw, "%m/%d/%Y").date()
+                birthdate = parse_birthdate(birthdate_raw)
             except ValueError:
                 errors.append(f"Row {i}: Invalid birthdate format '{birthdate_raw}' for email '{email}'. Expected MM/DD/YYYY.")
                 continue
 
         # Normalize and validate contact number
-        contact_number = row.get('contact_number', '').strip()
+        contact_number = cleaned['contact_number']
         if contact_number and not contact_number.startswith('0'):
             contact_number = f'0{contact_number}'
 
         # Add row to valid_rows (include all fields)
+        row_by_email[email] = i
         valid_rows.append({
             **row,
             "email": email,
             "birthdate": birthdate.strftime("%Y-%m-%d") if birthdate else row.get('birthdate', ''),
         })
 
+    errors.extend(registered_email_errors(db, row_by_email))
     if errors:
         return {"valid": False, "errors": errors}
     return {"valid": True, "rows": valid_rows}
 
 # Bulk create accounts from CSV file
+# Plain def: the registered-email lookup is a blocking query, so this runs in the threadpool
 @router.post("/bulk", response_model=List[AccountProfileOut], status_code=status.HTTP_201_CREATED)
-async def bulk_create_accounts_from_file(
+def bulk_create_accounts_from_file(
     file: UploadFile = File(...),
     power_plant_id: Optional[str] = Form(None),
     company_id: Optional[str] = Form(None),
@@ -280,51 +400,36 @@ async def bulk_create_accounts_from_file(
     if not file.filename.endswith('.csv'):
         raise HTTPException(status_code=400, detail="Only CSV files are supported.")
 
-    content = await file.read()
-    if not content:
-        raise HTTPException(status_code=400, detail="Uploaded CSV file is empty.")
-
-    s = StringIO(content.decode('utf-8'))
-    reader = csv.DictReader(s)
+    # Parse straight off the spooled upload instead of buffering it into memory
+    df = read_upload_csv(file)
+    fieldnames = list(df.columns)
 
     required_headers = {"email", "first_name", "last_name"}
-    if not required_headers.issubset(set(reader.fieldnames or [])):
-        raise HTTPException(status_code=400, detail=f"Missing required headers: {required_headers - set(reader.fieldnames or [])}")
+    if not required_headers.issubset(set(fieldnames)):
+        raise HTTPException(status_code=400, detail=f"Missing required headers: {required_headers - set(fieldnames)}")
 
-    created = []
+    account_rows = []
+    profile_rows = []
     errors = []
-    seen_emails = set()
-    template_row_indices = []
-    all_rows = list(reader)
-
-    # Identify template/sample rows
-    for i, row in enumerate(all_rows, start=2):
-        email = row.get('email', '').strip().lower()
-        birthdate_raw = row.get('birthdate', '').strip()
-        if (
-            email == "user@example.com" or
-            row.get('emp_id', '').strip() == "EMP001" or
-            row.get('first_name', '').strip() == "John" or
-            row.get('last_name', '').strip() == "Doe" or
-            row.get('middle_name', '').strip() == "A." or
-            row.get('suffix', '').strip() == "Jr." or
-            row.get('contact_number', '').strip() == "09123456789" or
-            row.get('address', '').strip() == "123 Main St" or
-            birthdate_raw == "MM/DD/YYYY" or
-            row.get('gender', '').strip() == "Male, Female, Other"
-        ):
-            template_row_indices.append(i)
+    row_by_email = {}
+    all_rows = df.to_dict("records")
+    default_password = default_password_hash(BULK_DEFAULT_PASSWORD)
+    # IDs for every row come from one batch; rows skipped by validation just leave some unused
+    account_ids = iter(generate_ulids(len(all_rows)))
+
+    # Template rows and in-file duplicate emails are flagged column-wise up front
+    template_row_indices, duplicate_row_indices, cleaned_rows = classify_upload_rows(df)
 
     # If all rows are template/sample rows, treat as empty
     if len(template_row_indices) == len(all_rows):
         raise HTTPException(status_code=400, detail="Uploaded CSV file is empty.")
 
     # Now process only non-template rows
-    for i, row in enumerate(all_rows, start=2):
+    for i, (row, cleaned) in enumerate(zip(all_rows, cleaned_rows), start=2):
         if i in template_row_indices:
             continue
-        email = row.get('email', '').strip().lower()
-        birthdate_raw = row.get('birthdate', '').strip()
+        email = cleaned['email']
+        birthdate_raw = cleaned['birthdate']
 
         # 3. Validate required fields
         if not email or not row.get('first_name') or not row.get('last_name'):
@@ -332,111 +437,101 @@ async def bulk_create_accounts_from_file(
             continue
 
         # 4. Check for duplicate emails within the file
-        if email in seen_emails:
+        if i in duplicate_row_indices:
             errors.append(f"Row {i}: Duplicate email '{email}' found in the uploaded file.")
             continue
-        seen_emails.add(email)
 
         # 5. Validate birthdate format if present
         birthdate = None
         if birthdate_raw:
             try:
-                birthdate = datetime.strptime(birthdate_raw, "%m/%d/%Y").date()
+                birthdate = parse_birthdate(birthdate_raw)
             except ValueError:
                 errors.append(f"Row {i}: Invalid birthdate format '{birthdate_raw}' for email '{email}'. Expected MM/DD/YYYY.")
                 continue
 
         # Normalize and validate contact number
-        contact_number = row.get('contact_number', '').strip()
+        contact_number = cleaned['contact_number']
         if contact_number and not contact_number.startswith('0'):
             contact_number = f'0{contact_number}'
 
-        account_id = generate_ulid()
+        account_id = next(account_ids)
 
-        # Create Account model
-        db_account = models.Account(
-            account_id=account_id,
-            email=email,
-            password=bcrypt.hash("changeme"),
-            account_role=account_role,
-            power_plant_id=power_plant_id,
-            company_id=company_id,
-            account_status='active',
-            date_created=datetime.now(),
-            date_updated=datetime.now()
-        )
-        db.add(db_account)
-
-        # Create UserProfile model
-        db_profile = models.UserProfile(
-            account_id=account_id,
-            emp_id=row.get('emp_id'),
-            first_name=row['first_name'],
-            last_name=row['last_name'],
-            middle_name=row.get('middle_name'),
-            suffix=row.get('suffix'),
-            contact_number=contact_number,
-            address=row.get('address'),
-            birthdate=birthdate,
-            gender=row.get('gender'),
-            profile_created=datetime.now(),
-            profile_updated=datetime.now()
-        )
-        db.add(db_profile)
-
-        created.append({
+        account_row = {
             "account_id": account_id,
             "email": email,
-            "password": db_account.password,
-            "account_role": db_account.account_role,
-            "power_plant_id": db_account.power_plant_id,
-            "company_id": db_account.company_id,
-            "account_status": "active",
-            "first_name": db_profile.first_name,
-            "last_name": db_profile.last_name,
-            "middle_name": db_profile.middle_name,
-            "suffix": db_profile.suffix,
-            "contact_number": db_profile.contact_number,
-            "address": db_profile.address,
-            "birthdate": db_profile.birthdate,
-            "gender": db_profile.gender
-        })
+            "password": default_password,
+            "account_role": account_role,
+            "power_plant_id": power_plant_id,
+            "company_id": company_id,
+            "account_status": 'active'
+        }
+        profile_row = {
+            "account_id": account_id,
+            "emp_id": row.get('emp_id'),
+            "first_name": row['first_name'],
+            "last_name": row['last_name'],
+            "middle_name": row.get('middle_name'),
+            "suffix": row.get('suffix'),
+            "contact_number": contact_number,
+            "address": row.get('address'),
+            "birthdate": birthdate,
+            "gender": row.get('gender')
+        }
+        account_rows.append(account_row)
+        row_by_email[email] = i
+        profile_rows.append(profile_row)
+
 
-    # 6. If there are validation errors, return them without committing to DB
+    # 6. Reject emails that already have an account, then return all errors without committing
+    errors.extend(registered_email_errors(db, row_by_email))
     if errors:
         raise HTTPException(status_code=400, detail={"errors": errors})
 
-    db.commit()
-    return created
+    # Core executemany inserts skip the ORM unit of work for every row;
+    # very large uploads go through COPY instead. Both tables are written in one
+    # transaction, and a failure part-way rolls back the whole upload.
+    try:
+        with db.no_autoflush:
+            if len(account_rows) > COPY_THRESHOLD:
+                copy_rows(db, models.Account.__table__, account_rows)
+                copy_rows(db, models.UserProfile.__table__, profile_rows)
+            elif account_rows:
+                db.execute(models.Account.__table__.insert(), account_rows)
+                db.execute(models.UserProfile.__table__.insert(), profile_rows)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    # Starlette iterates sync generators on the threadpool, so rendering stays off the event loop
+    return StreamingResponse(
+        iter_account_list_json(account_rows, profile_rows),
+        status_code=status.HTTP_201_CREATED,
+        media_type="application/json"
+    )
 
 
 
+class _Echo:
+    """File-like object whose write() returns the line, so csv.writer can feed a generator."""
+    def write(self, value):
+        return value
+
+def iter_csv_lines(rows):
+    """Yield each row as an encoded CSV line, quoted the same way csv.DictWriter would."""
+    writer = csv.writer(_Echo())
+    for row in rows:
+        yield writer.writerow(row).encode()
+
 # Route to download CSV template for bulk account upload
 @router.get("/bulk/template", response_class=StreamingResponse)
 def download_bulk_template():
-    header = [
-        "email", "emp_id", "first_name", "last_name", "middle_name", "suffix",
-        "contact_number", "address", "birthdate", "gender"
-    ]
-    output = StringIO()
-    writer = csv.DictWriter(output, fieldnames=header)
-    writer.writeheader()
-    # Optional sample row
-    writer.writerow({
-        "email": "user@example.com",
-        "emp_id": "EMP001",
-        "first_name": "John",
-        "last_name": "Doe",
-        "middle_name": "A.",
-        "suffix": "Jr.",
-        "contact_number": "09123456789",
-        "address": "123 Main St",
-        "birthdate": "MM/DD/YYYY",
-        "gender": "Male, Female, Other"
-    })
-    output.seek(0)
+    # Header plus the sample row the upload endpoints recognise and skip
+    header = list(_TEMPLATE_SENTINELS)
+    sample_row = _TEMPLATE_SENTINELS
     return StreamingResponse(
-        BytesIO(output.getvalue().encode()),
+        iter_csv_lines([header, [sample_row[column] for column in header]]),
         media_type="text/csv",
         headers={"Content-Disposition": "attachment; filename=account_bulk_template.csv"}
     )
\ No newline at end of file
@@ -1,5 +1,6 @@
 from datetime import timedelta
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 from app.services.auth import (
@@ -24,8 +25,12 @@ async def login_for_access_token(
     """
     OAuth2 compatible token login, get an access token for future requests.
     """
-    user = AuthService.authenticate_user(form_data.username, form_data.password, db)
-    if not user:
+    user = AuthService.get_user(form_data.username, db)
+    # bcrypt verification is CPU-bound; run it in the threadpool so it does not
+    # block the event loop while other requests are waiting
+    if not user or not await run_in_threadpool(
+        AuthService.verify_password, form_data.password, user.hashed_password
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -94,7 +99,7 @@ async def update_session_activity(
         }
 
 @router.post("/logout")
-async def logout(
+def logout(
     token: str = Depends(oauth2_scheme),
     db: Session = Depends(get_db)
 ):
@@ -121,6 +126,7 @@ async def logout(
             
             # Then remove session
             active_sessions.pop(token, None)
+            AuthService.invalidate_cached_user(user.username)
             
             return {"message": "Successfully logged out"}
         else:
@@ -130,18 +136,19 @@ async def logout(
         return {"message": "Error during logout", "error": str(e)}
 
 @router.get("/me", response_model=User)
-async def read_users_me(
+def read_users_me(
     token: str = Depends(oauth2_scheme),
     db: Session = Depends(get_db)
 ):
     """
     Get current user information.
+    Declared sync so FastAPI runs the blocking user lookup in its threadpool.
     """
     current_user = AuthService.get_current_user(token, db)
     return AuthService.get_current_active_user(current_user)
 
 @router.post("/validate-token")
-async def validate_token(
+def validate_token(
     token: str = Depends(oauth2_scheme),
     db: Session = Depends(get_db)
 ):
@@ -1,239 +1,332 @@
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Query
 from sqlalchemy.orm import Session
 from sqlalchemy import text
-from typing import List, Dict, Optional
+from typing import List, Optional
 from decimal import Decimal
 import logging
-import traceback
 from datetime import datetime
 import pandas as pd
-from io import BytesIO
 from app.bronze.crud import insert_csr_activity, update_csr_activity, bulk_upload_csr_activity
-from fastapi.responses import StreamingResponse
+from app.bronze.schemas import CSRActivityIn
+from pydantic import ValidationError
+from fastapi.responses import Response, StreamingResponse
+from functools import lru_cache
 import openpyxl
 import io
 import math
+import os
 
 from ..dependencies import get_db
+from ..database import SessionLocal
 from ..auth_decorators import require_role, office_checker_only, get_current_user_with_roles, get_user_info
-from ..services.audit_trail import append_audit_trail
+from ..services.audit_trail import append_audit_trail, append_bulk_audit_trail
 from ..services.auth import User
+from ..utils.ttl_cache import TTLCache
+from ..utils.orjson_response import ORJSONResponse, iter_json_array
+from ..utils.excel_upload import EXCEL_ENGINE, integer_cells, numeric_cells, first_row_errors
+
+# Every endpoint, including the POST handlers' dict responses, renders with orjson
+router = APIRouter(default_response_class=ORJSONResponse)
+logger = logging.getLogger(__name__)
+
+# Programs and projects are reference data that rarely change; serve them from
+# memory for a few minutes instead of querying on every dashboard load
+reference_cache = TTLCache(ttl=int(os.getenv("CSR_REFERENCE_CACHE_TTL_SECONDS", "300")))
+# Let the browser reuse them for a minute as well, so repeat dashboard loads in
+# one session do not reach the API at all
+REFERENCE_CACHE_HEADERS = {"Cache-Control": "private, max-age=60"}
+
+# Filtered /activities results keyed by filter combination. The TTL is short because the
+# status column changes through the checker workflow; every write path in this
+# process (CSR inserts/updates and record status updates) clears it right away.
+activities_cache = TTLCache(ttl=int(os.getenv("CSR_ACTIVITIES_CACHE_TTL_SECONDS", "30")), maxsize=64)
+
+def fetch_rows(db: Session, statement, params: Optional[dict] = None) -> list:
+    """
+    Run a read-only query and return the connection to the pool before the caller
+    turns the rows into response dicts, so serialization doesn't hold a connection.
+    """
+    try:
+        return db.execute(statement, params or {}).all()
+    finally:
+        db.close()
+
+CSR_PROGRAMS_QUERY = text("""
+    SELECT 
+        program_id AS "programId",
+        program_name AS "programName",
+        date_created AS "dateCreated",
+        date_updated AS "dateUpdated"
+    FROM silver.csr_programs
+    WHERE (
+        program_id = 'HE'
+        OR program_id = 'ED'
+        OR program_id = 'LI'
+    )
+    ORDER BY program_name
+""")
 
-router = APIRouter()
-
-def create_excel_template(headers: List[str], filename: str) -> BytesIO:
-    """Create minimal Excel template with just headers and readable column widths"""
-    df = pd.DataFrame({header: [] for header in headers})
-    output = BytesIO()
-    with pd.ExcelWriter(output, engine='openpyxl') as writer:
-        df.to_excel(writer, index=False)
-        worksheet = writer.sheets['Sheet1']
-        
-        # Auto-adjust column widths to make headers readable
-        for column in worksheet.columns:
-            max_length = len(str(column[0].value)) + 2  # Header length + padding
-            worksheet.column_dimensions[column[0].column_letter].width = max_length
-    
-    output.seek(0)
-    return output
-
-@router.get("/programs", response_model=List[Dict])
+@router.get("/programs")
 def get_csr_programs(db: Session = Depends(get_db)):
     """
     Get all CSR programs
     Returns list of programs with their details
     """
     try:
-        logging.info("Executing CSR programs query")
-        
-        result = db.execute(text("""
-            SELECT 
-                program_id,
-                program_name,
-                date_created,
-                date_updated
-            FROM silver.csr_programs
-            WHERE (
-                program_id = 'HE'
-                OR program_id = 'ED'
-                OR program_id = 'LI'
-            )
-            ORDER BY program_name
-        """))
-        
-        data = [
-            {
-                'programId': row.program_id,
-                'programName': row.program_name,
-                'dateCreated': row.date_created.isoformat() if row.date_created else None,
-                'dateUpdated': row.date_updated.isoformat() if row.date_updated else None
-            }
-            for row in result
-        ]
+        logger.info("Executing CSR programs query")
+
+        def load_programs():
+            result = fetch_rows(db, CSR_PROGRAMS_QUERY)
+            return [row._asdict() for row in result]
+
+        data = reference_cache.get_or_set("programs", load_programs)
         
-        logging.info(f"Query returned {len(data)} CSR programs")
-        return data
+        logger.info("Query returned %d CSR programs", len(data))
+        # orjson writes the timestamps in the same ISO 8601 form isoformat() produced
+        return ORJSONResponse(data, headers=REFERENCE_CACHE_HEADERS)
 
     except Exception as e:
-        logging.error(f"Error fetching CSR programs: {str(e)}")
-        logging.error(traceback.format_exc())
+        logger.exception("Error fetching CSR programs: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
-@router.get("/projects", response_model=List[Dict])
+# Single statement for both the filtered and unfiltered listing, compiled once.
+# program_name is joined in rather than denormalized onto silver.csr_projects: the
+# silver tables are owned by the load procedures, and the listing is served from
+# reference_cache, so the join runs at most once per program filter per TTL.
+CSR_PROJECTS_QUERY = text("""
+    SELECT 
+        cp.project_id AS "projectId",
+        cp.program_id AS "programId",
+        pr.program_name AS "programName",
+        cp.project_name AS "projectName",
+        cp.project_metrics AS "projectMetrics",
+        cp.date_created AS "dateCreated",
+        cp.date_updated AS "dateUpdated"
+    FROM silver.csr_projects cp
+    JOIN silver.csr_programs pr ON cp.program_id = pr.program_id
+    WHERE LEFT(cp.project_id, 2) IN ('HE', 'ED', 'LI')
+        AND (CAST(:program_id AS text) IS NULL OR cp.program_id = :program_id)
+    ORDER BY pr.program_name, cp.project_name
+""")
+
+@router.get("/projects")
 def get_csr_projects(program_id: Optional[str] = None, db: Session = Depends(get_db)):
     """
     Get CSR projects, optionally filtered by program_id
     Returns list of projects with their program information
     """
     try:
-        logging.info(f"Executing CSR projects query with program_id filter: {program_id}")
-        
-        where_clause = ""
-        params = {}
-        
-        if program_id:
-            where_clause = "WHERE cp.program_id = :program_id"
-            params['program_id'] = program_id
+        logger.info("Executing CSR projects query with program_id filter: %s", program_id)
         
-        result = db.execute(text(f"""
-            SELECT 
-                cp.program_id,
-                pr.program_name,
-                cp.project_id,
-                cp.project_name,
-                cp.project_metrics,
-                cp.date_created,
-                cp.date_updated
-            FROM silver.csr_projects cp
-            JOIN silver.csr_programs pr ON cp.program_id = pr.program_id
-            {where_clause} AND (
-                cp.project_id LIKE 'HE%'
-                OR cp.project_id LIKE 'ED%'
-                OR cp.project_id LIKE 'LI%'
-            )
-            ORDER BY pr.program_name, cp.project_name
-        """), params)
-
-        data = [
-            {
-                'projectId': row.project_id,
-                'programId': row.program_id,
-                'programName': row.program_name,
-                'projectName': row.project_name,
-                'projectMetrics': row.project_metrics,
-                'dateCreated': row.date_created.isoformat() if row.date_created else None,
-                'dateUpdated': row.date_updated.isoformat() if row.date_updated else None
-            }
-            for row in result
-        ]
-        
-        logging.info(f"Query returned {len(data)} CSR projects")
-        return data
+        def load_projects():
+            result = fetch_rows(db, CSR_PROJECTS_QUERY, {'program_id': program_id or None})
+            return [row._asdict() for row in result]
+
+        data = reference_cache.get_or_set(("projects", program_id or None), load_projects)
+
+        logger.info("Query returned %d CSR projects", len(data))
+        return ORJSONResponse(data, headers=REFERENCE_CACHE_HEADERS)
         
     except Exception as e:
-        logging.error(f"Error fetching CSR projects: {str(e)}")
-        logging.error(traceback.format_exc())
+        logger.exception("Error fetching CSR projects: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
-@router.get("/activities", response_model=List[Dict])
+# Read from the base tables rather than a materialized view: the status column
+# comes from public.record_status, which the checker workflow updates from several
+# routers, and reviewers expect a status change to show up here immediately
+# (the endpoint's activities_cache is cleared on those writes).
+# Optional filters are "(:param IS NULL OR ...)" so there is a single statement for
+# every filter combination and SQLAlchemy compiles it once. HELP projects are
+# selected with one LEFT(project_id, 2) expression so an index on it can serve it.
+# The status is the latest record_status row for each activity, picked with a
+# LATERAL lookup so a record with several status rows is still listed once.
+# Columns come back already named, defaulted and labelled for the response, so the
+# rows can be serialized as-is.
+CSR_ACTIVITIES_SELECT = """
+    SELECT 
+        ca.csr_id AS "csrId",
+        ca.company_id AS "companyId",
+        cm.company_name AS "companyName",
+        cp.program_id AS "programId",
+        pr.program_name AS "programName",
+        ca.project_id AS "projectId",
+        cp.project_name AS "projectName",
+        ca.project_year AS "projectYear",
+        COALESCE(ca.csr_report::float8, 0) AS "csrReport",
+        COALESCE(ca.project_expenses::float8, 0) AS "projectExpenses",
+        ca.project_remarks AS "projectRemarks",
+        rs.remarks AS "statusRemarks",
+        CASE rs.status_id
+            WHEN 'APP' THEN 'Approved'
+            WHEN 'FRS' THEN 'For Revision (Site)'
+            WHEN 'FRH' THEN 'For Revision (Head)'
+            WHEN 'URS' THEN 'Under Review (Site)'
+            WHEN 'URH' THEN 'Under Review (Head)'
+            ELSE rs.status_id
+        END AS "statusId"
+    FROM silver.csr_activity ca
+    JOIN ref.company_main cm ON ca.company_id = cm.company_id
+    JOIN silver.csr_projects cp ON ca.project_id = cp.project_id
+    JOIN silver.csr_programs pr ON cp.program_id = pr.program_id
+    JOIN LATERAL (
+        SELECT status_id, remarks
+        FROM public.record_status
+        WHERE record_id = ca.csr_id
+        ORDER BY status_timestamp DESC
+        LIMIT 1
+    ) rs ON TRUE
+    WHERE LEFT(ca.project_id, 2) IN ('HE', 'ED', 'LI')
+        AND (CAST(:year AS integer) IS NULL OR ca.project_year = :year)
+        AND (CAST(:company_id AS text) IS NULL OR ca.company_id = :company_id)
+        AND (CAST(:program_id AS text) IS NULL OR cp.program_id = :program_id)
+"""
+
+CSR_ACTIVITIES_QUERY = text(CSR_ACTIVITIES_SELECT + """
+    ORDER BY rs.status_id DESC
+""")
+
+# Paginated listing: keyset on (csr_report DESC, csr_id DESC) so later pages seek
+# past the previous one instead of scanning and discarding an OFFSET
+CSR_ACTIVITIES_PAGE_QUERY = text(CSR_ACTIVITIES_SELECT + """
+        AND (CAST(:cursor_report AS numeric) IS NULL
+            OR (COALESCE(ca.csr_report, 0), ca.csr_id) < (CAST(:cursor_report AS numeric), :cursor_id))
+    ORDER BY COALESCE(ca.csr_report, 0) DESC, ca.csr_id DESC
+    LIMIT :limit
+""")
+
+def parse_activities_cursor(cursor: Optional[str]) -> tuple:
+    """Split a "<csr_report>:<csr_id>" cursor from a previous page into its keyset values."""
+    if not cursor:
+        return None, None
+    report, _, csr_id = cursor.partition(":")
+    try:
+        return Decimal(report), csr_id
+    except ArithmeticError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+# The unfiltered listing grows with the table, so it is read through a server-side
+# cursor and streamed in batches instead of being built as one list in memory
+# yield_per turns on the server-side cursor and fetches exactly one batch per round
+# trip, instead of stream_results' default buffer that starts at a few rows and grows
+CSR_ACTIVITIES_STREAM_BATCH_SIZE = 1000
+CSR_ACTIVITIES_STREAM_QUERY = CSR_ACTIVITIES_QUERY.execution_options(yield_per=CSR_ACTIVITIES_STREAM_BATCH_SIZE)
+
+def stream_csr_activities(params: dict):
+    """Yield the activities listing as JSON array chunks, one cursor batch at a time."""
+    # The request's session may be closed before the body is sent, so the stream
+    # owns its session for as long as the cursor is open
+    db = SessionLocal()
+    try:
+        result = db.execute(CSR_ACTIVITIES_STREAM_QUERY, params)
+        batches = (
+            [row._asdict() for row in partition]
+            for partition in result.partitions(CSR_ACTIVITIES_STREAM_BATCH_SIZE)
+        )
+        yield from iter_json_array(batches)
+    except Exception as e:
+        logger.error("Error streaming CSR activities: %s", e)
+        raise
+    finally:
+        db.close()
+
+@router.get("/activities")
 def get_csr_activities(
     year: Optional[int] = None,
     company_id: Optional[str] = None,
     program_id: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
     """
     Get CSR activities with optional filters
-    Returns list of activities with company, project, and program information
+    Returns list of activities with company, project, and program information.
+    With limit, returns one page as {"data", "next_cursor"}; pass next_cursor back
+    as cursor for the following page.
     """
     try:
-        logging.info(f"Executing CSR activities query with filters - year: {year}, company_id: {company_id}, program_id: {program_id}")
+        logger.info("Executing CSR activities query with filters - year: %s, company_id: %s, program_id: %s", year, company_id, program_id)
         
-        where_conditions = []
-        params = {}
-        
-        if year:
-            where_conditions.append("ca.project_year = :year")
-            params['year'] = year
-            
-        if company_id:
-            where_conditions.append("ca.company_id = :company_id")
-            params['company_id'] = company_id
-            
-        if program_id:
-            where_conditions.append("cp.program_id = :program_id")
-            params['program_id'] = program_id
-        
-        where_clause = ""
-        if where_conditions:
-            where_clause = "WHERE " + " AND ".join(where_conditions)
-
-        result = db.execute(text(f"""
-            SELECT 
-                ca.csr_id,
-                ca.company_id,
-                cm.company_name,
-                ca.project_id,
-                cp.project_name,
-                cp.program_id,
-                pr.program_name,
-                ca.project_year,
-                ROUND(ca.csr_report::numeric, 2) as csr_report,
-                ROUND(ca.project_expenses::numeric, 2) as project_expenses,
-                rs.status_id,
-                rs.remarks,
-                ca.project_remarks,
-                ca.date_created,
-                ca.date_updated
-            FROM silver.csr_activity ca
-            JOIN ref.company_main cm ON ca.company_id = cm.company_id
-            JOIN silver.csr_projects cp ON ca.project_id = cp.project_id
-            JOIN silver.csr_programs pr ON cp.program_id = pr.program_id
-            JOIN public.record_status rs ON ca.csr_id = rs.record_id
-            {where_clause} AND
-                (
-                    ca.project_id LIKE 'HE%' 
-                    OR ca.project_id LIKE 'ED%' 
-                    OR ca.project_id LIKE 'LI%'
-                )
-            ORDER BY rs.status_id DESC
-        """), params)
-
-        data = [
-            {
-                'csrId': row.csr_id,
-                'companyId': row.company_id,
-                'companyName': row.company_name,
-                'programId': row.program_id,
-                'programName': row.program_name,
-                'projectId': row.project_id,
-                'projectName': row.project_name,
-                'projectYear': row.project_year,
-                'csrReport': float(row.csr_report) if row.csr_report else 0,
-                'projectExpenses': float(row.project_expenses) if row.project_expenses else 0,
-                'projectRemarks': row.project_remarks,
-                'statusRemarks': row.remarks,
-                'statusId': (
-                    "Approved" if row.status_id == "APP"
-                    else "For Revision (Site)" if row.status_id == "FRS"
-                    else "For Revision (Head)" if row.status_id == "FRH"
-                    else "Under Review (Site)" if row.status_id == "URS"
-                    else "Under Review (Head)" if row.status_id == "URH"
-                    else row.status_id
-                ),
-            }
-            for row in result
-        ]
-
-        logging.info(f"Query returned {len(data)} CSR activities")
-        return data
+        params = {
+            'year': year or None,
+            'company_id': company_id or None,
+            'program_id': program_id or None,
+        }
+
+        # Pagination is opt-in so existing clients still receive the full list
+        if limit is not None:
+            cursor_report, cursor_id = parse_activities_cursor(cursor)
+            data = [row._asdict() for row in fetch_rows(db, CSR_ACTIVITIES_PAGE_QUERY, {
+                **params,
+                'cursor_report': cursor_report,
+                'cursor_id': cursor_id,
+                'limit': limit,
+            })]
+            # csrReport is the float8 of csr_report, which round-trips to the stored
+            # numeric (whole beneficiary counts), so it is the exact sort key
+            next_cursor = f"{data[-1]['csrReport']}:{data[-1]['csrId']}" if len(data) == limit else None
+            return ORJSONResponse({"data": data, "next_cursor": next_cursor})
+
+        if not any(params.values()):
+            return StreamingResponse(stream_csr_activities(params), media_type="application/json")
+
+        def load_activities():
+            return [row._asdict() for row in fetch_rows(db, CSR_ACTIVITIES_QUERY, params)]
+
+        data = activities_cache.get_or_set(
+            (params['year'], params['company_id'], params['program_id']), load_activities
+        )
+
+        logger.info("Query returned %d CSR activities", len(data))
+        # Returned directly so FastAPI skips jsonable_encoder and response validation;
+        # the amounts arrive as floats (::float8), so orjson writes every value natively
+        return ORJSONResponse(data)
         
+    except HTTPException:
+        raise
     except Exception as e:
-        logging.error(f"Error fetching CSR activities: {str(e)}")
-        logging.error(traceback.format_exc())
+        logger.exception("Error fetching CSR activities: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
-@router.get("/activities-specific", response_model=Dict)
+CSR_ACTIVITY_DETAIL_QUERY = text("""
+    SELECT 
+        ca.csr_id AS "csrId",
+        ca.company_id AS "companyId",
+        cm.company_name AS "companyName",
+        cp.program_id AS "programId",
+        pr.program_name AS "programName",
+        ca.project_id AS "projectId",
+        cp.project_name AS "projectName",
+        ca.project_year AS "projectYear",
+        COALESCE(ca.csr_report::float8, 0) AS "csrReport",
+        COALESCE(ca.project_expenses::float8, 0) AS "projectExpenses",
+        ca.project_remarks AS "projectRemarks",
+        csl.remarks AS "statusRemarks",
+        -- Display labels for the single-activity view; URH reads "Head Level" here
+        CASE csl.status_id
+            WHEN 'APP' THEN 'Approved'
+            WHEN 'FRS' THEN 'For Revision (Site)'
+            WHEN 'FRH' THEN 'For Revision (Head)'
+            WHEN 'URS' THEN 'Under Review (Site)'
+            WHEN 'URH' THEN 'Under Review (Head Level)'
+            ELSE csl.status_id
+        END AS "statusId"
+    FROM silver.csr_activity ca
+    JOIN ref.company_main cm ON ca.company_id = cm.company_id
+    JOIN silver.csr_projects cp ON ca.project_id = cp.project_id
+    JOIN silver.csr_programs pr ON cp.program_id = pr.program_id
+    JOIN LATERAL (
+        SELECT status_id, remarks
+        FROM public.record_status
+        WHERE record_id = ca.csr_id
+        ORDER BY status_timestamp DESC
+        LIMIT 1
+    ) csl ON TRUE
+    WHERE ca.csr_id = :csr_id
+    LIMIT 1
+""")
+
+@router.get("/activities-specific")
 def get_csr_activity_specific(
     csr_id: str = Query(..., alias="csrId"),
     db: Session = Depends(get_db)
@@ -242,66 +335,62 @@ def get_csr_activity_specific(
     Get a single CSR activity by project_id
     """
     try:
-        result = db.execute(text("""
-            SELECT 
-                ca.csr_id,
-                ca.company_id,
-                cm.company_name,
-                ca.project_id,
-                cp.project_name,
-                cp.program_id,
-                pr.program_name,
-                ca.project_year,
-                ROUND(ca.csr_report::numeric, 2) as csr_report,
-                ROUND(ca.project_expenses::numeric, 2) as project_expenses,
-                csl.status_id,
-                csl.remarks,
-                ca.project_remarks,
-                ca.date_created,
-                ca.date_updated
-            FROM silver.csr_activity ca
-            JOIN ref.company_main cm ON ca.company_id = cm.company_id
-            JOIN silver.csr_projects cp ON ca.project_id = cp.project_id
-            JOIN silver.csr_programs pr ON cp.program_id = pr.program_id
-            JOIN public.record_status csl ON ca.csr_id = csl.record_id
-            WHERE ca.csr_id = :csr_id
-            LIMIT 1
-        """), {"csr_id": csr_id})
-
-        row = result.fetchone()
+        result = fetch_rows(db, CSR_ACTIVITY_DETAIL_QUERY, {"csr_id": csr_id})
+
+        row = result[0] if result else None
         if not row:
             raise HTTPException(status_code=404, detail="CSR activity not found")
 
-        data = {
-            'csrId': row.csr_id,
-            'companyId': row.company_id,
-            'companyName': row.company_name,
-            'programId': row.program_id,
-            'programName': row.program_name,
-            'projectId': row.project_id,
-            'projectName': row.project_name,
-            'projectYear': row.project_year,
-            'csrReport': float(row.csr_report) if row.csr_report else 0,
-            'projectExpenses': float(row.project_expenses) if row.project_expenses else 0,
-            'projectRemarks': row.project_remarks,
-            'statusRemarks': row.remarks,
-            'statusId': (
-                "Approved" if row.status_id == "APP"
-                else "For Revision (Site)" if row.status_id == "FRS"
-                else "For Revision (Head)" if row.status_id == "FRH"
-                else "Under Review (Site)" if row.status_id == "URS"
-                else "Under Review (Head Level)" if row.status_id == "URH"
-                else row.status_id
-            ),
-        }
-        return data
+        return ORJSONResponse(row._asdict())
 
     except Exception as e:
-        logging.error(f"Error fetching CSR activity: {str(e)}")
+        logger.error("Error fetching CSR activity: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
-@router.get("/help-report", response_model=List[Dict])
-def get_csr_activities(
+# HELP report statements. Every variant keeps HELP projects with approved records;
+# optional filters use "(:param IS NULL OR ...)" so each is a single static statement.
+HELP_REPORT_TOTALS_QUERY = text("""
+    SELECT 
+        ca.project_id AS "projectId",
+        cp.project_name AS "projectName",
+        COALESCE(SUM(csr_report), 0)::float8 AS "csrReport"
+    FROM silver.csr_activity ca
+    JOIN ref.company_main cm ON ca.company_id = cm.company_id
+    JOIN silver.csr_projects cp ON ca.project_id = cp.project_id
+    JOIN silver.csr_programs pr ON cp.program_id = pr.program_id
+    JOIN public.record_status rs ON ca.csr_id = rs.record_id
+    WHERE project_year >= 2024
+    AND LEFT(ca.project_id, 2) IN ('HE', 'ED', 'LI')
+    AND rs.status_id = 'APP'
+    GROUP BY ca.project_id, cp.project_name
+""")
+
+HELP_REPORT_QUERY = text("""
+    SELECT 
+        ca.company_id AS "companyId",
+        cm.company_name AS "companyName",
+        cp.program_id AS "programId",
+        pr.program_name AS "programName",
+        ca.project_id AS "projectId",
+        cp.project_name AS "projectName",
+        ca.project_year AS "projectYear",
+        COALESCE(SUM(csr_report), 0)::float8 AS "csrReport",
+        COALESCE(ca.project_expenses::float8, 0) AS "projectExpenses"
+    FROM silver.csr_activity ca
+    JOIN ref.company_main cm ON ca.company_id = cm.company_id
+    JOIN silver.csr_projects cp ON ca.project_id = cp.project_id
+    JOIN silver.csr_programs pr ON cp.program_id = pr.program_id
+    JOIN public.record_status rs ON ca.csr_id = rs.record_id
+    WHERE LEFT(ca.project_id, 2) IN ('HE', 'ED', 'LI')
+        AND rs.status_id = 'APP'
+        AND (CAST(:year AS integer) IS NULL OR ca.project_year = :year)
+        AND (CAST(:company_id AS text) IS NULL OR ca.company_id = :company_id)
+    GROUP BY ca.company_id, cm.company_name, ca.project_id, cp.project_name, cp.program_id, pr.program_name, project_year, ca.project_expenses
+    ORDER BY project_year
+""")
+
+@router.get("/help-report")
+def get_help_report(
     year: Optional[int] = None,
     company_id: Optional[str] = None,
     # program_id: Optional[str] = None,
@@ -312,113 +401,50 @@ def get_csr_activities(
     Returns list of activities with company, project, and program information
     """
     try:
-        logging.info(f"Executing CSR activities query with filters - year: {year}, company_id: {company_id}")
+        logger.info("Executing CSR activities query with filters - year: %s, company_id: %s", year, company_id)
         
         if not year and not company_id:
-            where_conditions = []
-            params = {}
-                
-            if company_id:
-                where_conditions.append("ca.company_id = :company_id")
-                params['company_id'] = company_id
-            
-            where_clause = ""
-            if where_conditions:
-                where_clause = "WHERE " + " AND ".join(where_conditions) + " AND (ca.project_id LIKE 'HE%' OR ca.project_id LIKE 'ED%' OR ca.project_id LIKE 'LI%') AND rs.status_id = 'APP'"
-            else:
-                where_clause = "WHERE (ca.project_id LIKE 'HE%' OR ca.project_id LIKE 'ED%' OR ca.project_id LIKE 'LI%') AND rs.status_id = 'APP'"
-
-            result = db.execute(text(f"""
-                SELECT 
-                    ca.project_id,
-                    cp.project_name,
-                    SUM(csr_report) AS total_csr_report
-                FROM silver.csr_activity ca
-                JOIN ref.company_main cm ON ca.company_id = cm.company_id
-                JOIN silver.csr_projects cp ON ca.project_id = cp.project_id
-                JOIN silver.csr_programs pr ON cp.program_id = pr.program_id
-                JOIN public.record_status rs ON ca.csr_id = rs.record_id
-                WHERE project_year >= 2024
-                AND (ca.project_id LIKE 'HE%' OR ca.project_id LIKE 'ED%' OR ca.project_id LIKE 'LI%')
-                AND rs.status_id = 'APP'
-                GROUP BY ca.project_id, cp.project_name
-            """), params)
-
-            data = [
-                {
-                    'projectId': row.project_id,
-                    'projectName': row.project_name,
-                    'csrReport': float(row.total_csr_report) if row.total_csr_report else 0,
-                }
-                for row in result
-            ]
-
+            result = fetch_rows(db, HELP_REPORT_TOTALS_QUERY)
         else:
-            where_conditions = []
-            params = {}
-            
-            if year:
-                where_conditions.append("ca.project_year = :year")
-                params['year'] = year
-                
-            if company_id:
-                where_conditions.append("ca.company_id = :company_id")
-                params['company_id'] = company_id
-            
-            where_clause = ""
-            if where_conditions:
-                where_clause = "WHERE " + " AND ".join(where_conditions) + " AND (ca.project_id LIKE 'HE%' OR ca.project_id LIKE 'ED%' OR ca.project_id LIKE 'LI%') AND rs.status_id = 'APP'"
-            else:
-                where_clause = "WHERE (ca.project_id LIKE 'HE%' OR ca.project_id LIKE 'ED%' OR ca.project_id LIKE 'LI%') AND rs.status_id = 'APP'"
-            
-            print(where_clause)
-            result = db.execute(text(f"""
-                SELECT 
-                    ca.company_id,
-                    cm.company_name,
-                    ca.project_id,
-                    cp.project_name,
-                    cp.program_id,
-                    pr.program_name,
-                    ca.project_year,
-                    SUM(csr_report) AS csr_report,
-                    ROUND(ca.project_expenses::numeric, 2) as project_expenses
-                FROM silver.csr_activity ca
-                JOIN ref.company_main cm ON ca.company_id = cm.company_id
-                JOIN silver.csr_projects cp ON ca.project_id = cp.project_id
-                JOIN silver.csr_programs pr ON cp.program_id = pr.program_id
-                JOIN public.record_status rs ON ca.csr_id = rs.record_id
-                {where_clause}
-                GROUP BY ca.company_id, cm.company_name, ca.project_id, cp.project_name, cp.program_id, pr.program_name, project_year, ca.project_expenses
-                ORDER BY project_year
-            """), params)
-
-            data = [
-                {
-                    'companyId': row.company_id,
-                    'companyName': row.company_name,
-                    'programId': row.program_id,
-                    'programName': row.program_name,
-                    'projectId': row.project_id,
-                    'projectName': row.project_name,
-                    'projectYear': row.project_year,
-                    'csrReport': float(row.csr_report) if row.csr_report else 0,
-                    'projectExpenses': float(row.project_expenses) if row.project_expenses else 0,
-                }
-                for row in result
-            ]
-            print(data)
-
-        logging.info(f"Query returned {len(data)} CSR activities")
-        return data
+            result = fetch_rows(db, HELP_REPORT_QUERY, {
+                'year': year or None,
+                'company_id': company_id or None,
+            })
+
+        data = [row._asdict() for row in result]
+
+        logger.info("Query returned %d CSR activities", len(data))
+        # Columns are already labelled and defaulted in SQL, so rows serialize as-is
+        return ORJSONResponse(data)
         
     except Exception as e:
-        logging.error(f"Error fetching CSR activities: {str(e)}")
-        logging.error(traceback.format_exc())
+        logger.exception("Error fetching CSR activities: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
-@router.get("/investments-per-project", response_model=List[Dict])
-def get_help_investments(
+HELP_INVESTMENTS_PER_PROJECT_QUERY = text("""
+    SELECT 
+        cproj.project_name AS "projectName",
+        COALESCE(SUM(cact.project_expenses), 0)::float8 AS "projectExpenses"
+    FROM silver.csr_activity AS cact
+    LEFT JOIN silver.csr_projects AS cproj
+    ON cact.project_id = cproj.project_id
+    LEFT JOIN public.record_status csl 
+    ON cact.csr_id = csl.record_id
+    LEFT JOIN ref.company_main AS comp
+    ON cact.company_id = comp.company_id
+    WHERE LEFT(cact.project_id, 2) IN ('HE', 'ED', 'LI')
+        AND csl.status_id = 'APP'
+        AND (CAST(:year AS integer) IS NULL OR cact.project_year = :year)
+        AND (CAST(:company_id AS text) IS NULL OR cact.company_id = :company_id)
+    GROUP BY 
+        cact.project_id,
+        cproj.project_name
+    ORDER BY 
+        SUM(cact.project_expenses) DESC
+""")
+
+@router.get("/investments-per-project")
+def get_help_investments_per_project(
     year: Optional[int] = None,
     company_id: Optional[str] = None,
     program_id: Optional[str] = None,
@@ -429,67 +455,47 @@ def get_help_investments(
     Returns list of expenses per company, project, and program
     """
     try:
-        logging.info(f"Executing CSR investments query with filters - year: {year}, company_id: {company_id}, program_id: {program_id}")
-        
-        where_conditions = []
-        params = {}
-        
-        if year:
-            where_conditions.append("cact.project_year = :year")
-            params['year'] = year
-            
-        if company_id:
-            where_conditions.append("cact.company_id = :company_id")
-            params['company_id'] = company_id
-            
-        # if program_id:
-        #     where_conditions.append("cp.program_id = :program_id")
-        #     params['program_id'] = program_id
+        logger.info("Executing CSR investments query with filters - year: %s, company_id: %s, program_id: %s", year, company_id, program_id)
         
-        where_clause = ""
-        if where_conditions:
-            where_clause = "WHERE " + " AND ".join(where_conditions) + " AND (cact.project_id LIKE 'HE%' OR cact.project_id LIKE 'ED%' OR cact.project_id LIKE 'LI%') AND csl.status_id = 'APP'"
-        else:
-            where_clause = "WHERE (cact.project_id LIKE 'HE%' OR cact.project_id LIKE 'ED%' OR cact.project_id LIKE 'LI%') AND csl.status_id = 'APP'"
-
-        result = db.execute(text(f"""
-            SELECT 
-                cact.project_id,
-                cproj.project_name,
-                SUM(cact.project_expenses) AS "project_investments"
-            FROM silver.csr_activity AS cact
-            LEFT JOIN silver.csr_projects AS cproj
-            ON cact.project_id = cproj.project_id
-            LEFT JOIN public.record_status csl 
-            ON cact.csr_id = csl.record_id
-            LEFT JOIN ref.company_main AS comp
-            ON cact.company_id = comp.company_id
-            {where_clause}
-            GROUP BY 
-                cact.project_id,
-                cproj.project_name
-            ORDER BY 
-                project_investments DESC;
-        """), params)
-
-        data = [
-            {
-                'projectName': row.project_name,
-                'projectExpenses': float(row.project_investments) if row.project_investments else 0
-            }
-            for row in result
-        ]
-
-        logging.info(f"Query returned {len(data)} CSR activities")
-        return data
+        # program_id is accepted for the dashboard's shared filter bar but not applied
+        result = fetch_rows(db, HELP_INVESTMENTS_PER_PROJECT_QUERY, {
+            'year': year or None,
+            'company_id': company_id or None,
+        })
+
+        data = [row._asdict() for row in result]
+
+        logger.info("Query returned %d CSR activities", len(data))
+        return ORJSONResponse(data)
         
     except Exception as e:
-        logging.error(f"Error fetching CSR activities: {str(e)}")
-        logging.error(traceback.format_exc())
+        logger.exception("Error fetching CSR activities: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
-@router.get("/investments-per-program", response_model=List[Dict])
-def get_help_investments(
+HELP_INVESTMENTS_PER_PROGRAM_QUERY = text("""
+    SELECT 
+        cprog.program_name AS "programName",
+        COALESCE(SUM(project_expenses), 0)::float8 AS "projectExpenses",
+        cact.date_updated AS "dateUpdated"
+    FROM silver.csr_activity AS cact
+    LEFT JOIN silver.csr_projects AS cproj
+    ON cact.project_id = cproj.project_id
+    LEFT JOIN silver.csr_programs AS cprog
+    ON cproj.program_id = cprog.program_id
+    LEFT JOIN public.record_status csl 
+    ON cact.csr_id = csl.record_id
+    LEFT JOIN ref.company_main AS ccomp
+    ON cact.company_id = ccomp.company_id
+    WHERE LEFT(cact.project_id, 2) IN ('HE', 'ED', 'LI')
+        AND csl.status_id = 'APP'
+        AND (CAST(:year AS integer) IS NULL OR cact.project_year = :year)
+        AND (CAST(:company_id AS text) IS NULL OR cact.company_id = :company_id)
+    GROUP BY cprog.program_name, cact.date_updated
+    ORDER BY SUM(project_expenses)
+""")
+
+@router.get("/investments-per-program")
+def get_help_investments_per_program(
     year: Optional[int] = None,
     company_id: Optional[str] = None,
     program_id: Optional[str] = None,
@@ -500,67 +506,45 @@ def get_help_investments(
     Returns list of expenses per company, project, and program
     """
     try:
-        logging.info(f"Executing CSR investments query with filters - year: {year}, company_id: {company_id}, program_id: {program_id}")
-        
-        where_conditions = []
-        params = {}
+        logger.info("Executing CSR investments query with filters - year: %s, company_id: %s, program_id: %s", year, company_id, program_id)
         
-        if year:
-            where_conditions.append("cact.project_year = :year")
-            params['year'] = year
-            
-        if company_id:
-            where_conditions.append("cact.company_id = :company_id")
-            params['company_id'] = company_id
-            
-        # if program_id:
-        #     where_conditions.append("cp.program_id = :program_id")
-        #     params['program_id'] = program_id
-        
-        where_clause = ""
-        if where_conditions:
-            where_clause = "WHERE " + " AND ".join(where_conditions) + " AND (cact.project_id LIKE 'HE%' OR cact.project_id LIKE 'ED%' OR cact.project_id LIKE 'LI%') AND csl.status_id = 'APP'"
-        else:
-            where_clause = "WHERE (cact.project_id LIKE 'HE%' OR cact.project_id LIKE 'ED%' OR cact.project_id LIKE 'LI%') AND csl.status_id = 'APP'"
-
-        result = db.execute(text(f"""
-            SELECT 
-                cprog.program_name,
-                SUM(project_expenses) AS "project_investments",
-                cact.date_updated
-            FROM silver.csr_activity AS cact
-            LEFT JOIN silver.csr_projects AS cproj
-            ON cact.project_id = cproj.project_id
-            LEFT JOIN silver.csr_programs AS cprog
-            ON cproj.program_id = cprog.program_id
-            LEFT JOIN public.record_status csl 
-            ON cact.csr_id = csl.record_id
-            LEFT JOIN ref.company_main AS ccomp
-            ON cact.company_id = ccomp.company_id
-            {where_clause}
-            GROUP BY cprog.program_name, cact.date_updated
-            ORDER BY "project_investments"
-        """), params)
-
-        data = [
-            {
-                'programName': row.program_name,
-                'projectExpenses': float(row.project_investments) if row.project_investments else 0,
-                'dateUpdated': row.date_updated
-            }
-            for row in result
-        ]
-
-        logging.info(f"Query returned {len(data)} CSR activities")
-        return data
+        # program_id is accepted for the dashboard's shared filter bar but not applied
+        result = fetch_rows(db, HELP_INVESTMENTS_PER_PROGRAM_QUERY, {
+            'year': year or None,
+            'company_id': company_id or None,
+        })
+
+        data = [row._asdict() for row in result]
+
+        logger.info("Query returned %d CSR activities", len(data))
+        return ORJSONResponse(data)
         
     except Exception as e:
-        logging.error(f"Error fetching CSR activities: {str(e)}")
-        logging.error(traceback.format_exc())
+        logger.exception("Error fetching CSR activities: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
-@router.get("/investments-per-company", response_model=List[Dict])
-def get_help_investments(
+HELP_INVESTMENTS_PER_COMPANY_QUERY = text("""
+    SELECT 
+        ccomp.company_id AS "companyId",
+        COALESCE(SUM(project_expenses), 0)::float8 AS "projectExpenses"
+    FROM silver.csr_activity AS cact
+    LEFT JOIN silver.csr_projects AS cproj
+    ON cact.project_id = cproj.project_id
+    LEFT JOIN silver.csr_programs AS cprog
+    ON cproj.program_id = cprog.program_id
+    LEFT JOIN public.record_status csl 
+    ON cact.csr_id = csl.record_id
+    LEFT JOIN ref.company_main AS ccomp
+    ON cact.company_id = ccomp.company_id
+    WHERE LEFT(cact.project_id, 2) IN ('HE', 'ED', 'LI')
+        AND csl.status_id = 'APP'
+        AND (CAST(:year AS integer) IS NULL OR cact.project_year = :year)
+    GROUP BY ccomp.company_id
+    ORDER BY SUM(project_expenses) DESC
+""")
+
+@router.get("/investments-per-company")
+def get_help_investments_per_company(
     year: Optional[int] = None,
     company_id: Optional[str] = None,
     program_id: Optional[str] = None,
@@ -571,116 +555,97 @@ def get_help_investments(
     Returns list of expenses per company, project, and program
     """
     try:
-        logging.info(f"Executing CSR investments query with filters - year: {year}, company_id: {company_id}, program_id: {program_id}")
-        
-        where_conditions = []
-        params = {}
-        
-        if year:
-            where_conditions.append("cact.project_year = :year")
-            params['year'] = year
-            
-        # if company_id:
-        #     where_conditions.append("cact.company_id = :company_id")
-        #     params['company_id'] = company_id
-            
-        # if program_id:
-        #     where_conditions.append("cp.program_id = :program_id")
-        #     params['program_id'] = program_id
+        logger.info("Executing CSR investments query with filters - year: %s, company_id: %s, program_id: %s", year, company_id, program_id)
         
-        where_clause = ""
-        if where_conditions:
-            where_clause = "WHERE " + " AND ".join(where_conditions) + " AND (cact.project_id LIKE 'HE%' OR cact.project_id LIKE 'ED%' OR cact.project_id LIKE 'LI%') AND csl.status_id = 'APP'"
-        else:
-            where_clause = "WHERE (cact.project_id LIKE 'HE%' OR cact.project_id LIKE 'ED%' OR cact.project_id LIKE 'LI%') AND csl.status_id = 'APP'"
-
-        result = db.execute(text(f"""
-            SELECT 
-                ccomp.company_id,
-                SUM(project_expenses) AS "project_investments"
-            FROM silver.csr_activity AS cact
-            LEFT JOIN silver.csr_projects AS cproj
-            ON cact.project_id = cproj.project_id
-            LEFT JOIN silver.csr_programs AS cprog
-            ON cproj.program_id = cprog.program_id
-            LEFT JOIN public.record_status csl 
-            ON cact.csr_id = csl.record_id
-            LEFT JOIN ref.company_main AS ccomp
-            ON cact.company_id = ccomp.company_id
-            {where_clause}
-            GROUP BY ccomp.company_id
-            ORDER BY "project_investments" DESC
-        """), params)
-
-        data = [
-            {
-                'companyId': row.company_id,
-                'projectExpenses': float(row.project_investments) if row.project_investments else 0
-            }
-            for row in result
-        ]
-
-        logging.info(f"Query returned {len(data)} CSR activities")
-        return data
+        # Broken down by company, so only the year filter applies
+        result = fetch_rows(db, HELP_INVESTMENTS_PER_COMPANY_QUERY, {'year': year or None})
+
+        data = [row._asdict() for row in result]
+
+        logger.info("Query returned %d CSR activities", len(data))
+        return ORJSONResponse(data)
         
     except Exception as e:
-        logging.error(f"Error fetching CSR activities: {str(e)}")
-        logging.error(traceback.format_exc())
+        logger.exception("Error fetching CSR activities: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 # ----------------------- POST METHODS ----------------------------
 
-@router.post("/activities-update")
-def update_csr_activity_single(data: dict, db: Session = Depends(get_db), user_info: User = Depends(get_user_info)):
+# Messages for the first invalid field of an activity body, as the frontend expects them
+CSR_ACTIVITY_FIELD_ERRORS = {
+    "company_id": "Invalid company_id",
+    "project_id": "Invalid project ID",
+    "project_year": "Invalid project year",
+    "csr_report": "Invalid beneficiaries",
+    "project_expenses": "Invalid project investment",
+}
+
+# camelCase keys as the read endpoints return them, accepted on writes as well
+CSR_ACTIVITY_KEY_ALIASES = {
+    "csrId": "csr_id",
+    "companyId": "company_id",
+    "projectId": "project_id",
+    "projectYear": "project_year",
+    "csrReport": "csr_report",
+    "projectExpenses": "project_expenses",
+    "projectRemarks": "project_remarks",
+}
+
+def parse_csr_activity(data: dict, company_error: str = CSR_ACTIVITY_FIELD_ERRORS["company_id"]):
+    """
+    Validate an activity body with CSRActivityIn. Returns (activity, None) on success
+    or (None, message) with the same messages the endpoints have always returned.
+    """
+    data = {CSR_ACTIVITY_KEY_ALIASES.get(key, key): value for key, value in data.items()}
     try:
-        logging.info("Update single csr activity record")
-        CURRENT_YEAR = datetime.now().year
-
-        required_fields = ['company_id', 'project_id', 'project_year', 'csr_report', 'project_expenses']
-        missing = [field for field in required_fields if field not in data]
+        return CSRActivityIn.model_validate(data), None
+    except ValidationError as e:
+        errors = e.errors()
+        missing = [err["loc"][0] for err in errors if err["type"] == "missing"]
         if missing:
-            # Return a consistent error response
-            return {"success": False, "message": f"Missing required fields: {missing}"}
-
-        if not isinstance(data["company_id"], str) or not data["company_id"].strip():
-            return {"success": False, "message": "Invalid Company ID"}
+            return None, f"Missing required fields: {missing}"
+        field = errors[0]["loc"][0] if errors[0]["loc"] else None
+        if field == "company_id":
+            return None, company_error
+        return None, CSR_ACTIVITY_FIELD_ERRORS.get(field, str(e))
+
+# The handlers take a plain dict so invalid bodies keep the {"success", "message"}
+# reply, so the request schema is documented from CSRActivityIn explicitly
+CSR_ACTIVITY_OPENAPI = {
+    "requestBody": {
+        "required": True,
+        "content": {"application/json": {"schema": CSRActivityIn.model_json_schema()}},
+    }
+}
+
+CSR_ACTIVITY_RECORD_QUERY = text("""
+    SELECT *
+    FROM silver.csr_activity
+    WHERE csr_id = :csr_id
+    LIMIT 1
+""")
+
+@router.post("/activities-update", openapi_extra=CSR_ACTIVITY_OPENAPI)
+def update_csr_activity_single(data: dict, db: Session = Depends(get_db), user_info: User = Depends(get_user_info)):
+    try:
+        logger.info("Update single csr activity record")
 
-        if not isinstance(data["project_id"], str) or not data["project_id"].strip():
-            return {"success": False, "message": "Invalid project ID"}
+        activity, error = parse_csr_activity(data, company_error="Invalid Company ID")
+        if error:
+            return {"success": False, "message": error}
 
-        if not isinstance(data["project_year"], int) or (int(data["project_year"]) > CURRENT_YEAR or int(data["project_year"]) < 2000):
-            return {"success": False, "message": "Invalid project year"}
-        
-        if not isinstance(data["csr_report"], int) or (int(data["csr_report"]) <= 0):
-            return {"success": False, "message": "Invalid beneficiaries"}
-
-        if not isinstance(data["project_expenses"], (int, float)):
-            return {"success": False, "message": "Invalid project investment"}
-
-        record = {
-            "csr_id": data["csr_id"],
-            "company_id": data["company_id"],
-            "project_id": data["project_id"],
-            "project_year": data["project_year"],
-            "csr_report": data["csr_report"],
-            "project_expenses": data["project_expenses"],
-            "project_remarks": data["project_remarks"],
-        }
+        record = activity.model_dump()
 
         update_csr_activity(db, record)
+        activities_cache.clear()
 
-        csr_id = data["csr_id"]
+        csr_id = record["csr_id"]
         get_old_record = None
         if csr_id:
-            result = db.execute(text("""
-                SELECT *
-                FROM silver.csr_activity
-                WHERE csr_id = :csr_id
-                LIMIT 1
-            """), {"csr_id": csr_id})
+            result = db.execute(CSR_ACTIVITY_RECORD_QUERY, {"csr_id": csr_id})
             get_old_record = result.fetchone()
 
-        new_value = f'company_id: {data["company_id"]}, project_id: {data["project_id"]}, project_year: {data["project_year"]}, csr_report: {data["csr_report"]}, project_expenses: {data["project_expenses"]}, project_remarks: {data["project_remarks"]}'
+        new_value = f'company_id: {record["company_id"]}, project_id: {record["project_id"]}, project_year: {record["project_year"]}, csr_report: {record["csr_report"]}, project_expenses: {record["project_expenses"]}, project_remarks: {record["project_remarks"]}'
         old_record = f'company_id: {get_old_record[1]}, project_id: {get_old_record[2]}, project_year: {get_old_record[3]}, csr_report: {get_old_record[4]}, project_expenses: {get_old_record[5]}, project_remarks: {get_old_record[6]}'
 
 
@@ -703,44 +668,20 @@ def update_csr_activity_single(data: dict, db: Session = Depends(get_db), user_i
         db.rollback()
         return {"success": False, "message": str(e)}
 
-@router.post("/activities-single")
+@router.post("/activities-single", openapi_extra=CSR_ACTIVITY_OPENAPI)
 def insert_csr_activity_single(data: dict, db: Session = Depends(get_db), user_info: User = Depends(get_user_info)):
     try:
-        logging.info("Add single csr activity record")
-        CURRENT_YEAR = datetime.now().year
+        logger.info("Add single csr activity record")
 
-        required_fields = ['company_id', 'project_id', 'project_year', 'csr_report', 'project_expenses']
-        missing = [field for field in required_fields if field not in data]
-        if missing:
-            # Return a consistent error response
-            return {"success": False, "message": f"Missing required fields: {missing}"}
+        activity, error = parse_csr_activity(data)
+        if error:
+            return {"success": False, "message": error}
 
-        if not isinstance(data["company_id"], str) or not data["company_id"].strip():
-            return {"success": False, "message": "Invalid company_id"}
-
-        if not isinstance(data["project_id"], str) or not data["project_id"].strip():
-            return {"success": False, "message": "Invalid project ID"}
-        
-        if not isinstance(data["project_year"], int) or (int(data["project_year"]) > CURRENT_YEAR or int(data["project_year"]) < 2000):
-            return {"success": False, "message": "Invalid project year"}
-        
-        if not isinstance(data["csr_report"], int) or (int(data["csr_report"]) <= 0):
-            return {"success": False, "message": "Invalid beneficiaries"}
-
-        if not isinstance(data["project_expenses"], (int, float)) or data["project_expenses"] < 0 or pd.isna(data["project_expenses"]):
-            return {"success": False, "message": "Invalid project investment"}
-
-        record = {
-            "company_id": data["company_id"],
-            "project_id": data["project_id"],
-            "project_year": data["project_year"],
-            "csr_report": data["csr_report"],
-            "project_expenses": data["project_expenses"],
-            "project_remarks": data["project_remarks"]
-        }
+        record = activity.model_dump(exclude={"csr_id"})
 
         csr_id = insert_csr_activity(db, record)
-        new_value = f'csr_id: {csr_id}, company_id: {data["company_id"]}, project_id: {data["project_id"]}, project_year: {data["project_year"]}, csr_report: {data["csr_report"]}, project_expenses: {data["project_expenses"]}, project_remarks: {data["project_remarks"]}'
+        activities_cache.clear()
+        new_value = f'csr_id: {csr_id}, company_id: {record["company_id"]}, project_id: {record["project_id"]}, project_year: {record["project_year"]}, csr_report: {record["csr_report"]}, project_expenses: {record["project_expenses"]}, project_remarks: {record["project_remarks"]}'
 
         append_audit_trail(
             db=db,
@@ -770,40 +711,108 @@ def insert_csr_activity_single(data: dict, db: Session = Depends(get_db), user_i
         db.rollback()
         return {"success": False, "message": str(e)}
 
-@router.get("/help-activity-template")
-async def download_help_activity_template():
-    """Generate Excel template for HELP activities data"""
-    headers = [
-        ("company_id", "Registered Company IDs (PERC, PGEC, PSC, MGI, PWEI, ESEC, RGEC, BEP_NL, BEP_NM, BEP_EP, BGEC, SJGEC, DGEC, BKS)"),
-        ("project_id", "Registered Project IDs: HE_AMM - Annual Medical Mission, HE_CHC - Community Health Center, HE_NP - Nutrition Program, HE_SA - Service Ambulance, HE_MC - Mobile Clinics, ED_AS - Adopted School, ED_EMD - Educational Mobile Devices, ED_SP - Scholarship Program, ED_TT - Teacher Training, LI_LT_T - Livelihood Training"),
-        ("project_year", "Year of the project"),
-        ("csr_report", "Number of beneficiaries"),
-        ("project_expenses", "Amount invested for the project"),
-        ("project_remarks", "For project tracking or identity (i.e: project's title, target beneficiary)")
-    ]
-
-    wb = openpyxl.Workbook()
-    sheet1 = wb.active
-    sheet1.title = "Sheet1"
+def csr_bulk_audit_entries(records: list, user_info: User) -> list:
+    """Audit trail entries for bulk-inserted activities: the record and its initial status."""
+    account_id = str(user_info.account_id)
+    audit_entries = []
+    for record in records:
+        audit_entries.append({
+            "account_id": account_id,
+            "target_table": "csr_activity",
+            "record_id": record["csr_id"],
+            "action_type": "insert",
+            "old_value": "",
+            "new_value": str(record["project_expenses"]),
+            "description": "Inserted bulk activity record"
+        })
+        audit_entries.append({
+            "account_id": account_id,
+            "target_table": "record_status",
+            "record_id": record["csr_id"],
+            "action_type": "insert",
+            "old_value": "",
+            "new_value": "URS",
+            "description": "Newly inserted record"
+        })
+    return audit_entries
+
+@router.post("/activities-bulk")
+def insert_csr_activity_bulk(data: List[dict], db: Session = Depends(get_db), user_info: User = Depends(get_user_info)):
+    """
+    Insert many activities in one request. Rows are validated like /activities-single
+    and written with one batched INSERT (COPY for very large batches).
+    """
+    try:
+        logger.info("Add %d csr activity records", len(data))
+
+        rows = []
+        validation_errors = []
+        for row_number, item in enumerate(data, start=1):
+            activity, error = parse_csr_activity(item)
+            if error:
+                validation_errors.append(f"Row {row_number}: {error}")
+                continue
+            rows.append(activity.model_dump(exclude={"csr_id"}))
+
+        if validation_errors:
+            return {"success": False, "message": "Data validation failed:\n" + "\n".join(validation_errors)}
+        if not rows:
+            return {"success": False, "message": "No valid data rows found to insert"}
+
+        records = bulk_upload_csr_activity(db, rows)
+        activities_cache.clear()
+
+        append_bulk_audit_trail(db, csr_bulk_audit_entries(records, user_info))
+
+        return {"success": True, "message": f"{len(records)} records successfully inserted."}
+
+    except Exception as e:
+        db.rollback()
+        return {"success": False, "message": str(e)}
+
+# Company and project IDs accepted by the HELP activity bulk upload
+HELP_COMPANY_IDS = frozenset(('PERC', 'PGEC', 'PSC', 'MGI', 'PWEI', 'ESEC', 'RGEC', 'BEP_NL', 'BEP_NM', 'BEP_EP', 'BGEC', 'SJGEC', 'DGEC', 'BKS'))
+HELP_PROJECT_IDS = frozenset(('HE_AMM', 'HE_CHC', 'HE_NP', 'HE_SA', 'HE_MC', 'ED_SA', 'ED_EMD', 'ED_SP', 'ED_TT', 'LI_LT_T'))
+
+HELP_ACTIVITY_TEMPLATE_HEADERS = [
+    ("company_id", "Registered Company IDs (PERC, PGEC, PSC, MGI, PWEI, ESEC, RGEC, BEP_NL, BEP_NM, BEP_EP, BGEC, SJGEC, DGEC, BKS)"),
+    ("project_id", "Registered Project IDs: HE_AMM - Annual Medical Mission, HE_CHC - Community Health Center, HE_NP - Nutrition Program, HE_SA - Service Ambulance, HE_MC - Mobile Clinics, ED_AS - Adopted School, ED_EMD - Educational Mobile Devices, ED_SP - Scholarship Program, ED_TT - Teacher Training, LI_LT_T - Livelihood Training"),
+    ("project_year", "Year of the project"),
+    ("csr_report", "Number of beneficiaries"),
+    ("project_expenses", "Amount invested for the project"),
+    ("project_remarks", "For project tracking or identity (i.e: project's title, target beneficiary)")
+]
+
+@lru_cache(maxsize=1)
+def help_activity_template() -> bytes:
+    """Build the HELP activity workbook once; it is static, so later downloads reuse the bytes."""
+    # Write-only workbook: rows are streamed out as they are appended
+    wb = openpyxl.Workbook(write_only=True)
+    sheet1 = wb.create_sheet(title="Sheet1")
     sheet2 = wb.create_sheet(title="project_details")
 
-    for col, (header, _) in enumerate(headers, start=1):
-        sheet1.cell(row=1, column=col, value=header)
+    sheet1.append([header for header, _ in HELP_ACTIVITY_TEMPLATE_HEADERS])
 
-    sheet2.cell(row=1, column=1, value="Header")
-    sheet2.cell(row=1, column=2, value="Input Description")
-    for row, (header, desc) in enumerate(headers, start=2):
-        sheet2.cell(row=row, column=1, value=header)
-        sheet2.cell(row=row, column=2, value=desc)
+    sheet2.append(["Header", "Input Description"])
+    for header, desc in HELP_ACTIVITY_TEMPLATE_HEADERS:
+        sheet2.append([header, desc])
 
-    # Write to in-memory buffer
     output = io.BytesIO()
     wb.save(output)
-    output.seek(0)
+    return output.getvalue()
+
+@router.on_event("startup")
+def warm_help_activity_template():
+    # Build the workbook while the app starts, not on the first download
+    help_activity_template()
+
+@router.get("/help-activity-template")
+def download_help_activity_template():
+    """Generate Excel template for HELP activities data"""
     filename = 'help_activity_template.xlsx'
 
-    return StreamingResponse(
-        output,
+    return Response(
+        content=help_activity_template(),
         media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
         headers={'Content-Disposition': f'attachment; filename="{filename}"'}
     )
@@ -815,57 +824,43 @@ def bulk_help_activity(file: UploadFile = File(...), db: Session = Depends(get_d
         return {"success": False, "message": f"Invalid file format. Please upload an Excel file."}
     
     try:
-        logging.info(f"Add bulk data")
-        contents = file.file.read()
-        df = pd.read_excel(BytesIO(contents))
-        company_list = ['PERC', 'PGEC', 'PSC', 'MGI', 'PWEI', 'ESEC', 'RGEC', 'BEP_NL', 'BEP_NM', 'BEP_EP', 'BGEC', 'SJGEC', 'DGEC', 'BKS']
-        project_ids = ['HE_AMM', 'HE_CHC', 'HE_NP', 'HE_SA', 'HE_MC', 'ED_SA', 'ED_EMD', 'ED_SP', 'ED_TT', 'LI_LT_T']
-
+        logger.info("Add bulk data")
+        # Parse the spooled upload in place rather than copying it into memory first
+        df = pd.read_excel(file.file, engine=EXCEL_ENGINE)
         required_columns = {'company_id', 'project_id', 'project_year', 'csr_report', 'project_expenses'}
         if not required_columns.issubset(df.columns):
             # return {"success": False, "message": f"Missing required fields: {required_columns - set(df.columns)}"}
             raise HTTPException(status_code=422, detail=f"Missing required fields: {required_columns - set(df.columns)}")
 
-        rows = []
-        validation_errors = []
+        # Column-wise validation with the same checks, order and messages as the former
+        # per-row loop. An invalid project ID is reported without skipping the row's
+        # remaining checks, as before.
         CURRENT_YEAR = datetime.now().year
-
-        for i, row in df.iterrows():
-            row_number = i + 1
-            
-            if not isinstance(row["company_id"], str) or not row["company_id"].strip() or row["company_id"] not in company_list:
-                validation_errors.append(f"Row {row_number}: Invalid company ID")
-                continue
-                
-            if not isinstance(row["project_id"], str) or not row["project_id"].strip() or row["project_id"] not in project_ids:
-                validation_errors.append(f"Row {row_number}: Invalid project ID")
-
-            if not isinstance(row["project_year"], (int)) or (int(row["project_year"]) > CURRENT_YEAR or int(row["project_year"]) < 2000):
-                validation_errors.append(f"Row {row_number}: Invalid project year")
-                continue
-            
-            if not isinstance(row["csr_report"], (int)) or row["csr_report"] < 0:
-                validation_errors.append(f"Row {row_number}: Invalid CSR beneficiary")
-                continue
-            
-            # Check if project_expenses is empty/NaN/invalid
-            if not isinstance(row["project_expenses"], (int, float)) or row["project_expenses"] < 0 or pd.isna(row["project_expenses"]):
-                validation_errors.append(f"Row {row_number}: Invalid project investments")
-                continue
-
-            # if not row["project_remarks"].strip():
-            #     validation_errors.append(f"Row {row_number}: Empty project remarks")
-            #     continue
-
-            # If all validations pass, add to rows
-            rows.append({
-                "company_id": row["company_id"].strip(),
-                "project_id": row["project_id"],
-                "project_year": int(row["project_year"]),
-                "csr_report": int(row["csr_report"]),
-                "project_expenses": float(row["project_expenses"]),
-                "project_remarks": row["project_remarks"],
-            })
+        company_ids = df["company_id"]
+        project_ids = df["project_id"]
+        years = integer_cells(df["project_year"])
+        reports = integer_cells(df["csr_report"])
+        expenses = numeric_cells(df["project_expenses"])
+        bad_projects = ~project_ids.isin(HELP_PROJECT_IDS)
+
+        validation_errors, failed = first_row_errors(df.index, [
+            (~company_ids.isin(HELP_COMPANY_IDS), lambda i: "Invalid company ID"),
+            (bad_projects, lambda i: "Invalid project ID", False),
+            (~years.between(2000, CURRENT_YEAR), lambda i: "Invalid project year"),
+            (~reports.ge(0), lambda i: "Invalid CSR beneficiary"),
+            (~expenses.ge(0), lambda i: "Invalid project investments"),
+        ], first_row=1)
+
+        valid = ~(failed | bad_projects)
+        remarks = df["project_remarks"] if "project_remarks" in df.columns else pd.Series(None, index=df.index)
+        rows = pd.DataFrame({
+            "company_id": company_ids[valid],
+            "project_id": project_ids[valid],
+            "project_year": years[valid].astype(int),
+            "csr_report": reports[valid].astype(int),
+            "project_expenses": expenses[valid],
+            "project_remarks": remarks[valid].astype(object).where(remarks[valid].notna(), None),
+        }).to_dict("records")
 
         # If there are validation errors, return them
         if validation_errors:
@@ -878,40 +873,12 @@ def bulk_help_activity(file: UploadFile = File(...), db: Session = Depends(get_d
             raise HTTPException(status_code=400, detail="No valid data rows found to insert")
             # return {"message": f"No valid data rows found to insert"}
 
-        record = bulk_upload_csr_activity(db, rows)
-
-        def csr_bulk_audit_data(record):
-            return [
-                {
-                    "target_table": "water_abstraction",
-                    "record_id": record.csr_id,
-                    "action_type": "insert",
-                    "old_value": "",
-                    "new_value": str(record.volume),
-                    "description": "Inserted bulk activity record"
-                },
-                {
-                    "target_table": "record_status",
-                    "record_id": record.csr_id,
-                    "action_type": "insert",
-                    "old_value": "",
-                    "new_value": "URS",
-                    "description": "Newly inserted record"
-                }
-            ]
-
-        audit_entries = []
-        for entries in record:
-            record_audits = csr_bulk_audit_data(entries)
-            for audit_data in record_audits:
-                audit_data["account_id"] = str(user_info.account_id)
-                audit_entries.append(audit_data)
-        
-        # Bulk insert audit trail
-        from ..services.audit_trail import append_bulk_audit_trail
-        append_bulk_audit_trail(db, audit_entries)
+        records = bulk_upload_csr_activity(db, rows)
+        activities_cache.clear()
+
+        append_bulk_audit_trail(db, csr_bulk_audit_entries(records, user_info))
 
-        return {"message": f"{len(entries)} records successfully inserted."}
+        return {"message": f"{len(records)} records successfully inserted."}
 
     except HTTPException:
         raise
@@ -1,39 +1,56 @@
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
 from sqlalchemy.orm import Session
 from sqlalchemy import text
-from typing import List, Dict
+from typing import List, Dict, Optional
 from decimal import Decimal
 import logging
-import traceback
 import pandas as pd
 import io
-from fastapi.responses import StreamingResponse
+from functools import lru_cache
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font
+from openpyxl.utils import get_column_letter
+from fastapi.responses import Response
 import time
 
 from ..dependencies import get_db
 from ..auth_decorators import require_role, office_checker_only, get_current_user_with_roles, get_user_info
 from ..services.audit_trail import append_audit_trail
 from ..services.auth import User
+from ..utils.excel_upload import EXCEL_ENGINE
 
 router = APIRouter()
 
+# Bold header row, as pandas.to_excel used to write it
+_HEADER_FONT = Font(bold=True)
+
 # Helper function for creating Excel templates
-def create_excel_template(headers: List[str], filename: str) -> io.BytesIO:
-    """Create minimal Excel template with just headers and readable column widths"""
-    df = pd.DataFrame({header: [] for header in headers})
+@lru_cache(maxsize=None)
+def _excel_template_bytes(headers: tuple) -> bytes:
+    # Write-only workbook: no DataFrame or ExcelWriter, and widths are set up front
+    # instead of walking worksheet.columns afterwards
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(title="Sheet1")
+    for col, header in enumerate(headers, start=1):
+        ws.column_dimensions[get_column_letter(col)].width = len(str(header)) + 2  # Header length + padding
+
+    header_cells = []
+    for header in headers:
+        cell = WriteOnlyCell(ws, value=header)
+        cell.font = _HEADER_FONT
+        header_cells.append(cell)
+    ws.append(header_cells)
+
     output = io.BytesIO()
-    
-    with pd.ExcelWriter(output, engine='openpyxl') as writer:
-        df.to_excel(writer, index=False)
-        worksheet = writer.sheets['Sheet1']
-        
-        # Auto-adjust column widths to make headers readable
-        for column in worksheet.columns:
-            max_length = len(str(column[0].value)) + 2  # Header length + padding
-            worksheet.column_dimensions[column[0].column_letter].width = max_length
-    
-    output.seek(0)
-    return output
+    wb.save(output)
+    return output.getvalue()
+
+def create_excel_template(headers: List[str], filename: str) -> bytes:
+    """Create minimal Excel template with just headers and readable column widths"""
+    # The workbook depends only on the headers, so each template is built once
+    # per process and later downloads send the cached bytes as they are
+    return _excel_template_bytes(tuple(headers))
 
 # Helper functions for validation
 def validate_year(year_value):
@@ -161,10 +178,10 @@ async def process_excel_import(file: UploadFile, import_config: Dict, db: Sessio
         
         # Read Excel file
         contents = await file.read()
-        df = pd.read_excel(io.BytesIO(contents))
+        df = pd.read_excel(io.BytesIO(contents), engine=EXCEL_ENGINE)
         
-        logging.info(f"Processing Excel file with {len(df)} rows")
-        logging.info(f"Columns found: {list(df.columns)}")
+        logging.info("Processing Excel file with %s rows", len(df))
+        logging.info("Columns found: %s", list(df.columns))
         
         # Map actual columns to expected columns
         column_mapping = {}
@@ -195,7 +212,7 @@ async def process_excel_import(file: UploadFile, import_config: Dict, db: Sessio
             error_msg += "\nColumn names are case-insensitive. Please download the template for the correct format."
             raise HTTPException(status_code=400, detail=error_msg)
         
-        logging.info(f"Column mapping: {column_mapping}")
+        logging.info("Column mapping: %s", column_mapping)
         
         # PHASE 1: Validate ALL rows first
         validation_errors = []
@@ -324,7 +341,7 @@ async def process_excel_import(file: UploadFile, import_config: Dict, db: Sessio
             except Exception as insert_error:
                 # If there's an insert error after validation passed, rollback and report
                 db.rollback()
-                logging.error(f"Insert error after validation: {str(insert_error)}")
+                logging.error("Insert error after validation: %s", insert_error)
                 
                 # Provide user-friendly error message without exposing SQL details
                 error_msg = "Database error occurred during import. "
@@ -354,10 +371,10 @@ async def process_excel_import(file: UploadFile, import_config: Dict, db: Sessio
                 
         except Exception as silver_error:
             db.rollback()
-            logging.error(f"Silver layer processing error: {str(silver_error)}")
+            logging.error("Silver layer processing error: %s", silver_error)
             raise HTTPException(status_code=500, detail="Data was imported but processing failed. Please contact system administrator.")
         
-        logging.info(f"Import completed successfully: {success_count} records imported")
+        logging.info("Import completed successfully: %s records imported", success_count)
         
         result = {
             "message": f"Import completed successfully",
@@ -372,7 +389,7 @@ async def process_excel_import(file: UploadFile, import_config: Dict, db: Sessio
         raise
     except Exception as e:
         db.rollback()
-        logging.error(f"Error in process_excel_import: {str(e)}")
+        logging.error("Error in process_excel_import: %s", e)
         
         # Provide user-friendly error message without exposing system details
         error_str = str(e).lower()
@@ -420,7 +437,7 @@ def get_company_id(company_identifier, db: Session):
         return None
         
     except Exception as e:
-        logging.error(f"Error getting company ID: {str(e)}")
+        logging.error("Error getting company ID: %s", e)
         return None
 
 def get_type_id(type_identifier, db: Session):
@@ -455,7 +472,7 @@ def get_type_id(type_identifier, db: Session):
         return None
         
     except Exception as e:
-        logging.error(f"Error getting type ID: {str(e)}")
+        logging.error("Error getting type ID: %s", e)
         return None
 
 @router.get("/retention", response_model=List[Dict])
@@ -529,8 +546,8 @@ def get_value_generated_data(db: Session = Depends(get_db)):
             for row in result
         ]
         
-        logging.info(f"Query returned {len(data)} rows")
-        logging.info(f"Data: {data}")
+        logging.info("Query returned %s rows", len(data))
+        logging.info("Data: %s", data)
         
         if not data:
             logging.warning("No data returned from query")
@@ -538,8 +555,7 @@ def get_value_generated_data(db: Session = Depends(get_db)):
             
         return data
     except Exception as e:
-        logging.error(f"Error fetching value generated data: {str(e)}")
-        logging.error(traceback.format_exc())
+        logging.exception("Error fetching value generated data")
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/expenditures", response_model=List[Dict])
@@ -589,12 +605,11 @@ def get_economic_expenditures(db: Session = Depends(get_db)):
             for row in result
         ]
         
-        logging.info(f"Retrieved {len(data)} expenditure records")
+        logging.info("Retrieved %s expenditure records", len(data))
         return data
         
     except Exception as e:
-        logging.error(f"Error fetching expenditure data: {str(e)}")
-        logging.error(traceback.format_exc())
+        logging.exception("Error fetching expenditure data")
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/expenditures/{comp}/{year}", response_model=Dict)
@@ -605,7 +620,7 @@ def get_expenditure_by_company_year(comp: str, year: int, db: Session = Depends(
     Returns data formatted for the edit modal
     """
     try:
-        logging.info(f"Fetching expenditure records for company {comp}, year {year}")
+        logging.info("Fetching expenditure records for company %s, year %s", comp, year)
         
         result = db.execute(text("""
             SELECT 
@@ -659,14 +674,13 @@ def get_expenditure_by_company_year(comp: str, year: int, db: Session = Depends(
                 'others': float(record.others) if record.others else 0
             }
         
-        logging.info(f"Retrieved expenditure records: {response}")
+        logging.info("Retrieved expenditure records: %s", response)
         return response
         
     except HTTPException:
         raise
     except Exception as e:
-        logging.error(f"Error fetching expenditure record: {str(e)}")
-        logging.error(traceback.format_exc())
+        logging.exception("Error fetching expenditure record")
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/capital-provider-payments", response_model=List[Dict])
@@ -701,8 +715,8 @@ def get_capital_provider_payments(db: Session = Depends(get_db)):
             for row in result
         ]
         
-        logging.info(f"Query returned {len(data)} capital provider payment records")
-        logging.info(f"Data: {data}")
+        logging.info("Query returned %s capital provider payment records", len(data))
+        logging.info("Data: %s", data)
         
         if not data:
             logging.warning("No capital provider payment data returned from query")
@@ -710,8 +724,7 @@ def get_capital_provider_payments(db: Session = Depends(get_db)):
             
         return data
     except Exception as e:
-        logging.error(f"Error fetching capital provider payment data: {str(e)}")
-        logging.error(traceback.format_exc())
+        logging.exception("Error fetching capital provider payment data")
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/check-value-generated/{year}")
@@ -731,7 +744,7 @@ def check_value_generated_exists(year: int, db: Session = Depends(get_db)):
         return {"exists": exists, "year": year}
         
     except Exception as e:
-        logging.error(f"Error checking value generated record: {str(e)}")
+        logging.error("Error checking value generated record: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/check-expenditure/{comp}/{year}/{type}")
@@ -755,7 +768,7 @@ def check_expenditure_exists(comp: str, year: int, type: str, db: Session = Depe
         return {"exists": exists, "company": comp, "year": year, "type": type}
         
     except Exception as e:
-        logging.error(f"Error checking expenditure record: {str(e)}")
+        logging.error("Error checking expenditure record: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/check-capital-provider/{year}")
@@ -775,7 +788,7 @@ def check_capital_provider_exists(year: int, db: Session = Depends(get_db)):
         return {"exists": exists, "year": year}
         
     except Exception as e:
-        logging.error(f"Error checking capital provider record: {str(e)}")
+        logging.error("Error checking capital provider record: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/value-generated")
@@ -790,7 +803,7 @@ def create_value_generated(
     Insert economic value generated data into bronze layer and process to silver
     """
     try:
-        logging.info(f"Creating value generated record: {value_data}")
+        logging.info("Creating value generated record: %s", value_data)
         
         # Insert into bronze layer
         db.execute(text("""
@@ -855,8 +868,7 @@ def create_value_generated(
         
     except Exception as e:
         db.rollback()
-        logging.error(f"Error creating value generated record: {str(e)}")
-        logging.error(traceback.format_exc())
+        logging.exception("Error creating value generated record")
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/value-generated/{year}", response_model=Dict)
@@ -867,7 +879,7 @@ def get_value_generated_by_year(year: int, db: Session = Depends(get_db)):
     Returns data formatted for the edit modal
     """
     try:
-        logging.info(f"Fetching value generated record for year {year}")
+        logging.info("Fetching value generated record for year %s", year)
         
         result = db.execute(text("""
             SELECT 
@@ -898,14 +910,13 @@ def get_value_generated_by_year(year: int, db: Session = Depends(get_db)):
             'miscellaneousIncome': float(record.miscellaneous_income) if record.miscellaneous_income else 0
         }
         
-        logging.info(f"Retrieved value generated record: {response}")
+        logging.info("Retrieved value generated record: %s", response)
         return response
         
     except HTTPException:
         raise
     except Exception as e:
-        logging.error(f"Error fetching value generated record: {str(e)}")
-        logging.error(traceback.format_exc())
+        logging.exception("Error fetching value generated record")
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.put("/value-generated/{year}")
@@ -921,7 +932,7 @@ def update_value_generated(
     Update economic value generated data in bronze layer and process to silver
     """
     try:
-        logging.info(f"Updating value generated record for year {year}: {value_data}")
+        logging.info("Updating value generated record for year %s: %s", year, value_data)
         
         # Validate that the record exists
         existing_record = db.execute(text("""
@@ -990,8 +1001,7 @@ def update_value_generated(
         raise
     except Exception as e:
         db.rollback()
-        logging.error(f"Error updating value generated record: {str(e)}")
-        logging.error(traceback.format_exc())
+        logging.exception("Error updating value generated record")
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/expenditures")
@@ -1006,7 +1016,7 @@ def create_expenditure(
     Insert economic expenditure data into bronze layer and process to silver
     """
     try:
-        logging.info(f"Creating expenditure record: {expenditure_data}")
+        logging.info("Creating expenditure record: %s", expenditure_data)
         
         # Insert into bronze layer
         db.execute(text("""
@@ -1088,8 +1098,7 @@ def create_expenditure(
         
     except Exception as e:
         db.rollback()
-        logging.error(f"Error creating expenditure record: {str(e)}")
-        logging.error(traceback.format_exc())
+        logging.exception("Error creating expenditure record")
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.put("/expenditures/{comp}/{year}/{type}")
@@ -1107,7 +1116,7 @@ def update_expenditure(
     Update economic expenditure data in bronze layer and process to silver
     """
     try:
-        logging.info(f"Updating expenditure record: comp={comp}, year={year}, type={type}, data={expenditure_data}")
+        logging.info("Updating expenditure record: comp=%s, year=%s, type=%s, data=%s", comp, year, type, expenditure_data)
         
         # Validate that the record exists
         existing_record = db.execute(text("""
@@ -1192,8 +1201,7 @@ def update_expenditure(
         raise
     except Exception as e:
         db.rollback()
-        logging.error(f"Error updating expenditure record: {str(e)}")
-        logging.error(traceback.format_exc())
+        logging.exception("Error updating expenditure record")
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/capital-provider-payments")
@@ -1208,7 +1216,7 @@ def create_capital_provider_payment(
     Insert capital provider payment data into bronze layer and process to silver
     """
     try:
-        logging.info(f"Creating capital provider payment: {payment_data}")
+        logging.info("Creating capital provider payment: %s", payment_data)
         
         # Insert into bronze layer
         db.execute(text("""
@@ -1263,8 +1271,7 @@ def create_capital_provider_payment(
         
     except Exception as e:
         db.rollback()
-        logging.error(f"Error creating capital provider payment: {str(e)}")
-        logging.error(traceback.format_exc())
+        logging.exception("Error creating capital provider payment")
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/capital-provider-payments/{year}", response_model=Dict)
@@ -1275,7 +1282,7 @@ def get_capital_provider_payment_by_year(year: int, db: Session = Depends(get_db
     Returns data formatted for the edit modal
     """
     try:
-        logging.info(f"Fetching capital provider payment record for year {year}")
+        logging.info("Fetching capital provider payment record for year %s", year)
         
         result = db.execute(text("""
             SELECT 
@@ -1300,14 +1307,13 @@ def get_capital_provider_payment_by_year(year: int, db: Session = Depends(get_db
             'dividendsToParent': float(record.dividends_to_parent) if record.dividends_to_parent else 0
         }
         
-        logging.info(f"Retrieved capital provider payment record: {response}")
+        logging.info("Retrieved capital provider payment record: %s", response)
         return response
         
     except HTTPException:
         raise
     except Exception as e:
-        logging.error(f"Error fetching capital provider payment record: {str(e)}")
-        logging.error(traceback.format_exc())
+        logging.exception("Error fetching capital provider payment record")
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.put("/capital-provider-payments/{year}")
@@ -1323,7 +1329,7 @@ def update_capital_provider_payment(
     Update capital provider payment data in bronze layer and process to silver
     """
     try:
-        logging.info(f"Updating capital provider payment record for year {year}: {payment_data}")
+        logging.info("Updating capital provider payment record for year %s: %s", year, payment_data)
         
         # Validate that the record exists
         existing_record = db.execute(text("""
@@ -1386,8 +1392,7 @@ def update_capital_provider_payment(
         raise
     except Exception as e:
         db.rollback()
-        logging.error(f"Error updating capital provider payment record: {str(e)}")
-        logging.error(traceback.format_exc())
+        logging.exception("Error updating capital provider payment record")
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/process-bronze-to-silver")
@@ -1414,8 +1419,7 @@ def process_all_bronze_to_silver(db: Session = Depends(get_db)):
         
     except Exception as e:
         db.rollback()
-        logging.error(f"Error processing bronze to silver: {str(e)}")
-        logging.error(traceback.format_exc())
+        logging.exception("Error processing bronze to silver")
         raise HTTPException(status_code=500, detail=str(e))
 
 # Template generation routes using helper function
@@ -1428,8 +1432,8 @@ async def download_economic_generated_template():
         filename = 'economic_generated_template.xlsx'
         output = create_excel_template(headers, filename)
         
-        return StreamingResponse(
-            io.BytesIO(output.getvalue()),
+        return Response(
+            content=output,
             media_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
             headers={'Content-Disposition': f'attachment; filename="{filename}"'}
         )
@@ -1445,8 +1449,8 @@ async def download_economic_expenditures_template():
         filename = 'economic_expenditures_template.xlsx'
         output = create_excel_template(headers, filename)
         
-        return StreamingResponse(
-            io.BytesIO(output.getvalue()),
+        return Response(
+            content=output,
             media_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
             headers={'Content-Disposition': f'attachment; filename="{filename}"'}
         )
@@ -1462,8 +1466,8 @@ async def download_economic_capital_provider_template():
         filename = 'economic_capital_provider_template.xlsx'
         output = create_excel_template(headers, filename)
         
-        return StreamingResponse(
-            io.BytesIO(output.getvalue()),
+        return Response(
+            content=output,
             media_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
             headers={'Content-Disposition': f'attachment; filename="{filename}"'}
         )
@@ -1645,9 +1649,56 @@ def get_reference_data(db: Session = Depends(get_db)):
         }
         
     except Exception as e:
-        logging.error(f"Error fetching reference data: {str(e)}")
+        logging.error("Error fetching reference data: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
+# Dashboard statements over the gold functions. Filters and ordering are bound
+# parameters, so each statement is a single static text that SQLAlchemy compiles
+# once and the values are never spliced into the SQL.
+ECONOMIC_SUMMARY_QUERY = text("""
+    SELECT * FROM gold.func_economic_value_by_year(
+        CAST(:years AS smallint[]), :order_by, :order_direction
+    )
+""")
+
+GENERATED_DETAILS_QUERY = text("""
+    SELECT * FROM gold.func_economic_value_generated_details(
+        CAST(:years AS smallint[]), :order_by, :order_direction
+    )
+""")
+
+DISTRIBUTED_DETAILS_QUERY = text("""
+    SELECT * FROM gold.func_economic_value_distributed_details(
+        CAST(:years AS smallint[]), :order_by, :order_direction
+    )
+""")
+
+COMPANY_DISTRIBUTION_QUERY = text("""
+    SELECT * FROM gold.func_economic_value_distribution_percentage(
+        CAST(:companies AS varchar(10)[]), CAST(:years AS smallint[]), :order_by, :order_direction
+    )
+""")
+
+COMPANY_COLORS_QUERY = text("""
+    SELECT company_name, color 
+    FROM ref.company_main 
+    WHERE color IS NOT NULL
+""")
+
+EXPENDITURE_BY_COMPANY_QUERY = text("""
+    SELECT * FROM gold.func_economic_expenditure_by_company(
+        CAST(:companies AS varchar(10)[]), CAST(:types AS varchar(10)[]), CAST(:years AS smallint[]),
+        :order_by, :order_direction
+    )
+""")
+
+def split_param(value: Optional[str], cast=str) -> Optional[list]:
+    """Parse a comma-separated query parameter into a list, or None when it is empty."""
+    if not value:
+        return None
+    items = [cast(item.strip()) for item in value.split(',') if item.strip()]
+    return items or None
+
 @router.get("/dashboard/summary", response_model=List[Dict])
 def get_economic_summary(
     years: str = None,
@@ -1660,22 +1711,11 @@ def get_economic_summary(
     Get economic value summary using gold.func_economic_value_by_year
     """
     try:
-        # Parse years parameter
-        year_array = None
-        if years:
-            year_list = [int(y.strip()) for y in years.split(',') if y.strip()]
-            if year_list:
-                year_array = f"ARRAY{year_list}::SMALLINT[]"
-        
-        query = f"""
-            SELECT * FROM gold.func_economic_value_by_year(
-                {year_array if year_array else 'NULL'},
-                '{order_by}',
-                '{order_direction}'
-            )
-        """
-        
-        result = db.execute(text(query))
+        result = db.execute(ECONOMIC_SUMMARY_QUERY, {
+            "years": split_param(years, int),
+            "order_by": order_by,
+            "order_direction": order_direction,
+        })
         
         data = [
             {
@@ -1689,7 +1729,7 @@ def get_economic_summary(
         
         return data
     except Exception as e:
-        logging.error(f"Error fetching economic summary: {str(e)}")
+        logging.error("Error fetching economic summary: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/dashboard/generated-details", response_model=List[Dict])
@@ -1704,21 +1744,11 @@ def get_generated_details(
     Get economic value generated details using gold.func_economic_value_generated_details
     """
     try:
-        year_array = None
-        if years:
-            year_list = [int(y.strip()) for y in years.split(',') if y.strip()]
-            if year_list:
-                year_array = f"ARRAY{year_list}::SMALLINT[]"
-        
-        query = f"""
-            SELECT * FROM gold.func_economic_value_generated_details(
-                {year_array if year_array else 'NULL'},
-                '{order_by}',
-                '{order_direction}'
-            )
-        """
-        
-        result = db.execute(text(query))
+        result = db.execute(GENERATED_DETAILS_QUERY, {
+            "years": split_param(years, int),
+            "order_by": order_by,
+            "order_direction": order_direction,
+        })
         
         data = [
             {
@@ -1736,7 +1766,7 @@ def get_generated_details(
         
         return data
     except Exception as e:
-        logging.error(f"Error fetching generated details: {str(e)}")
+        logging.error("Error fetching generated details: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/dashboard/distributed-details", response_model=List[Dict])
@@ -1751,21 +1781,11 @@ def get_distributed_details(
     Get economic value distributed details using gold.func_economic_value_distributed_details
     """
     try:
-        year_array = None
-        if years:
-            year_list = [int(y.strip()) for y in years.split(',') if y.strip()]
-            if year_list:
-                year_array = f"ARRAY{year_list}::SMALLINT[]"
-        
-        query = f"""
-            SELECT * FROM gold.func_economic_value_distributed_details(
-                {year_array if year_array else 'NULL'},
-                '{order_by}',
-                '{order_direction}'
-            )
-        """
-        
-        result = db.execute(text(query))
+        result = db.execute(DISTRIBUTED_DETAILS_QUERY, {
+            "years": split_param(years, int),
+            "order_by": order_by,
+            "order_direction": order_direction,
+        })
         
         data = [
             {
@@ -1786,7 +1806,7 @@ def get_distributed_details(
         
         return data
     except Exception as e:
-        logging.error(f"Error fetching distributed details: {str(e)}")
+        logging.error("Error fetching distributed details: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/dashboard/company-distribution", response_model=List[Dict])
@@ -1802,37 +1822,16 @@ def get_company_distribution(
     Get economic value distribution by company using gold.func_economic_value_distribution_percentage
     """
     try:
-        company_array = None
-        if companies:
-            company_list = [c.strip() for c in companies.split(',') if c.strip()]
-            if company_list:
-                company_array = f"ARRAY{company_list}::VARCHAR(10)[]"
-        
-        year_array = None
-        if years:
-            year_list = [int(y.strip()) for y in years.split(',') if y.strip()]
-            if year_list:
-                year_array = f"ARRAY{year_list}::SMALLINT[]"
-        
         # First get the main data
-        query = f"""
-            SELECT * FROM gold.func_economic_value_distribution_percentage(
-                {company_array if company_array else 'NULL'},
-                {year_array if year_array else 'NULL'},
-                '{order_by}',
-                '{order_direction}'
-            )
-        """
-        
-        result = db.execute(text(query))
+        result = db.execute(COMPANY_DISTRIBUTION_QUERY, {
+            "companies": split_param(companies),
+            "years": split_param(years, int),
+            "order_by": order_by,
+            "order_direction": order_direction,
+        })
         
         # Get company colors separately
-        color_query = """
-            SELECT company_name, color 
-            FROM ref.company_main 
-            WHERE color IS NOT NULL
-        """
-        color_result = db.execute(text(color_query))
+        color_result = db.execute(COMPANY_COLORS_QUERY)
         company_colors = {row.company_name: row.color for row in color_result}
         
         data = [
@@ -1849,7 +1848,7 @@ def get_company_distribution(
         
         return data
     except Exception as e:
-        logging.error(f"Error fetching company distribution: {str(e)}")
+        logging.error("Error fetching company distribution: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/dashboard/expenditure-by-company", response_model=List[Dict])
@@ -1866,35 +1865,13 @@ def get_expenditure_by_company(
     Get expenditure details by company using gold.func_economic_expenditure_by_company
     """
     try:
-        company_array = None
-        if companies:
-            company_list = [c.strip() for c in companies.split(',') if c.strip()]
-            if company_list:
-                company_array = f"ARRAY{company_list}::VARCHAR(10)[]"
-        
-        type_array = None
-        if types:
-            type_list = [t.strip() for t in types.split(',') if t.strip()]
-            if type_list:
-                type_array = f"ARRAY{type_list}::VARCHAR(10)[]"
-        
-        year_array = None
-        if years:
-            year_list = [int(y.strip()) for y in years.split(',') if y.strip()]
-            if year_list:
-                year_array = f"ARRAY{year_list}::SMALLINT[]"
-        
-        query = f"""
-            SELECT * FROM gold.func_economic_expenditure_by_company(
-                {company_array if company_array else 'NULL'},
-                {type_array if type_array else 'NULL'},
-                {year_array if year_array else 'NULL'},
-                '{order_by}',
-                '{order_direction}'
-            )
-        """
-        
-        result = db.execute(text(query))
+        result = db.execute(EXPENDITURE_BY_COMPANY_QUERY, {
+            "companies": split_param(companies),
+            "types": split_param(types),
+            "years": split_param(years, int),
+            "order_by": order_by,
+            "order_direction": order_direction,
+        })
         
         data = [
             {
@@ -1916,7 +1893,7 @@ def get_expenditure_by_company(
         
         return data
     except Exception as e:
-        logging.error(f"Error fetching expenditure by company: {str(e)}")
+        logging.error("Error fetching expenditure by company: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/dashboard/filter-options", response_model=Dict)
@@ -1965,5 +1942,5 @@ def get_dashboard_filter_options(
         }
         
     except Exception as e:
-        logging.error(f"Error fetching filter options: {str(e)}")
+        logging.error("Error fetching filter options: %s", e)
         raise HTTPException(status_code=500, detail=str(e)) 
\ No newline at end of file
@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Depends, Query, HTTPException, Form, UploadFile, File
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response
 from typing import Optional, List, Dict, Any
 from decimal import Decimal
 from sqlalchemy.orm import Session
@@ -25,13 +25,13 @@ import io
 from datetime import datetime, timedelta, date
 from typing import Literal
 from fastapi import APIRouter, Query
-from fastapi.responses import StreamingResponse
 import openpyxl
 from openpyxl.styles import Font, Alignment
 import io
 from ..auth_decorators import get_current_user_with_roles, allow_roles, get_user_info
 from ..services.audit_trail import append_audit_trail
 from ..services.auth import User
+from app.utils.excel_upload import EXCEL_ENGINE
 
 
 router = APIRouter()
@@ -158,7 +158,7 @@ def get_energy_records_by_status(
     db: Session = Depends(get_db)
 ):
     try:
-        logging.info(f"Fetching energy records. Filter status_id: {status_id}")
+        logging.info("Fetching energy records. Filter status_id: %s", status_id)
 
         query = text("""
                 SELECT     
@@ -179,12 +179,11 @@ def get_energy_records_by_status(
         result = db.execute(query, {"status_id": status_id})
         data = [dict(row._mapping) for row in result]
 
-        logging.info(f"Returned {len(data)} records")
+        logging.info("Returned %s records", len(data))
         return data
 
-    except Exception as e:
-        logging.error(f"Error retrieving energy records: {str(e)}")
-        logging.error(traceback.format_exc())
+    except Exception:
+        logging.exception("Error retrieving energy records")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 # ====================== fact_table (func from pg) ====================== #
@@ -228,9 +227,8 @@ def get_fact_energy(
 
         return data
 
-    except Exception as e:
-        logging.error(f"Error calling func_fact_energy: {str(e)}")
-        logging.error(traceback.format_exc())
+    except Exception:
+        logging.exception("Error calling func_fact_energy")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
@@ -690,9 +688,10 @@ def get_fund_allocation(
     ff_id = normalize_list(parse_comma_separated(p_ff_id))
     ff_category = normalize_list(parse_comma_separated(p_ff_category))
 
-    logging.info(f"Filters - company_ids: {company_ids}, power_plant_ids: {power_plant_ids}, "
-                 f"ff_id: {ff_id}, ff_category: {ff_category}, "
-                 f"start_date: {p_start_date}, end_date: {p_end_date}")
+    logging.info("Filters - company_ids: %s, power_plant_ids: %s, "
+                 "ff_id: %s, ff_category: %s, "
+                 "start_date: %s, end_date: %s",
+                 company_ids, power_plant_ids, ff_id, ff_category, p_start_date, p_end_date)
 
     try:
         energy = text("""
@@ -888,9 +887,8 @@ def get_fund_allocation(
         return {"data":overall}
 
 
-    except Exception as e:
-        logging.error(f"Error retrieving energy records: {str(e)}")
-        logging.error(traceback.format_exc())
+    except Exception:
+        logging.exception("Error retrieving energy records")
         raise HTTPException(status_code=500, detail="Internal server error")
     
 def serialize_row(row):
@@ -949,14 +947,13 @@ def get_overall(db: Session = Depends(get_db)):
 
         return {"data": data}
 
-    except Exception as e:
-        logging.error(f"Error retrieving energy records: {str(e)}")
-        logging.error(traceback.format_exc())
+    except Exception:
+        logging.exception("Error retrieving energy records")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
 # ====================== template ====================== #
-@router.get("/download_template", response_class=StreamingResponse)
+@router.get("/download_template", response_class=Response)
 @allow_roles("R05")
 def download_template(
     company_id: str = Query(..., description="Company ID"),
@@ -1010,7 +1007,6 @@ def download_template(
 
     buffer = io.BytesIO()
     wb.save(buffer)
-    buffer.seek(0)
     now = datetime.now().strftime("%Y%m%d_%H%M%S")
 
     filename = f"{company_id}_{powerplant_id}_power_template_{now}.xlsx"
@@ -1025,8 +1021,8 @@ def download_template(
     )
 
 
-    return StreamingResponse(
-        buffer,
+    return Response(
+        content=buffer.getvalue(),
         media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
         headers={
             "Content-Disposition": f"attachment; filename={filename}"
@@ -1454,8 +1450,7 @@ def bulk_add_energy_record(
         raise HTTPException(status_code=400, detail="Invalid file type. Please upload an Excel file.")
 
     try:
-        contents = file.file.read()
-        df = pd.read_excel(io.BytesIO(contents))
+        df = pd.read_excel(file.file, engine=EXCEL_ENGINE)
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Failed to read Excel file: {e}")
 
@@ -5,9 +5,9 @@ from sqlalchemy.orm import Session
 from sqlalchemy import text
 from typing import List, Dict, Union
 import logging
-import traceback
-from fastapi.responses import StreamingResponse
-import io
+import os
+from functools import lru_cache
+from fastapi.responses import Response
 from io import BytesIO
 from datetime import datetime
 from typing import Optional, List
@@ -69,6 +69,8 @@ from app.reference.models import CompanyMain
 from ..bronze.models import TableType
 from ..template.envi_template_config import TEMPLATE_DEFINITIONS
 from ..utils.envi_template_utils import create_excel_template, create_all_templates, get_table_mapping
+from ..utils.excel_upload import EXCEL_ENGINE, stripped_text_cells, numeric_cells, first_row_errors
+from ..utils.ttl_cache import TTLCache
 from ..auth_decorators import get_user_info
 from ..services.audit_trail import append_audit_trail
 from ..services.auth import User
@@ -76,11 +78,34 @@ from ..services.auth import User
 router = APIRouter()
 
 # For Validations
-VALID_MONTHS = [
-    "January", "February", "March", "April", "May", "June",
-    "July", "August", "September", "October", "November", "December"
-]
-VALID_QUARTERS = {"Q1", "Q2", "Q3", "Q4"}
+MONTH_TO_QUARTER = {
+    "January": "Q1", "February": "Q1", "March": "Q1",
+    "April": "Q2", "May": "Q2", "June": "Q2",
+    "July": "Q3", "August": "Q3", "September": "Q3",
+    "October": "Q4", "November": "Q4", "December": "Q4"
+}
+VALID_MONTHS = frozenset(MONTH_TO_QUARTER)
+VALID_QUARTERS = frozenset(("Q1", "Q2", "Q3", "Q4"))
+QUARTER_MONTHS = {
+    quarter: tuple(month for month, month_quarter in MONTH_TO_QUARTER.items() if month_quarter == quarter)
+    for quarter in ("Q1", "Q2", "Q3", "Q4")
+}
+
+# Company IDs, units, metrics and sources that bulk uploads validate against. They are
+# read with DISTINCT and reused for a short while instead of scanning each table on
+# every upload.
+upload_reference_cache = TTLCache(ttl=int(os.getenv("ENVI_UPLOAD_REFERENCE_CACHE_TTL_SECONDS", "60")))
+
+def distinct_values(db: Session, column) -> frozenset:
+    """Distinct values of a model column, cached in upload_reference_cache."""
+    def load():
+        return frozenset(value for (value,) in db.query(column).distinct().all())
+    return upload_reference_cache.get_or_set(str(column), load)
+
+@lru_cache(maxsize=128)
+def joined_values(values: frozenset) -> str:
+    """Sorted, comma-separated values for error messages, built once per set."""
+    return ", ".join(sorted(values))
 CURRENT_YEAR = datetime.now().year
 
 def get_column_mapping(table_type):
@@ -211,7 +236,7 @@ def get_water_abstraction(db: Session = Depends(get_db), wa_id: Optional[str] =
     """
     try:
         if wa_id is not None:
-            logging.info(f"Executing water abstraction query for ID: {wa_id}")
+            logging.info("Executing water abstraction query for ID: %s", wa_id)
             
             result = db.execute(text("""
                 SELECT * FROM gold.vw_environment_water_abstraction 
@@ -221,7 +246,7 @@ def get_water_abstraction(db: Session = Depends(get_db), wa_id: Optional[str] =
             row = result.fetchone()
             
             if not row:
-                logging.warning(f"No water abstraction data found for ID: {wa_id}")
+                logging.warning("No water abstraction data found for ID: %s", wa_id)
                 raise HTTPException(status_code=404, detail=f"Water abstraction with ID {wa_id} not found")
 
             data = {
@@ -234,7 +259,7 @@ def get_water_abstraction(db: Session = Depends(get_db), wa_id: Optional[str] =
                 "status": row.status_name
             }
             
-            logging.info(f"Found water abstraction data for ID: {wa_id}")
+            logging.info("Found water abstraction data for ID: %s", wa_id)
             return data
         else:
             logging.info("Executing water abstraction query for all records")
@@ -254,7 +279,7 @@ def get_water_abstraction(db: Session = Depends(get_db), wa_id: Optional[str] =
                 for row in result
             ]
             
-            logging.info(f"Query returned {len(data)} rows")
+            logging.info("Query returned %s rows", len(data))
             
             if not data:
                 logging.warning("No water abstraction data found")
@@ -265,8 +290,7 @@ def get_water_abstraction(db: Session = Depends(get_db), wa_id: Optional[str] =
     except HTTPException:
         raise
     except Exception as e:
-        logging.error(f"Error fetching water abstraction data: {str(e)}")
-        logging.error(traceback.format_exc())
+        logging.exception("Error fetching water abstraction data")
         raise HTTPException(status_code=500, detail=str(e))
 
 # Water Discharge Endpoint
@@ -280,7 +304,7 @@ def get_water_discharge(db: Session = Depends(get_db), wd_id: Optional[str] = No
     """
     try:
         if wd_id is not None:
-            logging.info(f"Executing water discharge query for ID: {wd_id}")
+            logging.info("Executing water discharge query for ID: %s", wd_id)
             
             result = db.execute(text("""
                 SELECT * FROM gold.vw_environment_water_discharge 
@@ -290,7 +314,7 @@ def get_water_discharge(db: Session = Depends(get_db), wd_id: Optional[str] = No
             row = result.fetchone()
             
             if not row:
-                logging.warning(f"No water discharge data found for ID: {wd_id}")
+                logging.warning("No water discharge data found for ID: %s", wd_id)
                 raise HTTPException(status_code=404, detail=f"Water discharge with ID {wd_id} not found")
 
             data = {
@@ -303,7 +327,7 @@ def get_water_discharge(db: Session = Depends(get_db), wd_id: Optional[str] = No
                 "status": row.status_name
             }
             
-            logging.info(f"Found water discharge data for ID: {wd_id}")
+            logging.info("Found water discharge data for ID: %s", wd_id)
             return data
         else:
             logging.info("Executing water discharge query for all records")
@@ -323,7 +347,7 @@ def get_water_discharge(db: Session = Depends(get_db), wd_id: Optional[str] = No
                 for row in result
             ]
             
-            logging.info(f"Query returned {len(data)} rows")
+            logging.info("Query returned %s rows", len(data))
             
             if not data:
                 logging.warning("No water discharge data found")
@@ -334,8 +358,7 @@ def get_water_discharge(db: Session = Depends(get_db), wd_id: Optional[str] = No
     except HTTPException:
         raise
     except Exception as e:
-        logging.error(f"Error fetching water discharge data: {str(e)}")
-        logging.error(traceback.format_exc())
+        logging.exception("Error fetching water discharge data")
         raise HTTPException(status_code=500, detail=str(e))
 
 # Water Consumption Endpoint
@@ -349,7 +372,7 @@ def get_water_consumption(db: Session = Depends(get_db), wc_id: Optional[str] =
     """
     try:
         if wc_id is not None:
-            logging.info(f"Executing water consumption query for ID: {wc_id}")
+            logging.info("Executing water consumption query for ID: %s", wc_id)
             
             result = db.execute(text("""
                 SELECT * FROM gold.vw_environment_water_consumption 
@@ -359,7 +382,7 @@ def get_water_consumption(db: Session = Depends(get_db), wc_id: Optional[str] =
             row = result.fetchone()
             
             if not row:
-                logging.warning(f"No water consumption data found for ID: {wc_id}")
+                logging.warning("No water consumption data found for ID: %s", wc_id)
                 raise HTTPException(status_code=404, detail=f"Water consumption with ID {wc_id} not found")
 
             data = {
@@ -372,7 +395,7 @@ def get_water_consumption(db: Session = Depends(get_db), wc_id: Optional[str] =
                 "status": row.status_name
             }
             
-            logging.info(f"Found water consumption data for ID: {wc_id}")
+            logging.info("Found water consumption data for ID: %s", wc_id)
             return data
         else:
             logging.info("Executing water consumption query for all records")
@@ -392,7 +415,7 @@ def get_water_consumption(db: Session = Depends(get_db), wc_id: Optional[str] =
                 for row in result
             ]
             
-            logging.info(f"Query returned {len(data)} rows")
+            logging.info("Query returned %s rows", len(data))
             
             if not data:
                 logging.warning("No water consumption data found")
@@ -403,8 +426,7 @@ def get_water_consumption(db: Session = Depends(get_db), wc_id: Optional[str] =
     except HTTPException:
         raise
     except Exception as e:
-        logging.error(f"Error fetching water consumption data: {str(e)}")
-        logging.error(traceback.format_exc())
+        logging.exception("Error fetching water consumption data")
         raise HTTPException(status_code=500, detail=str(e))
 
 # Diesel Consumption Endpoint
@@ -418,7 +440,7 @@ def get_diesel_consumption(db: Session = Depends(get_db), dc_id: Optional[str] =
     """
     try:
         if dc_id is not None:
-            logging.info(f"Executing diesel consumption query for ID: {dc_id}")
+            logging.info("Executing diesel consumption query for ID: %s", dc_id)
             
             result = db.execute(text("""
                 SELECT * FROM gold.vw_environment_diesel_consumption 
@@ -428,7 +450,7 @@ def get_diesel_consumption(db: Session = Depends(get_db), dc_id: Optional[str] =
             row = result.fetchone()
             
             if not row:
-                logging.warning(f"No diesel consumption data found for ID: {dc_id}")
+                logging.warning("No diesel consumption data found for ID: %s", dc_id)
                 raise HTTPException(status_code=404, detail=f"Diesel consumption with ID {dc_id} not found")
 
             data = {
@@ -445,7 +467,7 @@ def get_diesel_consumption(db: Session = Depends(get_db), dc_id: Optional[str] =
                 "status": row.status_name
             }
             
-            logging.info(f"Found diesel consumption data for ID: {dc_id}")
+            logging.info("Found diesel consumption data for ID: %s", dc_id)
             return data
         else:
             logging.info("Executing diesel consumption query for all records")
@@ -469,7 +491,7 @@ def get_diesel_consumption(db: Session = Depends(get_db), dc_id: Optional[str] =
                 for row in result
             ]
             
-            logging.info(f"Query returned {len(data)} rows")
+            logging.info("Query returned %s rows", len(data))
             
             if not data:
                 logging.warning("No diesel consumption data found")
@@ -480,8 +502,7 @@ def get_diesel_consumption(db: Session = Depends(get_db), dc_id: Optional[str] =
     except HTTPException:
         raise
     except Exception as e:
-        logging.error(f"Error fetching diesel consumption data: {str(e)}")
-        logging.error(traceback.format_exc())
+        logging.exception("Error fetching diesel consumption data")
         raise HTTPException(status_code=500, detail=str(e))
 
 # Electric Consumption Endpoint
@@ -495,7 +516,7 @@ def get_electric_consumption(db: Session = Depends(get_db), ec_id: Optional[str]
     """
     try:
         if ec_id is not None:
-            logging.info(f"Executing electric consumption query for ID: {ec_id}")
+            logging.info("Executing electric consumption query for ID: %s", ec_id)
             
             result = db.execute(text("""
                 SELECT * FROM gold.vw_environment_electric_consumption 
@@ -505,7 +526,7 @@ def get_electric_consumption(db: Session = Depends(get_db), ec_id: Optional[str]
             row = result.fetchone()
             
             if not row:
-                logging.warning(f"No electric consumption data found for ID: {ec_id}")
+                logging.warning("No electric consumption data found for ID: %s", ec_id)
                 raise HTTPException(status_code=404, detail=f"Electric consumption with ID {ec_id} not found")
 
             data = {
@@ -519,7 +540,7 @@ def get_electric_consumption(db: Session = Depends(get_db), ec_id: Optional[str]
                 "status": row.status_name
             }
             
-            logging.info(f"Found electric consumption data for ID: {ec_id}")
+            logging.info("Found electric consumption data for ID: %s", ec_id)
             return data
         else:
             logging.info("Executing electric consumption query for all records")
@@ -540,7 +561,7 @@ def get_electric_consumption(db: Session = Depends(get_db), ec_id: Optional[str]
                 for row in result
             ]
             
-            logging.info(f"Query returned {len(data)} rows")
+            logging.info("Query returned %s rows", len(data))
             
             if not data:
                 logging.warning("No electric consumption data found")
@@ -551,8 +572,7 @@ def get_electric_consumption(db: Session = Depends(get_db), ec_id: Optional[str]
     except HTTPException:
         raise
     except Exception as e:
-        logging.error(f"Error fetching electric consumption data: {str(e)}")
-        logging.error(traceback.format_exc())
+        logging.exception("Error fetching electric consumption data")
         raise HTTPException(status_code=500, detail=str(e))
 
 # Non-Hazardous Waste Endpoint
@@ -566,7 +586,7 @@ def get_non_hazard_waste(db: Session = Depends(get_db), nhw_id: Optional[str] =
     """
     try:
         if nhw_id is not None:
-            logging.info(f"Executing non hazard waste query for ID: {nhw_id}")
+            logging.info("Executing non hazard waste query for ID: %s", nhw_id)
             
             result = db.execute(text("""
                 SELECT * FROM gold.vw_environment_non_hazard_waste 
@@ -576,7 +596,7 @@ def get_non_hazard_waste(db: Session = Depends(get_db), nhw_id: Optional[str] =
             row = result.fetchone()
             
             if not row:
-                logging.warning(f"No non hazard waste data found for ID: {nhw_id}")
+                logging.warning("No non hazard waste data found for ID: %s", nhw_id)
                 raise HTTPException(status_code=404, detail=f"Non hazard waste with ID {nhw_id} not found")
 
             data = {
@@ -590,7 +610,7 @@ def get_non_hazard_waste(db: Session = Depends(get_db), nhw_id: Optional[str] =
                 "status": row.status_name
             }
             
-            logging.info(f"Found non hazard waste data for ID: {nhw_id}")
+            logging.info("Found non hazard waste data for ID: %s", nhw_id)
             return data
         else:
             logging.info("Executing non hazard waste query for all records")
@@ -611,7 +631,7 @@ def get_non_hazard_waste(db: Session = Depends(get_db), nhw_id: Optional[str] =
                 for row in result
             ]
             
-            logging.info(f"Query returned {len(data)} rows")
+            logging.info("Query returned %s rows", len(data))
             
             if not data:
                 logging.warning("No non hazard waste data found")
@@ -622,8 +642,7 @@ def get_non_hazard_waste(db: Session = Depends(get_db), nhw_id: Optional[str] =
     except HTTPException:
         raise
     except Exception as e:
-        logging.error(f"Error fetching non hazard waste data: {str(e)}")
-        logging.error(traceback.format_exc())
+        logging.exception("Error fetching non hazard waste data")
         raise HTTPException(status_code=500, detail=str(e))
 
 # Hazardous Waste Generated Endpoint
@@ -637,7 +656,7 @@ def get_hazard_waste_generated(db: Session = Depends(get_db), hwg_id: Optional[s
     """
     try:
         if hwg_id is not None:
-            logging.info(f"Executing hazard waste generated query for ID: {hwg_id}")
+            logging.info("Executing hazard waste generated query for ID: %s", hwg_id)
             
             result = db.execute(text("""
                 SELECT * FROM gold.vw_environment_hazard_waste_generated 
@@ -647,7 +666,7 @@ def get_hazard_waste_generated(db: Session = Depends(get_db), hwg_id: Optional[s
             row = result.fetchone()
             
             if not row:
-                logging.warning(f"No hazard waste generated data found for ID: {hwg_id}")
+                logging.warning("No hazard waste generated data found for ID: %s", hwg_id)
                 raise HTTPException(status_code=404, detail=f"Hazard waste generated with ID {hwg_id} not found")
 
             data = {
@@ -661,7 +680,7 @@ def get_hazard_waste_generated(db: Session = Depends(get_db), hwg_id: Optional[s
                 "status": row.status_name
             }
             
-            logging.info(f"Found hazard waste generated data for ID: {hwg_id}")
+            logging.info("Found hazard waste generated data for ID: %s", hwg_id)
             return data
         else:
             logging.info("Executing hazard waste generated query for all records")
@@ -682,7 +701,7 @@ def get_hazard_waste_generated(db: Session = Depends(get_db), hwg_id: Optional[s
                 for row in result
             ]
             
-            logging.info(f"Query returned {len(data)} rows")
+            logging.info("Query returned %s rows", len(data))
             
             if not data:
                 logging.warning("No hazard waste generated data found")
@@ -693,8 +712,7 @@ def get_hazard_waste_generated(db: Session = Depends(get_db), hwg_id: Optional[s
     except HTTPException:
         raise
     except Exception as e:
-        logging.error(f"Error fetching hazard waste generated data: {str(e)}")
-        logging.error(traceback.format_exc())
+        logging.exception("Error fetching hazard waste generated data")
         raise HTTPException(status_code=500, detail=str(e))
 
 # Hazardous Waste Disposed Endpoint
@@ -708,7 +726,7 @@ def get_hazard_waste_disposed(db: Session = Depends(get_db), hwd_id: Optional[st
     """
     try:
         if hwd_id is not None:
-            logging.info(f"Executing hazard waste disposed query for ID: {hwd_id}")
+            logging.info("Executing hazard waste disposed query for ID: %s", hwd_id)
             
             result = db.execute(text("""
                 SELECT * FROM gold.vw_environment_hazard_waste_disposed 
@@ -718,7 +736,7 @@ def get_hazard_waste_disposed(db: Session = Depends(get_db), hwd_id: Optional[st
             row = result.fetchone()
             
             if not row:
-                logging.warning(f"No hazard waste disposed data found for ID: {hwd_id}")
+                logging.warning("No hazard waste disposed data found for ID: %s", hwd_id)
                 raise HTTPException(status_code=404, detail=f"Hazard waste disposed with ID {hwd_id} not found")
 
             data = {
@@ -731,7 +749,7 @@ def get_hazard_waste_disposed(db: Session = Depends(get_db), hwd_id: Optional[st
                 "status": row.status_name
             }
             
-            logging.info(f"Found hazard waste disposed data for ID: {hwd_id}")
+            logging.info("Found hazard waste disposed data for ID: %s", hwd_id)
             return data
         else:
             logging.info("Executing hazard waste disposed query for all records")
@@ -751,7 +769,7 @@ def get_hazard_waste_disposed(db: Session = Depends(get_db), hwd_id: Optional[st
                 for row in result
             ]
             
-            logging.info(f"Query returned {len(data)} rows")
+            logging.info("Query returned %s rows", len(data))
             
             if not data:
                 logging.warning("No hazard waste disposed data found")
@@ -762,8 +780,7 @@ def get_hazard_waste_disposed(db: Session = Depends(get_db), hwd_id: Optional[st
     except HTTPException:
         raise
     except Exception as e:
-        logging.error(f"Error fetching hazard waste disposed data: {str(e)}")
-        logging.error(traceback.format_exc())
+        logging.exception("Error fetching hazard waste disposed data")
         raise HTTPException(status_code=500, detail=str(e))
 
 #=================RETRIEVE ENVIRONMENTAL DATA (BRONZE)====================
@@ -795,12 +812,11 @@ def get_water_abstraction_records(db: Session = Depends(get_db)):
         result = db.execute(query)
         data = [dict(row._mapping) for row in result]
 
-        logging.info(f"Returned {len(data)} water abstraction records")
+        logging.info("Returned %s water abstraction records", len(data))
         return data
 
-    except Exception as e:
-        logging.error(f"Error retrieving water abstraction records: {str(e)}")
-        logging.error(traceback.format_exc())
+    except Exception:
+        logging.exception("Error retrieving water abstraction records")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 #==========================BY ID==========================
@@ -891,24 +907,13 @@ def single_upload_water_abstraction(data: dict, db: Session = Depends(get_db), u
         if not isinstance(data["year"], (int, float)) or not (1900 <= int(data["year"]) <= CURRENT_YEAR + 1):
             raise HTTPException(status_code=422, detail="Invalid year")
 
-        valid_months = [
-            "January", "February", "March", "April", "May", "June",
-            "July", "August", "September", "October", "November", "December"
-        ]
-        if data["month"] not in valid_months:
+        if data["month"] not in VALID_MONTHS:
             raise HTTPException(status_code=422, detail=f"Invalid month '{data['month']}'")
 
-        if data["quarter"] not in {"Q1", "Q2", "Q3", "Q4"}:
+        if data["quarter"] not in VALID_QUARTERS:
             raise HTTPException(status_code=422, detail=f"Invalid quarter '{data['quarter']}'")
 
-        # Month-to-quarter validation
-        month_to_quarter = {
-            "January": "Q1", "February": "Q1", "March": "Q1",
-            "April": "Q2", "May": "Q2", "June": "Q2",
-            "July": "Q3", "August": "Q3", "September": "Q3",
-            "October": "Q4", "November": "Q4", "December": "Q4"
-        }
-        expected_quarter = month_to_quarter[data["month"]]
+        expected_quarter = MONTH_TO_QUARTER[data["month"]]
         if data["quarter"] != expected_quarter:
             raise HTTPException(
                 status_code=422,
@@ -981,7 +986,7 @@ def single_upload_water_discharge(data: dict, db: Session = Depends(get_db), use
         if not isinstance(data["year"], (int, float)) or not (1900 <= int(data["year"]) <= CURRENT_YEAR + 1):
             raise HTTPException(status_code=422, detail="Invalid year")
 
-        if data["quarter"] not in {"Q1", "Q2", "Q3", "Q4"}:
+        if data["quarter"] not in VALID_QUARTERS:
             raise HTTPException(status_code=422, detail=f"Invalid quarter '{data['quarter']}'")
 
         if not isinstance(data["volume"], (int, float)) or data["volume"] < 0:
@@ -1047,7 +1052,7 @@ def single_upload_water_consumption(data: dict, db: Session = Depends(get_db), u
         if not isinstance(data["year"], (int, float)) or not (1900 <= int(data["year"]) <= CURRENT_YEAR + 1):
             raise HTTPException(status_code=422, detail="Invalid year")
 
-        if data["quarter"] not in {"Q1", "Q2", "Q3", "Q4"}:
+        if data["quarter"] not in VALID_QUARTERS:
             raise HTTPException(status_code=422, detail=f"Invalid quarter '{data['quarter']}'")
 
         if not isinstance(data["volume"], (int, float)) or data["volume"] < 0:
@@ -1119,7 +1124,7 @@ def single_upload_electric_consumption(data: dict, db: Session = Depends(get_db)
         if not isinstance(data["consumption"], (int, float)) or data["consumption"] < 0:
             raise HTTPException(status_code=422, detail="Invalid consumption")
 
-        if data["quarter"] not in {"Q1", "Q2", "Q3", "Q4"}:
+        if data["quarter"] not in VALID_QUARTERS:
             raise HTTPException(status_code=422, detail=f"Invalid quarter '{data['quarter']}'")
 
         if not isinstance(data["year"], (int, float)) or not (1900 <= int(data["year"]) <= CURRENT_YEAR + 1):
@@ -1256,27 +1261,16 @@ def single_upload_non_hazard_waste(data: dict, db: Session = Depends(get_db), us
         if not isinstance(data["waste"], (int, float)) or data["waste"] < 0:
             raise HTTPException(status_code=422, detail="Invalid waste")
 
-        valid_months = [
-            "January", "February", "March", "April", "May", "June",
-            "July", "August", "September", "October", "November", "December"
-        ]
-        if data["month"] not in valid_months:
+        if data["month"] not in VALID_MONTHS:
             raise HTTPException(status_code=422, detail=f"Invalid month '{data['month']}'")
 
-        if data["quarter"] not in {"Q1", "Q2", "Q3", "Q4"}:
+        if data["quarter"] not in VALID_QUARTERS:
             raise HTTPException(status_code=422, detail=f"Invalid quarter '{data['quarter']}'")
 
         if not isinstance(data["year"], (int, float)) or not (1900 <= int(data["year"]) <= CURRENT_YEAR + 1):
             raise HTTPException(status_code=422, detail="Invalid year")
 
-        # Month-to-quarter validation
-        month_to_quarter = {
-            "January": "Q1", "February": "Q1", "March": "Q1",
-            "April": "Q2", "May": "Q2", "June": "Q2",
-            "July": "Q3", "August": "Q3", "September": "Q3",
-            "October": "Q4", "November": "Q4", "December": "Q4"
-        }
-        expected_quarter = month_to_quarter[data["month"]]
+        expected_quarter = MONTH_TO_QUARTER[data["month"]]
         if data["quarter"] != expected_quarter:
             raise HTTPException(
                 status_code=422,
@@ -1349,7 +1343,7 @@ def single_upload_hazard_waste_generated(data: dict, db: Session = Depends(get_d
         if not isinstance(data["waste_generated"], (int, float)) or data["waste_generated"] < 0:
             raise HTTPException(status_code=422, detail="Invalid waste_generated")
 
-        if data["quarter"] not in {"Q1", "Q2", "Q3", "Q4"}:
+        if data["quarter"] not in VALID_QUARTERS:
             raise HTTPException(status_code=422, detail=f"Invalid quarter '{data['quarter']}'")
 
         if not isinstance(data["year"], (int, float)) or not (1900 <= int(data["year"]) <= CURRENT_YEAR + 1):
@@ -1471,9 +1465,10 @@ def bulk_upload_water_abstraction(file: UploadFile = File(...), db: Session = De
         raise HTTPException(status_code=400, detail="Invalid file format. Please upload an Excel file.")
     
     try:
-        logging.info(f"Add bulk data")
-        contents = file.file.read()
-        df = pd.read_excel(BytesIO(contents))
+        logging.info("Add bulk data")
+        # UploadFile is already spooled to a temp file; parse it in place instead of
+        # copying the whole upload into a bytes object and a second BytesIO buffer
+        df = pd.read_excel(file.file, engine=EXCEL_ENGINE)
         df = normalize_dataframe_columns(df, 'water_abstraction')
 
         # basic validation...
@@ -1482,80 +1477,47 @@ def bulk_upload_water_abstraction(file: UploadFile = File(...), db: Session = De
             raise HTTPException(status_code=400, detail=f"Missing required columns: {required_columns - set(df.columns)}")
 
         # Get valid company IDs from CompanyMain
-        valid_company_ids = db.query(CompanyMain.company_id).all()
-        valid_company_ids_set = {company_id[0] for company_id in valid_company_ids}
+        valid_company_ids_set = distinct_values(db, CompanyMain.company_id)
 
         # Get valid units of measurement from database
-        valid_units = db.query(EnviWaterAbstraction.unit_of_measurement).all()
-        valid_units_set = {unit[0] for unit in valid_units}
-        
-        # Define month to quarter mapping
-        month_to_quarter = {
-            "January": "Q1", "February": "Q1", "March": "Q1",
-            "April": "Q2", "May": "Q2", "June": "Q2",
-            "July": "Q3", "August": "Q3", "September": "Q3",
-            "October": "Q4", "November": "Q4", "December": "Q4"
-        }
+        valid_units_set = distinct_values(db, EnviWaterAbstraction.unit_of_measurement)
 
-        # data cleaning & row-level validation
-        rows = []
-        validation_errors = []
+        # data cleaning & column-wise validation
         CURRENT_YEAR = datetime.now().year
-        
-        for i, row in df.iterrows():
-            row_number = i + 2  # Excel row number (accounting for header)
-            
-            # Company ID validation
-            if not isinstance(row["company_id"], str) or not row["company_id"].strip():
-                validation_errors.append(f"Row {row_number}: Invalid company_id")
-                continue
-
-            company_id_stripped = row["company_id"].strip()
-            if company_id_stripped not in valid_company_ids_set:
-                validation_errors.append(f"Row {row_number}: Company ID '{company_id_stripped}' does not exist in CompanyMain. Valid company IDs: {', '.join(sorted(valid_company_ids_set))}")
-                continue
-
-            if not isinstance(row["year"], (int, float)) or not (1900 <= int(row["year"]) <= CURRENT_YEAR + 1):
-                validation_errors.append(f"Row {row_number}: Invalid year")
-                continue
-
-            if row["month"] not in month_to_quarter.keys():
-                validation_errors.append(f"Row {row_number}: Invalid month '{row['month']}'")
-                continue
-
-            if row["quarter"] not in {"Q1", "Q2", "Q3", "Q4"}:
-                validation_errors.append(f"Row {row_number}: Invalid quarter '{row['quarter']}'")
-                continue
-
-            if not isinstance(row["volume"], (int, float)) or row["volume"] < 0:
-                validation_errors.append(f"Row {row_number}: Invalid volume")
-                continue
-
-            if not isinstance(row["unit_of_measurement"], str) or not row["unit_of_measurement"].strip():
-                validation_errors.append(f"Row {row_number}: Invalid unit_of_measurement")
-                continue
-
-            # Unit validation
-            unit_stripped = row["unit_of_measurement"].strip()
-            if unit_stripped not in valid_units_set:
-                validation_errors.append(f"Row {row_number}: Unit of measurement '{unit_stripped}' does not exist in database. Valid units: {', '.join(sorted(valid_units_set))}")
-                continue
-
-            # Month and quarter match validation
-            expected_quarter = month_to_quarter[row["month"]]
-            if row["quarter"] != expected_quarter:
-                validation_errors.append(f"Row {row_number}: Month '{row['month']}' should be in quarter '{expected_quarter}', but '{row['quarter']}' was provided")
-                continue
-
-            # If all validations pass, add to rows
-            rows.append({
-                "company_id": company_id_stripped,
-                "year": int(row["year"]),
-                "month": row["month"],
-                "quarter": row["quarter"],
-                "volume": float(row["volume"]),
-                "unit_of_measurement": unit_stripped,
-            })
+        company_ids = stripped_text_cells(df["company_id"])
+        units = stripped_text_cells(df["unit_of_measurement"])
+        years = numeric_cells(df["year"])
+        volumes = numeric_cells(df["volume"])
+        months = df["month"]
+        quarters = df["quarter"]
+        expected_quarters = months.map(MONTH_TO_QUARTER)
+
+        # Same checks and order as the former per-row loop; each row reports its first failure.
+        # 1900 <= int(year) <= CURRENT_YEAR + 1 is the same as 1900 <= year < CURRENT_YEAR + 2.
+        validation_errors, failed = first_row_errors(df.index, [
+            (company_ids.eq(""), lambda i: "Invalid company_id"),
+            (~company_ids.isin(valid_company_ids_set),
+             lambda i: f"Company ID '{company_ids[i]}' does not exist in CompanyMain. Valid company IDs: {joined_values(valid_company_ids_set)}"),
+            (~years.between(1900, CURRENT_YEAR + 2, inclusive="left"), lambda i: "Invalid year"),
+            (~months.isin(VALID_MONTHS), lambda i: f"Invalid month '{months[i]}'"),
+            (~quarters.isin(VALID_QUARTERS), lambda i: f"Invalid quarter '{quarters[i]}'"),
+            (~volumes.ge(0), lambda i: "Invalid volume"),
+            (units.eq(""), lambda i: "Invalid unit_of_measurement"),
+            (~units.isin(valid_units_set),
+             lambda i: f"Unit of measurement '{units[i]}' does not exist in database. Valid units: {joined_values(valid_units_set)}"),
+            (quarters.ne(expected_quarters),
+             lambda i: f"Month '{months[i]}' should be in quarter '{expected_quarters[i]}', but '{quarters[i]}' was provided"),
+        ])
+
+        valid = ~failed
+        rows = pd.DataFrame({
+            "company_id": company_ids[valid],
+            "year": years[valid].astype(int),
+            "month": months[valid],
+            "quarter": quarters[valid],
+            "volume": volumes[valid],
+            "unit_of_measurement": units[valid],
+        }).to_dict("records")
 
         # If there are validation errors, return them
         if validation_errors:
@@ -1617,8 +1579,7 @@ def bulk_upload_diesel_consumption(file: UploadFile = File(...), db: Session = D
     
     try:
         logging.info("Add bulk diesel consumption data")
-        contents = file.file.read()
-        df = pd.read_excel(BytesIO(contents))
+        df = pd.read_excel(file.file, engine=EXCEL_ENGINE)
         df = normalize_dataframe_columns(df, 'diesel_consumption')
 
         required_columns = {'company_id', 'cp_name', 'unit_of_measurement', 'consumption', 'date'}
@@ -1629,12 +1590,11 @@ def bulk_upload_diesel_consumption(file: UploadFile = File(...), db: Session = D
             )
 
         # Get valid company IDs from CompanyMain
-        valid_company_ids = db.query(CompanyMain.company_id).all()
-        valid_company_ids_set = {company_id[0] for company_id in valid_company_ids}
+        valid_company_ids_set = distinct_values(db, CompanyMain.company_id)
 
         # Fetch all valid unit_of_measurement values
-        valid_units = db.query(EnviDieselConsumption.unit_of_measurement).distinct().all()
-        valid_units_set = {unit[0].strip() for unit in valid_units}
+        valid_units = distinct_values(db, EnviDieselConsumption.unit_of_measurement)
+        valid_units_set = frozenset(unit.strip() for unit in valid_units)
 
         # Fetch all company properties and build cp_name lookup
         company_properties = db.query(EnviCompanyProperty).all()
@@ -1658,7 +1618,7 @@ def bulk_upload_diesel_consumption(file: UploadFile = File(...), db: Session = D
 
             company_id = row["company_id"].strip()
             if company_id not in valid_company_ids_set:
-                validation_errors.append(f"Row {row_number}: Company ID '{company_id}' does not exist in CompanyMain. Valid company IDs: {', '.join(sorted(valid_company_ids_set))}")
+                validation_errors.append(f"Row {row_number}: Company ID '{company_id}' does not exist in CompanyMain. Valid company IDs: {joined_values(valid_company_ids_set)}")
                 continue
 
             # Validate cp_name
@@ -1686,7 +1646,7 @@ def bulk_upload_diesel_consumption(file: UploadFile = File(...), db: Session = D
             unit_stripped = row["unit_of_measurement"].strip()
             if unit_stripped not in valid_units_set:
                 validation_errors.append(
-                    f"Row {row_number}: Unit of measurement '{unit_stripped}' does not exist in database. Valid units: {', '.join(sorted(valid_units_set))}"
+                    f"Row {row_number}: Unit of measurement '{unit_stripped}' does not exist in database. Valid units: {joined_values(valid_units_set)}"
                 )
                 continue
 
@@ -1772,9 +1732,8 @@ def bulk_upload_water_discharge(file: UploadFile = File(...), db: Session = Depe
         raise HTTPException(status_code=400, detail="Invalid file format. Please upload an Excel file.")
     
     try:
-        logging.info(f"Add bulk data")
-        contents = file.file.read()
-        df = pd.read_excel(BytesIO(contents))
+        logging.info("Add bulk data")
+        df = pd.read_excel(file.file, engine=EXCEL_ENGINE)
         df = normalize_dataframe_columns(df, 'water_discharge')
 
         # basic validation...
@@ -1783,12 +1742,10 @@ def bulk_upload_water_discharge(file: UploadFile = File(...), db: Session = Depe
             raise HTTPException(status_code=400, detail=f"Missing required columns: {required_columns - set(df.columns)}")
 
         # Get valid company IDs from CompanyMain
-        valid_company_ids = db.query(CompanyMain.company_id).all()
-        valid_company_ids_set = {company_id[0] for company_id in valid_company_ids}
+        valid_company_ids_set = distinct_values(db, CompanyMain.company_id)
 
         # Get valid units of measurement from database
-        valid_units = db.query(EnviWaterDischarge.unit_of_measurement).all()
-        valid_units_set = {unit[0] for unit in valid_units}
+        valid_units_set = distinct_values(db, EnviWaterDischarge.unit_of_measurement)
 
         # data cleaning & row-level validation
         rows = []
@@ -1805,14 +1762,14 @@ def bulk_upload_water_discharge(file: UploadFile = File(...), db: Session = Depe
 
             company_id_stripped = row["company_id"].strip()
             if company_id_stripped not in valid_company_ids_set:
-                validation_errors.append(f"Row {row_number}: Company ID '{company_id_stripped}' does not exist in CompanyMain. Valid company IDs: {', '.join(sorted(valid_company_ids_set))}")
+                validation_errors.append(f"Row {row_number}: Company ID '{company_id_stripped}' does not exist in CompanyMain. Valid company IDs: {joined_values(valid_company_ids_set)}")
                 continue
 
             if not isinstance(row["year"], (int, float)) or not (1900 <= int(row["year"]) <= CURRENT_YEAR + 1):
                 validation_errors.append(f"Row {row_number}: Invalid year")
                 continue
 
-            if row["quarter"] not in {"Q1", "Q2", "Q3", "Q4"}:
+            if row["quarter"] not in VALID_QUARTERS:
                 validation_errors.append(f"Row {row_number}: Invalid quarter '{row['quarter']}'")
                 continue
 
@@ -1827,7 +1784,7 @@ def bulk_upload_water_discharge(file: UploadFile = File(...), db: Session = Depe
             # Unit validation
             unit_stripped = row["unit_of_measurement"].strip()
             if unit_stripped not in valid_units_set:
-                validation_errors.append(f"Row {row_number}: Unit of measurement '{unit_stripped}' does not exist in database. Valid units: {', '.join(sorted(valid_units_set))}")
+                validation_errors.append(f"Row {row_number}: Unit of measurement '{unit_stripped}' does not exist in database. Valid units: {joined_values(valid_units_set)}")
                 continue
 
             # If all validations pass, add to rows
@@ -1893,9 +1850,8 @@ def bulk_upload_water_consumption(file: UploadFile = File(...), db: Session = De
         raise HTTPException(status_code=400, detail="Invalid file format. Please upload an Excel file.")
     
     try:
-        logging.info(f"Add bulk data")
-        contents = file.file.read()
-        df = pd.read_excel(BytesIO(contents))
+        logging.info("Add bulk data")
+        df = pd.read_excel(file.file, engine=EXCEL_ENGINE)
         df = normalize_dataframe_columns(df, 'water_consumption')
 
         # basic validation...
@@ -1904,12 +1860,10 @@ def bulk_upload_water_consumption(file: UploadFile = File(...), db: Session = De
             raise HTTPException(status_code=400, detail=f"Missing required columns: {required_columns - set(df.columns)}")
 
         # Get valid company IDs from CompanyMain
-        valid_company_ids = db.query(CompanyMain.company_id).all()
-        valid_company_ids_set = {company_id[0] for company_id in valid_company_ids}
+        valid_company_ids_set = distinct_values(db, CompanyMain.company_id)
 
         # Get valid units of measurement from database
-        valid_units = db.query(EnviWaterConsumption.unit_of_measurement).all()
-        valid_units_set = {unit[0] for unit in valid_units}
+        valid_units_set = distinct_values(db, EnviWaterConsumption.unit_of_measurement)
 
         # data cleaning & row-level validation
         rows = []
@@ -1926,14 +1880,14 @@ def bulk_upload_water_consumption(file: UploadFile = File(...), db: Session = De
 
             company_id_stripped = row["company_id"].strip()
             if company_id_stripped not in valid_company_ids_set:
-                validation_errors.append(f"Row {row_number}: Company ID '{company_id_stripped}' does not exist in CompanyMain. Valid company IDs: {', '.join(sorted(valid_company_ids_set))}")
+                validation_errors.append(f"Row {row_number}: Company ID '{company_id_stripped}' does not exist in CompanyMain. Valid company IDs: {joined_values(valid_company_ids_set)}")
                 continue
 
             if not isinstance(row["year"], (int, float)) or not (1900 <= int(row["year"]) <= CURRENT_YEAR + 1):
                 validation_errors.append(f"Row {row_number}: Invalid year")
                 continue
 
-            if row["quarter"] not in {"Q1", "Q2", "Q3", "Q4"}:
+            if row["quarter"] not in VALID_QUARTERS:
                 validation_errors.append(f"Row {row_number}: Invalid quarter '{row['quarter']}'")
                 continue
 
@@ -1948,7 +1902,7 @@ def bulk_upload_water_consumption(file: UploadFile = File(...), db: Session = De
             # Unit validation
             unit_stripped = row["unit_of_measurement"].strip()
             if unit_stripped not in valid_units_set:
-                validation_errors.append(f"Row {row_number}: Unit of measurement '{unit_stripped}' does not exist in database. Valid units: {', '.join(sorted(valid_units_set))}")
+                validation_errors.append(f"Row {row_number}: Unit of measurement '{unit_stripped}' does not exist in database. Valid units: {joined_values(valid_units_set)}")
                 continue
 
             # If all validations pass, add to rows
@@ -2014,9 +1968,8 @@ def bulk_upload_electric_consumption(file: UploadFile = File(...), db: Session =
         raise HTTPException(status_code=400, detail="Invalid file format. Please upload an Excel file.")
     
     try:
-        logging.info(f"Add bulk electric consumption data")
-        contents = file.file.read()
-        df = pd.read_excel(BytesIO(contents))
+        logging.info("Add bulk electric consumption data")
+        df = pd.read_excel(file.file, engine=EXCEL_ENGINE)
         df = normalize_dataframe_columns(df, 'electric_consumption')
 
         # basic validation...
@@ -2025,16 +1978,13 @@ def bulk_upload_electric_consumption(file: UploadFile = File(...), db: Session =
             raise HTTPException(status_code=400, detail=f"Missing required columns: {required_columns - set(df.columns)}")
 
         # Get valid company IDs from CompanyMain
-        valid_company_ids = db.query(CompanyMain.company_id).all()
-        valid_company_ids_set = {company_id[0] for company_id in valid_company_ids}
+        valid_company_ids_set = distinct_values(db, CompanyMain.company_id)
 
         # Get valid units of measurement from database
-        valid_units = db.query(EnviElectricConsumption.unit_of_measurement).all()
-        valid_units_set = {unit[0] for unit in valid_units}
+        valid_units_set = distinct_values(db, EnviElectricConsumption.unit_of_measurement)
         
         # Get valid sources from database
-        valid_sources = db.query(EnviElectricConsumption.source).all()
-        valid_sources_set = {source[0] for source in valid_sources}
+        valid_sources_set = distinct_values(db, EnviElectricConsumption.source)
 
         # data cleaning & row-level validation
         rows = []
@@ -2051,7 +2001,7 @@ def bulk_upload_electric_consumption(file: UploadFile = File(...), db: Session =
 
             company_id_stripped = row["company_id"].strip()
             if company_id_stripped not in valid_company_ids_set:
-                validation_errors.append(f"Row {row_number}: Company ID '{company_id_stripped}' does not exist in CompanyMain. Valid company IDs: {', '.join(sorted(valid_company_ids_set))}")
+                validation_errors.append(f"Row {row_number}: Company ID '{company_id_stripped}' does not exist in CompanyMain. Valid company IDs: {joined_values(valid_company_ids_set)}")
                 continue
 
             # Year validation
@@ -2060,7 +2010,7 @@ def bulk_upload_electric_consumption(file: UploadFile = File(...), db: Session =
                 continue
 
             # Quarter validation
-            if row["quarter"] not in {"Q1", "Q2", "Q3", "Q4"}:
+            if row["quarter"] not in VALID_QUARTERS:
                 validation_errors.append(f"Row {row_number}: Invalid quarter '{row['quarter']}'")
                 continue
 
@@ -2072,7 +2022,7 @@ def bulk_upload_electric_consumption(file: UploadFile = File(...), db: Session =
             # Source database validation
             source_stripped = row["source"].strip()
             if source_stripped not in valid_sources_set:
-                validation_errors.append(f"Row {row_number}: Source '{source_stripped}' does not exist in database. Valid sources: {', '.join(sorted(valid_sources_set))}")
+                validation_errors.append(f"Row {row_number}: Source '{source_stripped}' does not exist in database. Valid sources: {joined_values(valid_sources_set)}")
                 continue
 
             # Unit of measurement basic validation
@@ -2083,7 +2033,7 @@ def bulk_upload_electric_consumption(file: UploadFile = File(...), db: Session =
             # Unit of measurement database validation
             unit_stripped = row["unit_of_measurement"].strip()
             if unit_stripped not in valid_units_set:
-                validation_errors.append(f"Row {row_number}: Unit of measurement '{unit_stripped}' does not exist in database. Valid units: {', '.join(sorted(valid_units_set))}")
+                validation_errors.append(f"Row {row_number}: Unit of measurement '{unit_stripped}' does not exist in database. Valid units: {joined_values(valid_units_set)}")
                 continue
 
             # Consumption validation
@@ -2156,8 +2106,7 @@ def bulk_upload_non_hazard_waste(file: UploadFile = File(...), db: Session = Dep
 
     try:
         logging.info("Add bulk non-hazard waste data")
-        contents = file.file.read()
-        df = pd.read_excel(BytesIO(contents))
+        df = pd.read_excel(file.file, engine=EXCEL_ENGINE)
         df = normalize_dataframe_columns(df, 'non_hazard_waste')
 
         required_columns = {
@@ -2168,19 +2117,12 @@ def bulk_upload_non_hazard_waste(file: UploadFile = File(...), db: Session = Dep
             raise HTTPException(status_code=400, detail=f"Missing required columns: {required_columns - set(df.columns)}")
 
         # Get valid company IDs from CompanyMain
-        valid_company_ids = db.query(CompanyMain.company_id).all()
-        valid_company_ids_set = {company_id[0] for company_id in valid_company_ids}
+        valid_company_ids_set = distinct_values(db, CompanyMain.company_id)
 
         # Pre-fetch valid entries from the database
-        valid_units = {row[0] for row in db.query(EnviNonHazardWaste.unit_of_measurement).all()}
-        valid_metrics = {row[0] for row in db.query(EnviNonHazardWaste.metrics).all()}
-
-        month_to_quarter = {
-            "January": "Q1", "February": "Q1", "March": "Q1",
-            "April": "Q2", "May": "Q2", "June": "Q2",
-            "July": "Q3", "August": "Q3", "September": "Q3",
-            "October": "Q4", "November": "Q4", "December": "Q4"
-        }
+        valid_units = distinct_values(db, EnviNonHazardWaste.unit_of_measurement)
+        valid_metrics = distinct_values(db, EnviNonHazardWaste.metrics)
+
 
         CURRENT_YEAR = datetime.now().year
         rows = []
@@ -2203,22 +2145,22 @@ def bulk_upload_non_hazard_waste(file: UploadFile = File(...), db: Session = Dep
                 continue
 
             if company_id not in valid_company_ids_set:
-                validation_errors.append(f"Row {row_number}: Company ID '{company_id}' does not exist in CompanyMain. Valid company IDs: {', '.join(sorted(valid_company_ids_set))}")
+                validation_errors.append(f"Row {row_number}: Company ID '{company_id}' does not exist in CompanyMain. Valid company IDs: {joined_values(valid_company_ids_set)}")
                 continue
 
             if year is None or not (1900 <= year <= CURRENT_YEAR + 1):
                 validation_errors.append(f"Row {row_number}: Invalid year")
                 continue
 
-            if month not in month_to_quarter:
+            if month not in VALID_MONTHS:
                 validation_errors.append(f"Row {row_number}: Invalid month '{month}'")
                 continue
 
-            if quarter not in {"Q1", "Q2", "Q3", "Q4"}:
+            if quarter not in VALID_QUARTERS:
                 validation_errors.append(f"Row {row_number}: Invalid quarter '{quarter}'")
                 continue
 
-            expected_quarter = month_to_quarter[month]
+            expected_quarter = MONTH_TO_QUARTER[month]
             if quarter != expected_quarter:
                 validation_errors.append(f"Row {row_number}: Month '{month}' should be in quarter '{expected_quarter}', but '{quarter}' was provided")
                 continue
@@ -2228,7 +2170,7 @@ def bulk_upload_non_hazard_waste(file: UploadFile = File(...), db: Session = Dep
                 continue
 
             if metrics not in valid_metrics:
-                validation_errors.append(f"Row {row_number}: Metrics '{metrics}' not found. Valid: {', '.join(sorted(valid_metrics))}")
+                validation_errors.append(f"Row {row_number}: Metrics '{metrics}' not found. Valid: {joined_values(valid_metrics)}")
                 continue
 
             if not unit:
@@ -2236,7 +2178,7 @@ def bulk_upload_non_hazard_waste(file: UploadFile = File(...), db: Session = Dep
                 continue
 
             if unit not in valid_units:
-                validation_errors.append(f"Row {row_number}: Unit '{unit}' not found. Valid: {', '.join(sorted(valid_units))}")
+                validation_errors.append(f"Row {row_number}: Unit '{unit}' not found. Valid: {joined_values(valid_units)}")
                 continue
 
             if waste is None or waste < 0:
@@ -2305,9 +2247,8 @@ def bulk_upload_hazard_waste_generated(file: UploadFile = File(...), db: Session
         raise HTTPException(status_code=400, detail="Invalid file format. Please upload an Excel file.")
     
     try:
-        logging.info(f"Add bulk hazard waste generated data")
-        contents = file.file.read()
-        df = pd.read_excel(BytesIO(contents))
+        logging.info("Add bulk hazard waste generated data")
+        df = pd.read_excel(file.file, engine=EXCEL_ENGINE)
         df = normalize_dataframe_columns(df, 'hazard_waste_generated')
 
         # basic validation...
@@ -2316,15 +2257,12 @@ def bulk_upload_hazard_waste_generated(file: UploadFile = File(...), db: Session
             raise HTTPException(status_code=400, detail=f"Missing required columns: {required_columns - set(df.columns)}")
 
         # Get valid company IDs from CompanyMain
-        valid_company_ids = db.query(CompanyMain.company_id).all()
-        valid_company_ids_set = {company_id[0] for company_id in valid_company_ids}
+        valid_company_ids_set = distinct_values(db, CompanyMain.company_id)
 
         # Get valid units and metrics from database
-        valid_units = db.query(EnviHazardWasteGenerated.unit_of_measurement).all()
-        valid_units_set = {unit[0] for unit in valid_units}
+        valid_units_set = distinct_values(db, EnviHazardWasteGenerated.unit_of_measurement)
 
-        valid_metrics = db.query(EnviHazardWasteGenerated.metrics).all()
-        valid_metrics_set = {metric[0] for metric in valid_metrics}
+        valid_metrics_set = distinct_values(db, EnviHazardWasteGenerated.metrics)
 
         # data cleaning & row-level validation
         rows = []
@@ -2341,14 +2279,14 @@ def bulk_upload_hazard_waste_generated(file: UploadFile = File(...), db: Session
 
             company_id_stripped = row["company_id"].strip()
             if company_id_stripped not in valid_company_ids_set:
-                validation_errors.append(f"Row {row_number}: Company ID '{company_id_stripped}' does not exist in CompanyMain. Valid company IDs: {', '.join(sorted(valid_company_ids_set))}")
+                validation_errors.append(f"Row {row_number}: Company ID '{company_id_stripped}' does not exist in CompanyMain. Valid company IDs: {joined_values(valid_company_ids_set)}")
                 continue
 
             if not isinstance(row["year"], (int, float)) or not (1900 <= int(row["year"]) <= CURRENT_YEAR + 1):
                 validation_errors.append(f"Row {row_number}: Invalid year")
                 continue
 
-            if row["quarter"] not in {"Q1", "Q2", "Q3", "Q4"}:
+            if row["quarter"] not in VALID_QUARTERS:
                 validation_errors.append(f"Row {row_number}: Invalid quarter '{row['quarter']}'")
                 continue
 
@@ -2358,7 +2296,7 @@ def bulk_upload_hazard_waste_generated(file: UploadFile = File(...), db: Session
 
             metrics_stripped = row["metrics"].strip()
             if metrics_stripped not in valid_metrics_set:
-                validation_errors.append(f"Row {row_number}: Metrics '{metrics_stripped}' does not exist in database. Valid metrics: {', '.join(sorted(valid_metrics_set))}")
+                validation_errors.append(f"Row {row_number}: Metrics '{metrics_stripped}' does not exist in database. Valid metrics: {joined_values(valid_metrics_set)}")
                 continue
 
             if not isinstance(row["unit_of_measurement"], str) or not row["unit_of_measurement"].strip():
@@ -2367,7 +2305,7 @@ def bulk_upload_hazard_waste_generated(file: UploadFile = File(...), db: Session
 
             unit_stripped = row["unit_of_measurement"].strip()
             if unit_stripped not in valid_units_set:
-                validation_errors.append(f"Row {row_number}: Unit of measurement '{unit_stripped}' does not exist in database. Valid units: {', '.join(sorted(valid_units_set))}")
+                validation_errors.append(f"Row {row_number}: Unit of measurement '{unit_stripped}' does not exist in database. Valid units: {joined_values(valid_units_set)}")
                 continue
 
             if not isinstance(row["waste_generated"], (int, float)) or row["waste_generated"] < 0:
@@ -2435,8 +2373,7 @@ def bulk_upload_hazard_waste_disposed(file: UploadFile = File(...), db: Session
     
     try:
         logging.info("Add bulk hazard waste disposed data")
-        contents = file.file.read()
-        df = pd.read_excel(BytesIO(contents))
+        df = pd.read_excel(file.file, engine=EXCEL_ENGINE)
         df = normalize_dataframe_columns(df, 'hazard_waste_disposed')
 
         # basic validation...
@@ -2445,15 +2382,11 @@ def bulk_upload_hazard_waste_disposed(file: UploadFile = File(...), db: Session
             raise HTTPException(status_code=400, detail=f"Missing required columns: {required_columns - set(df.columns)}")
 
         # Get valid company IDs from CompanyMain
-        valid_company_ids = db.query(CompanyMain.company_id).all()
-        valid_company_ids_set = {company_id[0] for company_id in valid_company_ids}
+        valid_company_ids_set = distinct_values(db, CompanyMain.company_id)
 
         # Fetch valid units and metrics from database
-        valid_units = db.query(EnviHazardWasteDisposed.unit_of_measurement).distinct().all()
-        valid_metrics = db.query(EnviHazardWasteDisposed.metrics).distinct().all()
-
-        valid_units_set = {unit[0] for unit in valid_units}
-        valid_metrics_set = {metric[0] for metric in valid_metrics}
+        valid_units_set = distinct_values(db, EnviHazardWasteDisposed.unit_of_measurement)
+        valid_metrics_set = distinct_values(db, EnviHazardWasteDisposed.metrics)
 
         rows = []
         validation_errors = []
@@ -2578,8 +2511,8 @@ async def create_data_template(
             excel_file = create_all_templates()
             filename = f"environmental_data_templates_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
             
-            return StreamingResponse(
-                io.BytesIO(excel_file.read()),
+            return Response(
+                content=excel_file.getvalue(),
                 media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
                 headers={"Content-Disposition": f"attachment; filename={filename}"}
             )
@@ -2588,8 +2521,8 @@ async def create_data_template(
             excel_file = create_excel_template(table_type.value, include_examples)
             template = TEMPLATE_DEFINITIONS[table_type.value]
             
-            return StreamingResponse(
-                io.BytesIO(excel_file.read()),
+            return Response(
+                content=excel_file.getvalue(),
                 media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
                 headers={"Content-Disposition": f"attachment; filename={template['filename']}"}
             )
@@ -2647,8 +2580,8 @@ async def create_individual_template(
         excel_file = create_excel_template(template_key, include_examples)
         template = TEMPLATE_DEFINITIONS[template_key]
         
-        return StreamingResponse(
-            io.BytesIO(excel_file.read()),
+        return Response(
+            content=excel_file.getvalue(),
             media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
             headers={"Content-Disposition": f"attachment; filename={template['filename']}"}
         )
@@ -2661,7 +2594,7 @@ async def create_individual_template(
 @router.get("/distinct_cp_names/{company_name}", response_model=List[dict])
 def get_distinct_cp_names(company_name: str, db: Session = Depends(get_db)):
     try:
-        logging.info(f"Fetching distinct cp_id, cp_name for company_name: {company_name}")
+        logging.info("Fetching distinct cp_id, cp_name for company_name: %s", company_name)
 
         query = text("""
             SELECT DISTINCT ecp.cp_id, ecp.cp_name
@@ -2673,12 +2606,11 @@ def get_distinct_cp_names(company_name: str, db: Session = Depends(get_db)):
         result = db.execute(query, {"company_name": company_name})
         data = [dict(row._mapping) for row in result]
 
-        logging.info(f"Returned {len(data)} entries for company_name: {company_name}")
+        logging.info("Returned %s entries for company_name: %s", len(data), company_name)
         return data
 
-    except Exception as e:
-        logging.error(f"Error retrieving cp_id and cp_name values: {str(e)}")
-        logging.error(traceback.format_exc())
+    except Exception:
+        logging.exception("Error retrieving cp_id and cp_name values")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @router.get("/distinct_cp_type", response_model=List[dict])
@@ -2693,12 +2625,11 @@ def get_distinct_cp_type(db: Session = Depends(get_db)):
         result = db.execute(query)
         data = [{"cp_type": row.cp_type} for row in result]
 
-        logging.info(f"Returned {len(data)} distinct cp_type")
+        logging.info("Returned %s distinct cp_type", len(data))
         return data
 
-    except Exception as e:
-        logging.error(f"Error retrieving distinct cp_type: {str(e)}")
-        logging.error(traceback.format_exc())
+    except Exception:
+        logging.exception("Error retrieving distinct cp_type")
         raise HTTPException(status_code=500, detail="Internal server error")
     
 @router.get("/distinct_diesel_consumption_unit", response_model=List[Dict[str, str]])
@@ -2716,12 +2647,11 @@ def get_distinct_diesel_consumption_unit(db: Session = Depends(get_db)):
         result = db.execute(query)
         data = [{"unit": row.unit} for row in result]
 
-        logging.info(f"Returned {len(data)} distinct unit")
+        logging.info("Returned %s distinct unit", len(data))
         return data
 
-    except Exception as e:
-        logging.error(f"Error retrieving distinct unit: {str(e)}")
-        logging.error(traceback.format_exc())
+    except Exception:
+        logging.exception("Error retrieving distinct unit")
         raise HTTPException(status_code=500, detail="Internal server error")
     
 @router.get("/distinct_water_unit", response_model=List[Dict[str, str]])
@@ -2739,12 +2669,11 @@ def get_distinct_water_unit(db: Session = Depends(get_db)):
         result = db.execute(query)
         data = [{"unit": row.unit} for row in result]
 
-        logging.info(f"Returned {len(data)} distinct unit")
+        logging.info("Returned %s distinct unit", len(data))
         return data
 
-    except Exception as e:
-        logging.error(f"Error retrieving distinct unit: {str(e)}")
-        logging.error(traceback.format_exc())
+    except Exception:
+        logging.exception("Error retrieving distinct unit")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @router.get("/distinct_haz_waste_generated", response_model=List[Dict[str, str]])
@@ -2762,12 +2691,11 @@ def get_distinct_haz_waste_generated(db: Session = Depends(get_db)):
         result = db.execute(query)
         data = [{"metrics": row.metrics} for row in result]
 
-        logging.info(f"Returned {len(data)} distinct metrics")
+        logging.info("Returned %s distinct metrics", len(data))
         return data
 
-    except Exception as e:
-        logging.error(f"Error retrieving distinct metrics: {str(e)}")
-        logging.error(traceback.format_exc())
+    except Exception:
+        logging.exception("Error retrieving distinct metrics")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @router.get("/distinct_hazard_waste_gen_unit", response_model=List[Dict[str, str]])
@@ -2798,12 +2726,11 @@ def get_distinct_hazard_waste_gen_unit(
 
         data = [{"unit": row.unit} for row in result]
 
-        logging.info(f"Returned {len(data)} distinct unit(s)")
+        logging.info("Returned %s distinct unit(s)", len(data))
         return data
 
-    except Exception as e:
-        logging.error(f"Error retrieving distinct unit: {str(e)}")
-        logging.error(traceback.format_exc())
+    except Exception:
+        logging.exception("Error retrieving distinct unit")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @router.get("/distinct_haz_waste_disposed", response_model=List[Dict[str, str]])
@@ -2821,12 +2748,11 @@ def get_distinct_haz_waste_disposed(db: Session = Depends(get_db)):
         result = db.execute(query)
         data = [{"metrics": row.metrics} for row in result]
 
-        logging.info(f"Returned {len(data)} distinct metrics")
+        logging.info("Returned %s distinct metrics", len(data))
         return data
 
-    except Exception as e:
-        logging.error(f"Error retrieving distinct metrics: {str(e)}")
-        logging.error(traceback.format_exc())
+    except Exception:
+        logging.exception("Error retrieving distinct metrics")
         raise HTTPException(status_code=500, detail="Internal server error")
     
 @router.get("/distinct_hazard_waste_dis_unit", response_model=List[Dict[str, str]])
@@ -2857,12 +2783,11 @@ def get_distinct_hazard_waste_dis_unit(
 
         data = [{"unit": row.unit} for row in result]
 
-        logging.info(f"Returned {len(data)} distinct unit(s)")
+        logging.info("Returned %s distinct unit(s)", len(data))
         return data
 
-    except Exception as e:
-        logging.error(f"Error retrieving distinct unit: {str(e)}")
-        logging.error(traceback.format_exc())
+    except Exception:
+        logging.exception("Error retrieving distinct unit")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @router.get("/distinct_non_haz_waste_metrics", response_model=List[Dict[str, str]])
@@ -2880,12 +2805,11 @@ def get_distinct_non_haz_waste_metrics(db: Session = Depends(get_db)):
         result = db.execute(query)
         data = [{"metrics": row.metrics} for row in result]
 
-        logging.info(f"Returned {len(data)} distinct metrics")
+        logging.info("Returned %s distinct metrics", len(data))
         return data
 
-    except Exception as e:
-        logging.error(f"Error retrieving distinct metrics: {str(e)}")
-        logging.error(traceback.format_exc())
+    except Exception:
+        logging.exception("Error retrieving distinct metrics")
         raise HTTPException(status_code=500, detail="Internal server error")
     
 @router.get("/distinct_non_haz_waste_unit", response_model=List[Dict[str, str]])
@@ -2916,12 +2840,11 @@ def get_distinct_non_haz_waste_unit(
 
         data = [{"unit": row.unit} for row in result]
 
-        logging.info(f"Returned {len(data)} distinct unit(s)")
+        logging.info("Returned %s distinct unit(s)", len(data))
         return data
 
-    except Exception as e:
-        logging.error(f"Error retrieving distinct unit: {str(e)}")
-        logging.error(traceback.format_exc())
+    except Exception:
+        logging.exception("Error retrieving distinct unit")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
@@ -2940,12 +2863,11 @@ def get_distinct_electric_source(db: Session = Depends(get_db)):
         result = db.execute(query)
         data = [{"source": row.source} for row in result]
 
-        logging.info(f"Returned {len(data)} distinct source")
+        logging.info("Returned %s distinct source", len(data))
         return data
 
-    except Exception as e:
-        logging.error(f"Error retrieving distinct source: {str(e)}")
-        logging.error(traceback.format_exc())
+    except Exception:
+        logging.exception("Error retrieving distinct source")
         raise HTTPException(status_code=500, detail="Internal server error")
     
 @router.get("/distinct_electric_consumption_unit", response_model=List[Dict[str, str]])
@@ -2963,12 +2885,11 @@ def get_distinct_electric_consumption_unit(db: Session = Depends(get_db)):
         result = db.execute(query)
         data = [{"unit": row.unit} for row in result]
 
-        logging.info(f"Returned {len(data)} distinct unit")
+        logging.info("Returned %s distinct unit", len(data))
         return data
 
-    except Exception as e:
-        logging.error(f"Error retrieving distinct unit: {str(e)}")
-        logging.error(traceback.format_exc())
+    except Exception:
+        logging.exception("Error retrieving distinct unit")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 # for experorting data to Excel
@@ -3012,10 +2933,8 @@ async def export_excel(request: Request):
     with pd.ExcelWriter(output, engine="openpyxl") as writer:
         df.to_excel(writer, index=False, sheet_name="Filtered Data")
 
-    output.seek(0)
-
-    return StreamingResponse(
-        output,
+    return Response(
+        content=output.getvalue(),
         media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
         headers={
             "Content-Disposition": "attachment; filename=exported_data.xlsx"
@@ -3053,28 +2972,18 @@ def edit_water_abstraction(
         if not isinstance(data["year"], (int, float)) or not (1900 <= int(data["year"]) <= datetime.now().year + 1):
             raise HTTPException(status_code=422, detail="Invalid year")
 
-        if data["month"] not in [
-            "January", "February", "March", "April", "May", "June",
-            "July", "August", "September", "October", "November", "December"
-        ]:
+        if data["month"] not in VALID_MONTHS:
             raise HTTPException(status_code=422, detail=f"Invalid month '{data['month']}'")
 
-        if data["quarter"] not in {"Q1", "Q2", "Q3", "Q4"}:
+        if data["quarter"] not in VALID_QUARTERS:
             raise HTTPException(status_code=422, detail=f"Invalid quarter '{data['quarter']}'")
 
         # Validate quarter-month consistency
-        quarter_months = {
-            "Q1": ["January", "February", "March"],
-            "Q2": ["April", "May", "June"],
-            "Q3": ["July", "August", "September"],
-            "Q4": ["October", "November", "December"]
-        }
-        
-        if data["month"] not in quarter_months[data["quarter"]]:
+        if MONTH_TO_QUARTER[data["month"]] != data["quarter"]:
             raise HTTPException(
                 status_code=422, 
                 detail=f"Month '{data['month']}' does not belong to quarter '{data['quarter']}'. "
-                       f"Valid months for {data['quarter']} are: {', '.join(quarter_months[data['quarter']])}"
+                       f"Valid months for {data['quarter']} are: {', '.join(QUARTER_MONTHS[data['quarter']])}"
             )
 
         if not isinstance(data["volume"], (int, float)) or data["volume"] < 0:
@@ -3149,7 +3058,7 @@ def edit_water_discharge(
         if not isinstance(data["year"], (int, float)) or not (1900 <= int(data["year"]) <= datetime.now().year + 1):
             raise HTTPException(status_code=422, detail="Invalid year")
 
-        if data["quarter"] not in {"Q1", "Q2", "Q3", "Q4"}:
+        if data["quarter"] not in VALID_QUARTERS:
             raise HTTPException(status_code=422, detail=f"Invalid quarter '{data['quarter']}'")
 
         if not isinstance(data["volume"], (int, float)) or data["volume"] < 0:
@@ -3223,7 +3132,7 @@ def edit_water_consumption(
         if not isinstance(data["year"], (int, float)) or not (1900 <= int(data["year"]) <= datetime.now().year + 1):
             raise HTTPException(status_code=422, detail="Invalid year")
 
-        if data["quarter"] not in {"Q1", "Q2", "Q3", "Q4"}:
+        if data["quarter"] not in VALID_QUARTERS:
             raise HTTPException(status_code=422, detail=f"Invalid quarter '{data['quarter']}'")
 
         if not isinstance(data["volume"], (int, float)) or data["volume"] < 0:
@@ -3297,7 +3206,7 @@ def edit_electric_consumption(
         if not isinstance(data["year"], (int, float)) or not (1900 <= int(data["year"]) <= datetime.now().year + 1):
             raise HTTPException(status_code=422, detail="Invalid year")
 
-        if data["quarter"] not in {"Q1", "Q2", "Q3", "Q4"}:
+        if data["quarter"] not in VALID_QUARTERS:
             raise HTTPException(status_code=422, detail=f"Invalid quarter '{data['quarter']}'")
 
         if not isinstance(data["source"], str) or not data["source"].strip():
@@ -3375,7 +3284,7 @@ def edit_non_hazard_waste(
         if not isinstance(data["year"], (int, float)) or not (1900 <= int(data["year"]) <= datetime.now().year + 1):
             raise HTTPException(status_code=422, detail="Invalid year")
 
-        if data["quarter"] not in {"Q1", "Q2", "Q3", "Q4"}:
+        if data["quarter"] not in VALID_QUARTERS:
             raise HTTPException(status_code=422, detail=f"Invalid quarter '{data['quarter']}'")
 
         if not isinstance(data["metrics"], str) or not data["metrics"].strip():
@@ -3453,7 +3362,7 @@ def edit_hazard_waste_generated(
         if not isinstance(data["year"], (int, float)) or not (1900 <= int(data["year"]) <= datetime.now().year + 1):
             raise HTTPException(status_code=422, detail="Invalid year")
 
-        if data["quarter"] not in {"Q1", "Q2", "Q3", "Q4"}:
+        if data["quarter"] not in VALID_QUARTERS:
             raise HTTPException(status_code=422, detail=f"Invalid quarter '{data['quarter']}'")
 
         if not isinstance(data["metrics"], str) or not data["metrics"].strip():
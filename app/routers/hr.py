@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, Query, HTTPException, Request, UploadFile, File
 import pandas as pd
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response
 from typing import Optional, List, Dict, Union
 from sqlalchemy.orm import Session
 from sqlalchemy import text
@@ -9,6 +9,11 @@ from io import BytesIO
 import logging
 import traceback
 import io
+from functools import lru_cache
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font
+from openpyxl.utils import get_column_letter
 
 from ..auth_decorators import get_user_info
 from ..services.audit_trail import append_audit_trail
@@ -51,24 +56,38 @@ from app.bronze.schemas import (
 )
 
 from datetime import datetime
+from app.utils.excel_upload import EXCEL_ENGINE
 
 router = APIRouter()
 
+# Bold header row, as pandas.to_excel used to write it
+_HEADER_FONT = Font(bold=True)
+
 # Function to create a template
-def create_excel_template(headers: List[str], filename: str) -> io.BytesIO:
-    df = pd.DataFrame({header: [] for header in headers})
+@lru_cache(maxsize=None)
+def _excel_template_bytes(headers: tuple) -> bytes:
+    # Write-only workbook: no DataFrame or ExcelWriter, and widths are set up front
+    # instead of walking worksheet.columns afterwards
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(title="Sheet1")
+    for col, header in enumerate(headers, start=1):
+        ws.column_dimensions[get_column_letter(col)].width = len(str(header)) + 2
+
+    header_cells = []
+    for header in headers:
+        cell = WriteOnlyCell(ws, value=header)
+        cell.font = _HEADER_FONT
+        header_cells.append(cell)
+    ws.append(header_cells)
+
     output = io.BytesIO()
-    
-    with pd.ExcelWriter(output, engine='openpyxl') as writer:
-        df.to_excel(writer, index=False)
-        worksheet = writer.sheets['Sheet1']
-        
-        for column in worksheet.columns:
-            max_length = len(str(column[0].value)) + 2
-            worksheet.column_dimensions[column[0].column_letter].width = max_length
-    
-    output.seek(0)
-    return output
+    wb.save(output)
+    return output.getvalue()
+
+def create_excel_template(headers: List[str], filename: str) -> bytes:
+    # The workbook depends only on the headers, so each template is built once
+    # per process and later downloads send the cached bytes as they are
+    return _excel_template_bytes(tuple(headers))
 
 # ====================== DASHBOARD OVERVIEW ======================
 @router.get("/overview_safety_manhours", response_model=List[dict])
@@ -86,8 +105,8 @@ def get_overview_safety_manhours(
                 for row in result
                 ]
         
-        logging.info(f"Query returned {len(data)} rows")
-        logging.debug(f"Data: {data}")
+        logging.info("Query returned %s rows", len(data))
+        logging.debug("Data: %s", data)
         
         if not data:
             logging.warning("No data found")
@@ -95,8 +114,7 @@ def get_overview_safety_manhours(
 
         return data
     except Exception as e:
-        logging.error(f"Error fetching data: {str(e)}")
-        logging.error(traceback.format_exc())
+        logging.exception("Error fetching data")
         raise HTTPException(status_code=500, detail=str(e))
     
 @router.get("/overview_safety_manpower", response_model=List[dict])
@@ -115,8 +133,8 @@ def get_overview_safety_manpower(
                 for row in result
                 ]
         
-        logging.info(f"Query returned {len(data)} rows")
-        logging.debug(f"Data: {data}")
+        logging.info("Query returned %s rows", len(data))
+        logging.debug("Data: %s", data)
         
         if not data:
             logging.warning("No data found")
@@ -124,8 +142,7 @@ def get_overview_safety_manpower(
 
         return data
     except Exception as e:
-        logging.error(f"Error fetching data: {str(e)}")
-        logging.error(traceback.format_exc())
+        logging.exception("Error fetching data")
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/overview_training", response_model=List[dict])
@@ -144,8 +161,8 @@ def get_overview_training(
                 for row in result
                 ]
         
-        logging.info(f"Query returned {len(data)} rows")
-        logging.debug(f"Data: {data}")
+        logging.info("Query returned %s rows", len(data))
+        logging.debug("Data: %s", data)
         
         if not data:
             logging.warning("No data found")
@@ -153,8 +170,7 @@ def get_overview_training(
 
         return data
     except Exception as e:
-        logging.error(f"Error fetching data: {str(e)}")
-        logging.error(traceback.format_exc())
+        logging.exception("Error fetching data")
         raise HTTPException(status_code=500, detail=str(e))
 
 # ====================== DASHBOARD ======================
@@ -200,8 +216,8 @@ def get_total_safety_manhours(
             for row in result
         ]
         
-        logging.info(f"Query returned {len(data)} rows")
-        logging.debug(f"Data: {data}")
+        logging.info("Query returned %s rows", len(data))
+        logging.debug("Data: %s", data)
         
         if not data:
             logging.warning("No data found")
@@ -209,8 +225,7 @@ def get_total_safety_manhours(
 
         return data
     except Exception as e:
-        logging.error(f"Error fetching data: {str(e)}")
-        logging.error(traceback.format_exc())
+        logging.exception("Error fetching data")
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/total_safety_manpower", response_model=List[dict])
@@ -253,8 +268,8 @@ def get_total_safety_manhours(
             for row in result
         ]
         
-        logging.info(f"Query returned {len(data)} rows")
-        logging.debug(f"Data: {data}")
+        logging.info("Query returned %s rows", len(data))
+        logging.debug("Data: %s", data)
         
         if not data:
             logging.warning("No data found")
@@ -262,8 +277,7 @@ def get_total_safety_manhours(
 
         return data
     except Exception as e:
-        logging.error(f"Error fetching data: {str(e)}")
-        logging.error(traceback.format_exc())
+        logging.exception("Error fetching data")
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/total_training_hours", response_model=List[dict])
@@ -303,8 +317,8 @@ def get_total_training_hours(
             for row in result
         ]
         
-        logging.info(f"Query returned {len(data)} rows")
-        logging.debug(f"Data: {data}")
+        logging.info("Query returned %s rows", len(data))
+        logging.debug("Data: %s", data)
         
         if not data:
             logging.warning("No data found")
@@ -312,8 +326,7 @@ def get_total_training_hours(
 
         return data
     except Exception as e:
-        logging.error(f"Error fetching data: {str(e)}")
-        logging.error(traceback.format_exc())
+        logging.exception("Error fetching data")
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/no_lost_time", response_model=List[dict])
@@ -346,9 +359,9 @@ def get_no_lost_time(
         
         if latest_lti_date is None:
             latest_lti_date = None
-            logging.info(f"No LTI found. Using default start date: {latest_lti_date}")
+            logging.info("No LTI found. Using default start date: %s", latest_lti_date)
         else:
-            logging.info(f"Latest LTI found. Using start date: {latest_lti_date}")
+            logging.info("Latest LTI found. Using start date: %s", latest_lti_date)
         
         if end_date is None:
             # Set to today's date
@@ -372,8 +385,8 @@ def get_no_lost_time(
             for row in result
         ]
         
-        logging.info(f"Query returned {len(data)} rows")
-        logging.debug(f"Data: {data}")
+        logging.info("Query returned %s rows", len(data))
+        logging.debug("Data: %s", data)
         
         if not data:
             logging.warning("No data found")
@@ -381,8 +394,7 @@ def get_no_lost_time(
 
         return data
     except Exception as e:
-        logging.error(f"Error fetching data: {str(e)}")
-        logging.error(traceback.format_exc())
+        logging.exception("Error fetching data")
         raise HTTPException(status_code=500, detail=str(e))
     
 # ===== CHARTS =====
@@ -431,8 +443,8 @@ def get_employee_count_per_company(
             for row in result
         ]
         
-        logging.info(f"Query returned {len(data)} rows")
-        logging.debug(f"Data: {data}")
+        logging.info("Query returned %s rows", len(data))
+        logging.debug("Data: %s", data)
         
         if not data:
             logging.warning("No data found")
@@ -440,8 +452,7 @@ def get_employee_count_per_company(
 
         return data
     except Exception as e:
-        logging.error(f"Error fetching data: {str(e)}")
-        logging.error(traceback.format_exc())
+        logging.exception("Error fetching data")
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/gender_distribution_per_position", response_model=List[dict])
@@ -489,8 +500,8 @@ def get_gender_distribution_per_position(
             for row in result
         ]
         
-        logging.info(f"Query returned {len(data)} rows")
-        logging.debug(f"Data: {data}")
+        logging.info("Query returned %s rows", len(data))
+        logging.debug("Data: %s", data)
         
         if not data:
             logging.warning("No data found")
@@ -498,8 +509,7 @@ def get_gender_distribution_per_position(
 
         return data
     except Exception as e:
-        logging.error(f"Error fetching data: {str(e)}")
-        logging.error(traceback.format_exc())
+        logging.exception("Error fetching data")
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/age_distribution", response_model=List[dict])
@@ -541,8 +551,8 @@ def get_age_distribution(
             for row in result
         ]
         
-        logging.info(f"Query returned {len(data)} rows")
-        logging.debug(f"Data: {data}")
+        logging.info("Query returned %s rows", len(data))
+        logging.debug("Data: %s", data)
         
         if not data:
             logging.warning("No data found")
@@ -550,8 +560,7 @@ def get_age_distribution(
 
         return data
     except Exception as e:
-        logging.error(f"Error fetching data: {str(e)}")
-        logging.error(traceback.format_exc())
+        logging.exception("Error fetching data")
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -615,8 +624,8 @@ def get_incident_count_per_month(
                 item["quarter"] = row.quarter
             data.append(item)
 
-        logging.info(f"Query returned {len(data)} rows")
-        logging.debug(f"Data: {data}")
+        logging.info("Query returned %s rows", len(data))
+        logging.debug("Data: %s", data)
 
         if not data:
             logging.warning("No data found")
@@ -625,8 +634,7 @@ def get_incident_count_per_month(
         return data
 
     except Exception as e:
-        logging.error(f"Error fetching incident count: {str(e)}")
-        logging.error(traceback.format_exc())
+        logging.exception("Error fetching incident count")
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -727,8 +735,8 @@ def get_safety_manhours_per_month(
                 item["quarter"] = row.quarter
             data.append(item)
 
-        logging.info(f"Query returned {len(data)} rows")
-        logging.debug(f"Data: {data}")
+        logging.info("Query returned %s rows", len(data))
+        logging.debug("Data: %s", data)
 
         if not data:
             logging.warning("No data found")
@@ -737,8 +745,7 @@ def get_safety_manhours_per_month(
         return data
 
     except Exception as e:
-        logging.error(f"Error fetching data: {str(e)}")
-        logging.error(traceback.format_exc())
+        logging.exception("Error fetching data")
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -840,8 +847,8 @@ def get_safety_manpower_per_month(
                 item["quarter"] = row.quarter
             data.append(item)
 
-        logging.info(f"Query returned {len(data)} rows")
-        logging.debug(f"Data: {data}")
+        logging.info("Query returned %s rows", len(data))
+        logging.debug("Data: %s", data)
 
         if not data:
             logging.warning("No data found")
@@ -850,8 +857,7 @@ def get_safety_manpower_per_month(
         return data
 
     except Exception as e:
-        logging.error(f"Error fetching safety manpower: {str(e)}")
-        logging.error(traceback.format_exc())
+        logging.exception("Error fetching safety manpower")
         raise HTTPException(status_code=500, detail=str(e))
 
 # =================EMPLOYABILITY RECORD BY STATUS=================
@@ -862,7 +868,7 @@ def get_employability_records_by_status(
     db: Session = Depends(get_db)
 ):
     try:
-        logging.info(f"Fetching employability records. Filter status_id: {status_id}")
+        logging.info("Fetching employability records. Filter status_id: %s", status_id)
      
         query = text("""
             SELECT demo.*, tenure.*, cm.company_name, csl.status_id, csl.remarks
@@ -886,12 +892,11 @@ def get_employability_records_by_status(
         result = db.execute(query, {"status_id": status_id, "company_id": company_id.split(',') if company_id else None})
         data = [dict(row._mapping) for row in result]
 
-        logging.info(f"Returned {len(data)} records")
+        logging.info("Returned %s records", len(data))
         return data
 
-    except Exception as e:
-        logging.error(f"Error retrieving employability records: {str(e)}")
-        logging.error(traceback.format_exc())
+    except Exception:
+        logging.exception("Error retrieving employability records")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 # =================PARENTAL LEAVE RECORD BY STATUS=================
@@ -902,7 +907,7 @@ def get_parental_leave_records_by_status(
     db: Session = Depends(get_db)
 ):
     try:
-        logging.info(f"Fetching parental leave records. Filter status_id: {status_id}")
+        logging.info("Fetching parental leave records. Filter status_id: %s", status_id)
 
         query = text("""
             SELECT pl.*, demo.company_id, cm.company_name, csl.status_id, csl.remarks
@@ -920,12 +925,11 @@ def get_parental_leave_records_by_status(
         result = db.execute(query, {"status_id": status_id, "company_id": company_id.split(',') if company_id else None})
         data = [dict(row._mapping) for row in result]
 
-        logging.info(f"Returned {len(data)} records")
+        logging.info("Returned %s records", len(data))
         return data
 
-    except Exception as e:
-        logging.error(f"Error retrieving parental leave records: {str(e)}")
-        logging.error(traceback.format_exc())
+    except Exception:
+        logging.exception("Error retrieving parental leave records")
         raise HTTPException(status_code=500, detail="Internal server error")
     
 # =================SAFETY WORKDATA RECORD BY STATUS================= 
@@ -936,7 +940,7 @@ def get_safety_workdata_records_by_status(
     db: Session = Depends(get_db)
 ):
     try:
-        logging.info(f"Fetching safety workdata records. Filter status_id: {status_id}")
+        logging.info("Fetching safety workdata records. Filter status_id: %s", status_id)
 
         query = text("""
             SELECT swd.*, cm.company_name, csl.status_id, csl.remarks
@@ -952,12 +956,11 @@ def get_safety_workdata_records_by_status(
         result = db.execute(query, { "status_id": status_id, "company_id": company_id.split(',') if company_id else None})
         data = [dict(row._mapping) for row in result]
 
-        logging.info(f"Returned {len(data)} records")
+        logging.info("Returned %s records", len(data))
         return data
 
-    except Exception as e:
-        logging.error(f"Error retrieving safety workdata records: {str(e)}")
-        logging.error(traceback.format_exc())
+    except Exception:
+        logging.exception("Error retrieving safety workdata records")
         raise HTTPException(status_code=500, detail="Internal server error")
 # =================OCCUPATIONAL SAFETY HEALTH RECORD BY STATUS================= 
 @router.get("/occupational_safety_health_records_by_status", response_model=List[dict])
@@ -967,7 +970,7 @@ def get_occupational_safety_health_records_by_status(
     db: Session = Depends(get_db)
 ):
     try:
-        logging.info(f"Fetching occupational safety health records. Filter status_id: {status_id}")
+        logging.info("Fetching occupational safety health records. Filter status_id: %s", status_id)
 
         query = text("""
             SELECT osh.*, cm.company_name, csl.status_id, csl.remarks
@@ -983,12 +986,11 @@ def get_occupational_safety_health_records_by_status(
         result = db.execute(query, {"status_id": status_id, "company_id": company_id.split(',') if company_id else None})
         data = [dict(row._mapping) for row in result]
 
-        logging.info(f"Returned {len(data)} records")
+        logging.info("Returned %s records", len(data))
         return data
 
-    except Exception as e:
-        logging.error(f"Error retrieving occupational safety health records: {str(e)}")
-        logging.error(traceback.format_exc())
+    except Exception:
+        logging.exception("Error retrieving occupational safety health records")
         raise HTTPException(status_code=500, detail="Internal server error")
     
 # =================TRAINING RECORD BY STATUS================= 
@@ -999,7 +1001,7 @@ def get_training_records_by_status(
     db: Session = Depends(get_db)
 ):
     try:
-        logging.info(f"Fetching training records Filter status_id: {status_id}")
+        logging.info("Fetching training records Filter status_id: %s", status_id)
 
         query = text("""
             SELECT tr.*, cm.company_name, csl.status_id, csl.remarks
@@ -1015,12 +1017,11 @@ def get_training_records_by_status(
         result = db.execute(query, {"status_id": status_id, "company_id": company_id.split(',') if company_id else None})
         data = [dict(row._mapping) for row in result]
 
-        logging.info(f"Returned {len(data)} records")
+        logging.info("Returned %s records", len(data))
         return data
 
-    except Exception as e:
-        logging.error(f"Error retrieving training records: {str(e)}")
-        logging.error(traceback.format_exc())
+    except Exception:
+        logging.exception("Error retrieving training records")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
@@ -1240,7 +1241,7 @@ def single_upload_training_record(data: dict, db: Session = Depends(get_db), use
     except HTTPException:
         raise
     except Exception as e:
-        logging.error(traceback.format_exc())
+        logging.exception("Error inserting HR training record")
         db.rollback()
         raise HTTPException(status_code=500, detail=str(e))
     
@@ -1304,8 +1305,7 @@ def bulk_upload_employability(file: UploadFile = File(...), db: Session = Depend
     
     try:
         logging.info("Add bulk employability data")
-        contents = file.file.read()
-        df = pd.read_excel(BytesIO(contents))
+        df = pd.read_excel(file.file, engine=EXCEL_ENGINE)
 
         required_columns = {'employee_id', 'gender', 'birthdate', 'position_id', 'p_np', 'company_id', 'employment_status', 'start_date', 'end_date'}
         if not required_columns.issubset(df.columns):
@@ -1428,8 +1428,7 @@ def bulk_upload_safety_workdata(file: UploadFile = File(...), db: Session = Depe
     
     try:
         logging.info("Add bulk safety workdata")
-        contents = file.file.read()
-        df = pd.read_excel(BytesIO(contents))
+        df = pd.read_excel(file.file, engine=EXCEL_ENGINE)
 
         required_columns = {'company_id', 'contractor', 'date', 'manpower', 'manhours'}
         if not required_columns.issubset(df.columns):
@@ -1514,8 +1513,7 @@ def bulk_upload_parental_leave(file: UploadFile = File(...), db: Session = Depen
     
     try:
         logging.info("Add bulk parental leave")
-        contents = file.file.read()
-        df = pd.read_excel(BytesIO(contents))
+        df = pd.read_excel(file.file, engine=EXCEL_ENGINE)
 
         required_columns = {'employee_id', 'type_of_leave', 'date', 'days'}
         if not required_columns.issubset(df.columns):
@@ -1598,8 +1596,7 @@ def bulk_upload_training(file: UploadFile = File(...), db: Session = Depends(get
     
     try:
         logging.info("Add bulk training")
-        contents = file.file.read()
-        df = pd.read_excel(BytesIO(contents))
+        df = pd.read_excel(file.file, engine=EXCEL_ENGINE)
 
         required_columns = {'company_id', 'date', 'training_title', 'training_hours', 'number_of_participants'}
         if not required_columns.issubset(df.columns):
@@ -1697,8 +1694,7 @@ def bulk_upload_occupational_safety_health(file: UploadFile = File(...), db: Ses
     
     try:
         logging.info("Add bulk occupational safety health")
-        contents = file.file.read()
-        df = pd.read_excel(BytesIO(contents))
+        df = pd.read_excel(file.file, engine=EXCEL_ENGINE)
 
         required_columns = {'company_id', 'workforce_type', 'lost_time', 'date', 'incident_type', 'incident_title', 'incident_count'}
         if not required_columns.issubset(df.columns):
@@ -2161,10 +2157,8 @@ async def export_excel(request: Request):
     with pd.ExcelWriter(output, engine="openpyxl") as writer:
         df.to_excel(writer, index=False, sheet_name="Filtered Data")
 
-    output.seek(0)
-
-    return StreamingResponse(
-        output,
+    return Response(
+        content=output.getvalue(),
         media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
         headers={
             "Content-Disposition": "attachment; filename=exported_data.xlsx"
@@ -2179,8 +2173,8 @@ async def download_economic_generated_template():
         filename = 'hr_employability_template.xlsx'
         output = create_excel_template(headers, filename)
         
-        return StreamingResponse(
-            io.BytesIO(output.getvalue()),
+        return Response(
+            content=output,
             media_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
             headers={'Content-Disposition': f'attachment; filename="{filename}"'}
         )
@@ -2194,8 +2188,8 @@ async def download_economic_generated_template():
         filename = 'hr_safety_workdata_template.xlsx'
         output = create_excel_template(headers, filename)
         
-        return StreamingResponse(
-            io.BytesIO(output.getvalue()),
+        return Response(
+            content=output,
             media_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
             headers={'Content-Disposition': f'attachment; filename="{filename}"'}
         )
@@ -2209,8 +2203,8 @@ async def download_economic_generated_template():
         filename = 'hr_parental_leave_template.xlsx'
         output = create_excel_template(headers, filename)
         
-        return StreamingResponse(
-            io.BytesIO(output.getvalue()),
+        return Response(
+            content=output,
             media_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
             headers={'Content-Disposition': f'attachment; filename="{filename}"'}
         )
@@ -2224,8 +2218,8 @@ async def download_economic_generated_template():
         filename = 'hr_training_template.xlsx'
         output = create_excel_template(headers, filename)
         
-        return StreamingResponse(
-            io.BytesIO(output.getvalue()),
+        return Response(
+            content=output,
             media_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
             headers={'Content-Disposition': f'attachment; filename="{filename}"'}
         )
@@ -2239,8 +2233,8 @@ async def download_economic_generated_template():
         filename = 'hr_occupational_safety_health_template.xlsx'
         output = create_excel_template(headers, filename)
         
-        return StreamingResponse(
-            io.BytesIO(output.getvalue()),
+        return Response(
+            content=output,
             media_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
             headers={'Content-Disposition': f'attachment; filename="{filename}"'}
         )
@@ -7,7 +7,6 @@ from typing import Optional, List, Dict
 from ..dependencies import get_db
 
 import logging
-import traceback
 import os
 import time
 from fastapi import Request
@@ -108,9 +107,8 @@ def get_kpi_data(db: Session = Depends(get_db)):
             "siteCheckers": site_checkers,
             "encoders": encoders
         }
-    except Exception as e:
-        logging.error(f"Error fetching KPI data: {str(e)}")
-        logging.error(traceback.format_exc())
+    except Exception:
+        logging.exception("Error fetching KPI data")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @router.get("/companies", response_model=List[Dict])
@@ -137,8 +135,7 @@ def get_companies(db: Session = Depends(get_db)):
         
         return companies
     except Exception as e:
-        logging.error(f"Error fetching companies: {str(e)}")
-        logging.error(traceback.format_exc())
+        logging.exception("Error fetching companies")
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/expenditure-types", response_model=List[Dict])
@@ -165,8 +162,7 @@ def get_expenditure_types(db: Session = Depends(get_db)):
         
         return types
     except Exception as e:
-        logging.error(f"Error fetching expenditure types: {str(e)}")
-        logging.error(traceback.format_exc())
+        logging.exception("Error fetching expenditure types")
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -194,9 +190,8 @@ def get_fact_energy(
         ]
         return types
 
-    except Exception as e:
-        logging.error(f"Error calling powerplant: {str(e)}")
-        logging.error(traceback.format_exc())
+    except Exception:
+        logging.exception("Error calling powerplant")
         raise HTTPException(status_code=500, detail="Internal server error")
     
 
@@ -213,9 +208,8 @@ def get_equivalence(
         data = [dict(row._mapping) for row in result]
         return data
 
-    except Exception as e:
-        logging.error(f"Error calling co2_equivalence: {str(e)}")
-        logging.error(traceback.format_exc())
+    except Exception:
+        logging.exception("Error calling co2_equivalence")
         raise HTTPException(status_code=500, detail="Internal server error")
     
 @router.get("/prov", response_model=List[dict])
@@ -235,9 +229,8 @@ def get_equivalence(
         data = [dict(row._mapping) for row in result]
         return data
 
-    except Exception as e:
-        logging.error(f"Error calling co2_equivalence: {str(e)}")
-        logging.error(traceback.format_exc())
+    except Exception:
+        logging.exception("Error calling co2_equivalence")
         raise HTTPException(status_code=500, detail="Internal server error")
     
 @router.get("/source", response_model=List[dict])
@@ -257,9 +250,8 @@ def get_sources(
         data = [dict(row._mapping) for row in result]
         return data
 
-    except Exception as e:
-        logging.error(f"Error calling powerplant: {str(e)}")
-        logging.error(traceback.format_exc())
+    except Exception:
+        logging.exception("Error calling powerplant")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @router.get("/pp_company", response_model=List[dict])
@@ -280,9 +272,8 @@ def get_sources(
         data = [dict(row._mapping) for row in result]
         return data
 
-    except Exception as e:
-        logging.error(f"Error calling powerplant: {str(e)}")
-        logging.error(traceback.format_exc())
+    except Exception:
+        logging.exception("Error calling powerplant")
         raise HTTPException(status_code=500, detail="Internal server error")
     
 
@@ -310,9 +301,8 @@ def get_sources(
         data = [dict(row._mapping) for row in result]
         return data
 
-    except Exception as e:
-        logging.error(f"Error calling powerplant: {str(e)}")
-        logging.error(traceback.format_exc())
+    except Exception:
+        logging.exception("Error calling powerplant")
         raise HTTPException(status_code=500, detail="Internal server error")
     
 @router.get("/audit-trail", response_model=List[dict])
@@ -336,7 +326,6 @@ def get_audit_trail(db: Session = Depends(get_db)):
         result = db.execute(sql)
         data = [dict(row._mapping) for row in result]
         return data
-    except Exception as e:
-        logging.error(f"Error fetching audit trail: {str(e)}")
-        logging.error(traceback.format_exc())
+    except Exception:
+        logging.exception("Error fetching audit trail")
         raise HTTPException(status_code=500, detail="Internal server error")
\ No newline at end of file
@@ -15,6 +15,7 @@ import traceback
 from ..auth_decorators import get_user_info
 from ..services.audit_trail import append_audit_trail, append_bulk_audit_trail
 from ..services.auth import User
+from .csr import activities_cache as csr_activities_cache
 
 router = APIRouter()
 
@@ -56,6 +57,7 @@ async def update_status(
 
         result = db.execute(update_stmt)
         db.commit()
+        csr_activities_cache.clear()
 
         # Create audit trail with old and new values
         old_value = f"status: {old_status}, remarks: {old_remarks}"
@@ -118,6 +120,7 @@ async def bulk_update_status(
 
         result = db.execute(update_stmt)
         db.commit()
+        csr_activities_cache.clear()
 
         # Get the actual number of rows affected
         rows_affected = result.rowcount
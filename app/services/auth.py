@@ -7,15 +7,22 @@ from pydantic import BaseModel
 from passlib.context import CryptContext
 import time
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 # Configuration
 import os
 from dotenv import load_dotenv
 
+from app.utils.ttl_cache import TTLCache
+
 load_dotenv()
 
+# Password hashing context, shared by every module that hashes or verifies passwords.
+# BCRYPT_ROUNDS can be lowered (e.g. 4) for local development and CI.
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=int(os.getenv("BCRYPT_ROUNDS", "12")),
+)
+
 SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key-here-change-in-production")
 ALGORITHM = os.getenv("ALGORITHM", "HS256")
 ACCESS_TOKEN_EXPIRE_HOURS = 24  # Absolute expiration time in hours
@@ -27,6 +34,13 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/token")
 # In-memory session store (replace with Redis in production)
 active_sessions = {}
 
+# Short-lived cache of email -> resolved user, so authenticated requests don't
+# re-query the account row every time. Writes to an account (status, role) must
+# call AuthService.invalidate_cached_user so the change applies on the next request.
+USER_CACHE_TTL_SECONDS = int(os.getenv("USER_CACHE_TTL_SECONDS", "60"))
+USER_CACHE_MAX_ENTRIES = 10_000
+_user_cache = TTLCache(ttl=USER_CACHE_TTL_SECONDS, maxsize=USER_CACHE_MAX_ENTRIES)
+
 # Models
 class Token(BaseModel):
     access_token: str
@@ -244,15 +258,25 @@ class AuthService:
     @staticmethod
     def get_current_user(token: str, db: Session) -> User:
         """Get the current user from a JWT token."""
+        # Always verify: this checks expiry and inactivity and refreshes the session
         token_data = AuthService.verify_token(token)
-        user = AuthService.get_user(email=token_data.username, db=db)
-        if user is None:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Could not validate credentials",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-        return User(**user.dict())
+
+        def load_user() -> User:
+            user = AuthService.get_user(email=token_data.username, db=db)
+            if user is None:
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="Could not validate credentials",
+                    headers={"WWW-Authenticate": "Bearer"},
+                )
+            return User(**user.dict())
+
+        return _user_cache.get_or_set(token_data.username, load_user)
+
+    @staticmethod
+    def invalidate_cached_user(email: str) -> None:
+        """Drop the cached user for an email, e.g. on logout or an account status change."""
+        _user_cache.pop(email)
     
     @staticmethod
     def get_current_active_user(user: User) -> User:
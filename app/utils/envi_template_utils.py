@@ -1,7 +1,36 @@
-import pandas as pd
 import io
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font
+from openpyxl.utils import get_column_letter
 from ..template.envi_template_config import TEMPLATE_DEFINITIONS
 
+# Bold header row, as pandas.to_excel used to write it
+_HEADER_FONT = Font(bold=True)
+
+
+def _append_header(ws, headers):
+    """Append headers as a bold first row."""
+    header_cells = []
+    for header in headers:
+        cell = WriteOnlyCell(ws, value=header)
+        cell.font = _HEADER_FONT
+        header_cells.append(cell)
+    ws.append(header_cells)
+
+
+def _add_template_sheet(wb, template, include_examples: bool) -> None:
+    # Write-only sheets stream rows as they are appended, so column widths have
+    # to be set before the first row
+    ws = wb.create_sheet(title=template["sheet_name"])
+    for col in range(1, len(template["headers"]) + 1):
+        ws.column_dimensions[get_column_letter(col)].width = 20
+
+    _append_header(ws, template["headers"])
+    # Add example row if requested
+    if include_examples:
+        ws.append([example for _, example in zip(template["headers"], template["examples"])])
+
 
 def create_excel_template(table_type: str, include_examples: bool = True) -> io.BytesIO:
     """Create Excel template for a specific table type"""
@@ -10,93 +39,41 @@ def create_excel_template(table_type: str, include_examples: bool = True) -> io.
     
     template = TEMPLATE_DEFINITIONS[table_type]
     
-    # Create Excel writer object
-    output = io.BytesIO()
-    
-    with pd.ExcelWriter(output, engine='openpyxl') as writer:
-        # Create main data sheet
-        df_data = pd.DataFrame(columns=template["headers"])
-        
-        # Add example row if requested
-        if include_examples:
-            example_row = {header: example for header, example in zip(template["headers"], template["examples"])}
-            df_data = pd.concat([df_data, pd.DataFrame([example_row])], ignore_index=True)
-        
-        df_data.to_excel(writer, sheet_name=template["sheet_name"], index=False)
-        
-        """
-        # Create instructions sheet
-        instructions_data = {
-            "Column": template["headers"],
-            "Data Type": template["data_types"],
-            "Description": template["descriptions"],
-            "Example": template["examples"]
-        }
-
-        df_instructions = pd.DataFrame(instructions_data)
-        df_instructions.to_excel(writer, sheet_name="Instructions", index=False)
-        """
-        # Format the sheets
-        workbook = writer.book
-        
-        # Format main sheet
-        main_sheet = writer.sheets[template["sheet_name"]]
-        for col in range(len(template["headers"])):
-            main_sheet.column_dimensions[chr(65 + col)].width = 20
-        
-        """
-        # Format instructions sheet
-        instructions_sheet = writer.sheets["Instructions"]
-        for col in range(4):  # 4 columns in instructions
-            instructions_sheet.column_dimensions[chr(65 + col)].width = 25
-        """
+    wb = Workbook(write_only=True)
+    _add_template_sheet(wb, template, include_examples)
     
+    output = io.BytesIO()
+    wb.save(output)
     output.seek(0)
     return output
 
 
 def create_all_templates() -> io.BytesIO:
     """Create a single Excel file with all templates as separate sheets"""
-    output = io.BytesIO()
+    wb = Workbook(write_only=True)
+    overview_rows = []
     
-    with pd.ExcelWriter(output, engine='openpyxl') as writer:
-        # Create overview sheet
-        overview_data = {
-            "Sheet Name": [],
-            "Table Name": [],
-            "Description": [],
-            "Record Count Columns": []
-        }
-        
-        for table_type, template in TEMPLATE_DEFINITIONS.items():
-            overview_data["Sheet Name"].append(template["sheet_name"])
-            overview_data["Table Name"].append(f"bronze.envi_{table_type}")
-            overview_data["Description"].append(f"Template for {table_type.replace('_', ' ').title()}")
-            overview_data["Record Count Columns"].append(len(template["headers"]))
-            
-            # Create individual template sheet
-            df_data = pd.DataFrame(columns=template["headers"])
-            
-            # Add example row
-            example_row = {header: example for header, example in zip(template["headers"], template["examples"])}
-            df_data = pd.concat([df_data, pd.DataFrame([example_row])], ignore_index=True)
-            
-            df_data.to_excel(writer, sheet_name=template["sheet_name"], index=False)
-            
-            # Format sheet
-            sheet = writer.sheets[template["sheet_name"]]
-            for col in range(len(template["headers"])):
-                sheet.column_dimensions[chr(65 + col)].width = 20
-        
-        # Add overview sheet
-        df_overview = pd.DataFrame(overview_data)
-        df_overview.to_excel(writer, sheet_name="Overview", index=False)
+    for table_type, template in TEMPLATE_DEFINITIONS.items():
+        overview_rows.append([
+            template["sheet_name"],
+            f"bronze.envi_{table_type}",
+            f"Template for {table_type.replace('_', ' ').title()}",
+            len(template["headers"]),
+        ])
         
-        # Format overview sheet
-        overview_sheet = writer.sheets["Overview"]
-        for col in range(4):
-            overview_sheet.column_dimensions[chr(65 + col)].width = 25
+        # Create individual template sheet with its example row
+        _add_template_sheet(wb, template, include_examples=True)
     
+    # Add overview sheet
+    overview_sheet = wb.create_sheet(title="Overview")
+    for col in range(1, 5):
+        overview_sheet.column_dimensions[get_column_letter(col)].width = 25
+    _append_header(overview_sheet, ["Sheet Name", "Table Name", "Description", "Record Count Columns"])
+    for row in overview_rows:
+        overview_sheet.append(row)
+    
+    output = io.BytesIO()
+    wb.save(output)
     output.seek(0)
     return output
 
@@ -0,0 +1,56 @@
+from collections import defaultdict
+
+import pandas as pd
+
+# python-calamine is optional; when installed, pandas parses uploaded workbooks
+# with its Rust reader instead of building an openpyxl DOM for the whole file
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_ENGINE = "calamine"
+except ImportError:
+    EXCEL_ENGINE = None
+
+
+def stripped_text_cells(series):
+    """Stripped string cells of a column; non-string cells become ''."""
+    if not (pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series)):
+        return pd.Series("", index=series.index)
+    return series.str.strip().fillna("")
+
+
+def numeric_cells(series):
+    """Numeric cells of a column as floats; text, blanks and other values become NaN."""
+    # A numeric column dtype already guarantees every cell is a number (or NaN),
+    # so the per-cell type check is only needed for mixed object columns
+    if pd.api.types.is_numeric_dtype(series):
+        return series.astype(float)
+    is_number = series.map(lambda value: isinstance(value, (int, float)))
+    return pd.to_numeric(series.where(is_number), errors="coerce")
+
+
+def integer_cells(series):
+    """Whole-number cells of a column as floats; floats, text and blanks become NaN."""
+    if pd.api.types.is_integer_dtype(series) or pd.api.types.is_bool_dtype(series):
+        return series.astype(float)
+    if not pd.api.types.is_object_dtype(series):
+        return pd.Series(float("nan"), index=series.index)
+    is_int = series.map(lambda value: isinstance(value, int))
+    return pd.to_numeric(series.where(is_int), errors="coerce")
+
+
+def first_row_errors(index, checks, first_row: int = 2):
+    """
+    Apply (mask, message) checks in order and return "Row N: ..." errors, keeping
+    only the first failing check per row. Also returns the mask of failed rows.
+    A check given as (mask, message, False) is reported without stopping later
+    checks for that row. first_row is the row number reported for index 0.
+    """
+    failed = pd.Series(False, index=index)
+    errors = defaultdict(list)
+    for mask, message, *stop in checks:
+        new_failures = mask & ~failed
+        for i in index[new_failures]:
+            errors[i].append(message(i))
+        if not stop or stop[0]:
+            failed |= new_failures
+    return [f"Row {i + first_row}: {error}" for i in sorted(errors) for error in errors[i]], failed
@@ -0,0 +1,43 @@
+import os
+import time
+from base64 import b32encode
+
+# RFC 4648 base32 alphabet -> Crockford base32 alphabet used by ULIDs
+_CROCKFORD = bytes.maketrans(
+    b"ABCDEFGHIJKLMNOPQRSTUVWXYZ234567",
+    b"0123456789ABCDEFGHJKMNPQRSTVWXYZ",
+)
+
+
+def _encode(value: int) -> str:
+    # Left-pad the 128-bit value to 160 bits so base32 groups line up with the
+    # ULID's 26 trailing characters; the first 6 characters are always zero.
+    return b32encode(value.to_bytes(20, "big"))[6:].translate(_CROCKFORD).decode()
+
+
+def encode_ulid(timestamp_ms: int, randomness: bytes) -> str:
+    """
+    Encode a 48-bit millisecond timestamp and 80 bits of randomness as a
+    26 character ULID string.
+    """
+    return _encode((timestamp_ms << 80) | int.from_bytes(randomness, "big"))
+
+
+def generate_ulid() -> str:
+    """Generate a new ULID using the stdlib C base32 encoder."""
+    return encode_ulid(time.time_ns() // 1_000_000, os.urandom(10))
+
+
+def generate_ulids(count: int) -> list[str]:
+    """
+    Generate count ULIDs for a batch insert from a single urandom read.
+    All share one timestamp and the random parts are sorted, so the batch is
+    strictly increasing (index-friendly) without being sequential or guessable.
+    """
+    timestamp = (time.time_ns() // 1_000_000) << 80
+    buffer = os.urandom(10 * count)
+    randomness = sorted(
+        int.from_bytes(buffer[offset:offset + 10], "big")
+        for offset in range(0, 10 * count, 10)
+    )
+    return [_encode(timestamp | value) for value in randomness]
@@ -0,0 +1,47 @@
+from decimal import Decimal
+from typing import Any, Iterable, Iterator
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+def _orjson_default(obj: Any):
+    """Fallback for types orjson does not serialize natively."""
+    if isinstance(obj, Decimal):
+        # NUMERIC columns come back from psycopg2 as Decimal
+        return float(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def iter_json_array(batches: Iterable[list]) -> Iterator[bytes]:
+    """
+    Encode batches of rows as a single JSON array, one batch at a time.
+    Meant as a StreamingResponse body so large listings never exist as one string.
+    """
+    yield b"["
+    first = True
+    for batch in batches:
+        if not batch:
+            continue
+        # Drop the batch's own brackets and join batches with a comma
+        body = orjson.dumps(batch, default=_orjson_default, option=ORJSON_OPTIONS)[1:-1]
+        yield body if first else b"," + body
+        first = False
+    yield b"]"
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+    Handles datetime/date/UUID/numpy natively and Decimal via _orjson_default.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_orjson_default,
+            option=ORJSON_OPTIONS,
+        )
@@ -0,0 +1,30 @@
+import csv
+from io import StringIO
+
+from sqlalchemy.orm import Session
+
+# Uploads larger than this are loaded with COPY instead of batched INSERTs
+COPY_THRESHOLD = 10_000
+
+
+def copy_rows(db: Session, table, rows: list) -> None:
+    """
+    Stream rows into table with COPY FROM STDIN on the session's connection,
+    so the load is part of the current transaction.
+    """
+    columns = list(rows[0])
+    buffer = StringIO()
+    # QUOTE_NOTNULL writes None as an unquoted empty field, which COPY reads as NULL,
+    # while empty strings stay quoted and load as ''
+    writer = csv.writer(buffer, quoting=csv.QUOTE_NOTNULL)
+    writer.writerows([row[column] for column in columns] for row in rows)
+    buffer.seek(0)
+
+    cursor = db.connection().connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY {table.fullname} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)",
+            buffer,
+        )
+    finally:
+        cursor.close()
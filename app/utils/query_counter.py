@@ -0,0 +1,37 @@
+"""
+Development helper for spotting hidden lazy loads and other N+1 query patterns.
+
+When SQL_DEBUG_QUERY_COUNT is enabled, every statement executed on the engine
+is recorded by the innermost active count_queries() block:
+
+    with count_queries() as statements:
+        get_all_accounts(db=db)
+    assert len(statements) <= 2
+"""
+import contextvars
+from contextlib import contextmanager
+from sqlalchemy import event
+
+_statements = contextvars.ContextVar("query_counter_statements", default=None)
+
+
+def _record_statement(conn, cursor, statement, parameters, context, executemany):
+    statements = _statements.get()
+    if statements is not None:
+        statements.append(statement)
+
+
+def install(engine) -> None:
+    """Start recording statements executed on engine."""
+    event.listen(engine, "before_cursor_execute", _record_statement)
+
+
+@contextmanager
+def count_queries():
+    """Collect the SQL statements executed inside the block into a list."""
+    statements = []
+    token = _statements.set(statements)
+    try:
+        yield statements
+    finally:
+        _statements.reset(token)
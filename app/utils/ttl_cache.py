@@ -0,0 +1,47 @@
+import threading
+import time
+from typing import Any, Callable, Hashable
+
+
+class TTLCache:
+    """
+    Small thread-safe in-process cache whose entries expire after ttl seconds.
+    Used for slowly-changing reference data that is read on every dashboard load.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries = {}  # key -> (value, expires_at)
+        self._generation = 0  # bumped by clear()/pop(); a load that straddles it is not stored
+        self._lock = threading.Lock()
+
+    def get_or_set(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """Return the cached value for key, calling loader() to fill it when missing or expired."""
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry and entry[1] > now:
+            return entry[0]
+
+        generation = self._generation
+        value = loader()
+        with self._lock:
+            if generation != self._generation:
+                # Cleared while loading: the value may predate the write that cleared it
+                return value
+            if key not in self._entries and len(self._entries) >= self.maxsize:
+                # Evict the oldest entry; dicts keep insertion order
+                self._entries.pop(next(iter(self._entries)))
+            self._entries[key] = (value, now + self.ttl)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def pop(self, key: Hashable) -> None:
+        """Drop one entry, e.g. after the row it was loaded from changed."""
+        with self._lock:
+            self._generation += 1
+            self._entries.pop(key, None)